@@ -18,9 +18,9 @@ except ImportError:
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 sys.path.append(os.path.join(os.path.dirname(__file__), 'data'))
 
-from data_loader import DataLoader
-from nlp_processor import NLPProcessor
-from mock_job_data import MockJobData
+from data_loader import build_skills_table, count_skills
+from resource_registry import get_nlp_processor
+from dataset_service import get_job_postings
 try:
     from auth_manager import AuthManager
 except ImportError:
@@ -156,10 +156,8 @@ def show_signup_form():
 check_authentication()
 
 # Initialize session state
-if 'data_loader' not in st.session_state:
-    st.session_state.data_loader = DataLoader()
 if 'nlp_processor' not in st.session_state:
-    st.session_state.nlp_processor = NLPProcessor()
+    st.session_state.nlp_processor = get_nlp_processor()
 if 'api_integrator' not in st.session_state:
     st.session_state.api_integrator = JobAPIIntegrator()
 if 'salary_predictor' not in st.session_state:
@@ -188,8 +186,7 @@ def main():
     st.markdown("### Discover trending skills and optimize your career path")
     
     # Load both mock and real data
-    mock_data = MockJobData()
-    mock_job_data = mock_data.get_job_postings()
+    mock_job_data = get_job_postings()
     
     # Try to get live data
     api_integrator = st.session_state.api_integrator
@@ -224,6 +221,9 @@ def main():
             st.sidebar.info("📊 Using comprehensive mock data")
             job_data = mock_job_data
     
+    # One row per (posting_id, skill), shared by the skill sections below
+    skills_table = build_skills_table(job_data)
+    
     # Main dashboard overview
     col1, col2, col3, col4 = st.columns(4)
     
@@ -231,10 +231,7 @@ def main():
         st.metric("Total Job Postings", f"{len(job_data):,}")
     
     with col2:
-        unique_skills = set()
-        for skills in job_data['required_skills']:
-            unique_skills.update(skills)
-        st.metric("Unique Skills Tracked", len(unique_skills))
+        st.metric("Unique Skills Tracked", skills_table['skill'].nunique())
     
     with col3:
         st.metric("Industries Covered", job_data['industry'].nunique())
@@ -277,12 +274,8 @@ def main():
     # Top trending skills
     st.subheader("🔥 Trending Skills Across All Industries")
     
-    # Extract and count all skills
-    all_skills = []
-    for skills in job_data['required_skills']:
-        all_skills.extend(skills)
-    
-    skill_counts = pd.Series(all_skills).value_counts().head(20)
+    # Count all skills
+    skill_counts = count_skills(skills_table).head(20)
     
     col1, col2 = st.columns([2, 1])
     
@@ -1,14 +1,18 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import date, datetime
+import gc
 import random
 
 class MockJobData:
     """Generate realistic mock job posting data"""
     
-    def __init__(self):
-        np.random.seed(42)
-        random.seed(42)
+    def __init__(self, seed=42):
+        # Postings are drawn from a generator seeded with self.seed; the global
+        # generators are still seeded for callers relying on them
+        self.seed = seed
+        np.random.seed(seed)
+        random.seed(seed)
         
         # Define realistic company and industry data
         self.companies_by_industry = {
@@ -156,79 +160,256 @@ class MockJobData:
             "Atlanta, GA": 0.85,
             "Remote": 1.0
         }
+        
+        # Skills added by industry and by experience level
+        self.industry_skills = {
+            "Technology": ["Agile", "Git", "Linux", "CI/CD", "Cloud Platforms"],
+            "Finance": ["Excel", "Bloomberg", "Financial Analysis", "Risk Management", "Regulatory Knowledge"],
+            "Healthcare": ["Healthcare Compliance", "HIPAA", "Clinical Knowledge", "Regulatory Affairs", "Medical Terminology"],
+            "Marketing": ["Google Analytics", "Marketing Automation", "Brand Management", "Campaign Management", "Customer Insights"]
+        }
+        
+        self.experience_skills = {
+            "Entry Level": ["Communication", "Time Management", "Attention to Detail"],
+            "Mid Level": ["Project Management", "Team Collaboration", "Problem Solving"],
+            "Senior Level": ["Leadership", "Strategic Planning", "Mentoring", "Decision Making"],
+            "Executive Level": ["Executive Leadership", "Business Strategy", "Stakeholder Management", "Change Management"]
+        }
+        
+        # Technical skills sampled for each industry
+        self.tech_pools = {
+            "Technology": ["Docker", "Kubernetes", "AWS", "Python", "JavaScript", "SQL", "React", "Node.js", "Machine Learning", "Data Analysis"],
+            "Finance": ["Python", "R", "SQL", "VBA", "MATLAB", "Tableau", "Power BI", "SAS", "Statistical Analysis", "Data Modeling"],
+            "Healthcare": ["SAS", "R", "SQL", "Python", "Clinical Data Management", "Statistical Software", "Electronic Health Records", "Data Analysis"],
+            "Marketing": ["Google Analytics", "SQL", "Python", "Tableau", "Adobe Creative Suite", "Marketing Automation Tools", "CRM Software", "Social Media Platforms"]
+        }
+        
+        self.possible_benefits = [
+            "Health Insurance", "Dental Insurance", "Vision Insurance",
+            "401(k) Matching", "Flexible PTO", "Remote Work Options",
+            "Professional Development Budget", "Stock Options",
+            "Life Insurance", "Disability Insurance", "Wellness Programs",
+            "Flexible Hours", "Parental Leave", "Tuition Reimbursement",
+            "Free Meals", "Gym Membership", "Transit Benefits"
+        ]
+        
+        # Experience level distribution by title keywords
+        self.experience_levels = ["Entry Level", "Mid Level", "Senior Level", "Executive Level"]
+        self.experience_weights_by_title = [
+            (['senior', 'sr.', 'lead', 'principal', 'staff'], [0.0, 0.3, 0.6, 0.1]),
+            (['manager', 'director', 'vp', 'vice president'], [0.0, 0.0, 0.4, 0.6]),
+            (['junior', 'associate', 'coordinator'], [0.7, 0.3, 0.0, 0.0]),
+            ([], [0.3, 0.5, 0.2, 0.0])
+        ]
+        
+        self.company_sizes = ["Startup (1-50)", "Small (51-200)", "Medium (201-1000)", "Large (1001-5000)", "Enterprise (5000+)"]
+        self.employment_types = ["Full-time", "Contract", "Part-time"]
+        self.employment_type_weights = [0.85, 0.12, 0.03]
+        
+        self._tables = None
     
-    def get_job_postings(self, num_jobs=1500):
-        """Generate comprehensive mock job posting data"""
-        job_postings = []
+    def get_job_postings(self, num_jobs=1500, seed=None, chunk_size=200000):
+        """Generate comprehensive mock job posting data
+        
+        Every column is drawn as a NumPy array from a generator seeded with
+        seed (the instance seed by default), so the same seed always gives the
+        same postings on a given day: posting dates count back from midnight
+        today, not the current instant. Rows are generated in chunks to bound
+        memory.
+        """
+        rng = np.random.default_rng(self.seed if seed is None else seed)
+        tables = self._get_generator_tables()
+        now = datetime.combine(date.today(), datetime.min.time())
+        
+        chunks = [
+            self._generate_postings(rng, tables, start, min(chunk_size, num_jobs - start), now)
+            for start in range(0, num_jobs, chunk_size)
+        ]
+        if not chunks:
+            return self._generate_postings(rng, tables, 0, 0, now)
         
-        for i in range(num_jobs):
-            # Select industry
-            industry = random.choice(list(self.companies_by_industry.keys()))
-            
-            # Select company from industry
-            company = random.choice(self.companies_by_industry[industry])
-            
-            # Select role from industry
-            job_title = random.choice(self.job_roles_by_industry[industry])
-            
-            # Determine experience level based on title
-            if any(keyword in job_title.lower() for keyword in ['senior', 'sr.', 'lead', 'principal', 'staff']):
-                experience_level = random.choices(
-                    ["Mid Level", "Senior Level", "Executive Level"],
-                    weights=[0.3, 0.6, 0.1]
-                )[0]
-            elif any(keyword in job_title.lower() for keyword in ['manager', 'director', 'vp', 'vice president']):
-                experience_level = random.choices(
-                    ["Senior Level", "Executive Level"],
-                    weights=[0.4, 0.6]
-                )[0]
-            elif any(keyword in job_title.lower() for keyword in ['junior', 'associate', 'coordinator']):
-                experience_level = random.choices(
-                    ["Entry Level", "Mid Level"],
-                    weights=[0.7, 0.3]
-                )[0]
-            else:
-                experience_level = random.choices(
-                    ["Entry Level", "Mid Level", "Senior Level"],
-                    weights=[0.3, 0.5, 0.2]
-                )[0]
-            
-            # Get location and salary
-            location, location_multiplier = random.choice(list(self.locations_with_multipliers.items()))
-            
-            # Calculate salary based on role, experience, and location
-            salary_min, salary_max = self._calculate_salary(job_title, experience_level, location_multiplier)
-            
-            # Get skills for role
-            required_skills = self._get_skills_for_role(job_title, industry, experience_level)
-            
-            # Generate posting date (within last 90 days)
-            posted_date = datetime.now() - timedelta(days=random.randint(1, 90))
-            
-            job_posting = {
-                'id': i + 1,
-                'title': job_title,
-                'company': company,
-                'industry': industry,
-                'location': location,
-                'salary_min': salary_min,
-                'salary_max': salary_max,
-                'experience_level': experience_level,
-                'required_skills': required_skills,
-                'posted_date': posted_date,
-                'description': self._generate_job_description(job_title, company, industry, required_skills),
-                'benefits': self._generate_benefits(),
-                'remote_option': random.choice([True, False]) if location != "Remote" else True,
-                'company_size': random.choice(["Startup (1-50)", "Small (51-200)", "Medium (201-1000)", "Large (1001-5000)", "Enterprise (5000+)"]),
-                'employment_type': random.choices(["Full-time", "Contract", "Part-time"], weights=[0.85, 0.12, 0.03])[0]
-            }
-            
-            job_postings.append(job_posting)
+        return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+    
+    def _get_generator_tables(self):
+        """Array lookup tables for the vectorized generator, built once per instance"""
+        if self._tables is not None:
+            return self._tables
+        
+        industries = list(self.companies_by_industry.keys())
+        
+        def flatten(groups):
+            # Values of every industry in one array, with per-industry offsets and counts
+            counts = np.array([len(groups[industry]) for industry in industries])
+            offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+            values = np.array([value for industry in industries for value in groups[industry]], dtype=object)
+            return values, offsets, counts
+        
+        companies, company_offsets, company_counts = flatten(self.companies_by_industry)
+        titles, title_offsets, title_counts = flatten(self.job_roles_by_industry)
+        
+        # Experience distribution of each title, from the first matching keyword group
+        title_weights = np.array([
+            next(weights for keywords, weights in self.experience_weights_by_title
+                 if not keywords or any(keyword in title.lower() for keyword in keywords))
+            for title in titles
+        ])
+        
+        # Base salary range for every (title, experience level)
+        base_salaries = np.array([
+            [self._base_salary_range(title, level) for level in self.experience_levels]
+            for title in titles
+        ], dtype=np.float64)
+        
+        # Skill vocabulary and padded id tables (-1 marks an empty slot)
+        skill_ids = {}
+        def ids(skills, width):
+            row = [skill_ids.setdefault(skill, len(skill_ids)) for skill in skills]
+            return row + [-1] * (width - len(row))
+        
+        role_skills = [self.skills_by_role.get(title, []) for title in titles]
+        role_width = max(len(skills) for skills in role_skills)
+        industry_width = max(len(skills) for skills in self.industry_skills.values())
+        experience_width = max(len(skills) for skills in self.experience_skills.values())
+        pool_width = max(len(skills) for skills in self.tech_pools.values())
+        
+        tables = {
+            'industries': np.array(industries, dtype=object),
+            'companies': companies,
+            'company_offsets': company_offsets,
+            'company_counts': company_counts,
+            'titles': titles,
+            'title_offsets': title_offsets,
+            'title_counts': title_counts,
+            'title_weights': title_weights,
+            'base_salaries': base_salaries,
+            'locations': np.array(list(self.locations_with_multipliers.keys()), dtype=object),
+            'location_multipliers': np.array(list(self.locations_with_multipliers.values())),
+            'role_skill_ids': np.array([ids(skills, role_width) for skills in role_skills]),
+            'industry_skill_ids': np.array([ids(self.industry_skills.get(industry, []), industry_width) for industry in industries]),
+            'experience_skill_ids': np.array([ids(self.experience_skills.get(level, []), experience_width) for level in self.experience_levels]),
+            'pool_skill_ids': np.array([ids(self.tech_pools.get(industry, []), pool_width) for industry in industries]),
+            'benefits': np.array(self.possible_benefits, dtype=object)
+        }
+        tables['skills'] = np.array(list(skill_ids), dtype=object)
         
-        return pd.DataFrame(job_postings)
+        self._tables = tables
+        return tables
+    
+    def _generate_postings(self, rng, tables, start, n, now):
+        """Generate n postings with ids from start + 1, one column at a time"""
+        industry = rng.integers(0, len(tables['industries']), n)
+        company = tables['company_offsets'][industry] + rng.integers(0, tables['company_counts'][industry])
+        title = tables['title_offsets'][industry] + rng.integers(0, tables['title_counts'][industry])
+        
+        # Experience level drawn from each title's keyword-based distribution
+        weights = tables['title_weights'][title]
+        cumulative = np.cumsum(weights, axis=1)
+        cumulative[:, -1] = np.inf  # Guard against rounding in the last bucket
+        draws = rng.random(n)[:, None] * weights.sum(axis=1, keepdims=True)
+        level = (draws >= cumulative).sum(axis=1)
+        
+        # Location-adjusted salary with the same jitter, ordering fix and floor as before
+        location = rng.integers(0, len(tables['locations']), n)
+        multiplier = tables['location_multipliers'][location]
+        base = tables['base_salaries'][title, level]
+        salary_min = (base[:, 0] * multiplier).astype(np.int64) + rng.integers(-5000, 5001, n)
+        salary_max = (base[:, 1] * multiplier).astype(np.int64) + rng.integers(-5000, 10001, n)
+        salary_max = np.where(salary_min >= salary_max, salary_min + 20000, salary_max)
+        salary_min = np.maximum(salary_min, 40000)
+        
+        skill_slots = self._draw_skills(rng, tables, title, industry, level)
+        present = skill_slots >= 0
+        required_skills = self._split_rows(tables['skills'][skill_slots[present]], present.sum(axis=1))
+        
+        posted_days = rng.integers(1, 91, n)
+        
+        # Benefits: the first 5-10 entries of a random permutation per posting
+        benefit_counts = rng.integers(5, 11, n)
+        benefit_order = np.argsort(rng.random((n, len(tables['benefits']))), axis=1)
+        taken = np.arange(len(tables['benefits']))[None, :] < benefit_counts[:, None]
+        benefits = self._split_rows(tables['benefits'][benefit_order[taken]], benefit_counts)
+        
+        return pd.DataFrame({
+            'id': np.arange(start + 1, start + n + 1),
+            'title': self._labels(tables['titles'], title),
+            'company': self._labels(tables['companies'], company),
+            'industry': self._labels(tables['industries'], industry),
+            'location': self._labels(tables['locations'], location),
+            'salary_min': salary_min,
+            'salary_max': salary_max,
+            'experience_level': self._labels(self.experience_levels, level),
+            'required_skills': required_skills,
+            'posted_date': now - pd.to_timedelta(posted_days, unit='D'),
+            'description': self._generate_descriptions(tables, title, company, skill_slots),
+            'benefits': benefits,
+            'remote_option': (tables['locations'][location] == "Remote") | (rng.random(n) < 0.5),
+            'company_size': self._labels(self.company_sizes, rng.integers(0, len(self.company_sizes), n)),
+            'employment_type': self._labels(
+                self.employment_types, rng.choice(len(self.employment_types), size=n, p=self.employment_type_weights)
+            )
+        })
+    
+    def _draw_skills(self, rng, tables, title, industry, level):
+        """Draw each posting's skills from its role, industry and experience level
+
+        Returns a padded table of skill ids, one row per posting, with the
+        posting's skills first in random order and -1 after them.
+        """
+        n = len(title)
+        
+        # Industry skills are added with 50% chance each, experience skills with 70%
+        industry_skills = tables['industry_skill_ids'][industry]
+        industry_skills = np.where(rng.random(industry_skills.shape) < 0.5, industry_skills, -1)
+        experience_skills = tables['experience_skill_ids'][level]
+        experience_skills = np.where(rng.random(experience_skills.shape) < 0.7, experience_skills, -1)
+        
+        # 1-3 distinct skills sampled from the industry's technical pool
+        pool = tables['pool_skill_ids'][industry]
+        pool_keys = np.where(pool >= 0, rng.random(pool.shape), 2.0)
+        picked = np.take_along_axis(pool, np.argsort(pool_keys, axis=1)[:, :3], axis=1)
+        picked[np.arange(3)[None, :] >= rng.integers(1, 4, n)[:, None]] = -1
+        
+        slots = np.concatenate([tables['role_skill_ids'][title], industry_skills, experience_skills, picked], axis=1)
+        
+        # Drop duplicate skills, then shuffle each posting's skills into random order
+        slots.sort(axis=1)
+        slots[:, 1:][slots[:, 1:] == slots[:, :-1]] = -1
+        order_keys = np.where(slots >= 0, rng.random(slots.shape), 2.0)
+        return np.take_along_axis(slots, np.argsort(order_keys, axis=1), axis=1)
+    
+    @staticmethod
+    def _split_rows(values, counts):
+        """Split a flat array into one list per row of the given lengths
+        
+        Rows of each length are gathered into a 2-D block and converted with
+        one tolist call, then put back in row order. The lists hold only
+        strings and cannot form cycles, so the garbage collector is paused
+        rather than left to traverse every list created so far.
+        """
+        starts = np.cumsum(counts) - counts
+        blocks, members = [], []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for length in np.unique(counts).tolist():
+                rows = np.flatnonzero(counts == length)
+                blocks.extend(values[starts[rows, None] + np.arange(length)].tolist())
+                members.append(rows)
+            
+            position = np.empty(len(counts), dtype=np.intp)
+            position[np.concatenate(members or [np.empty(0, dtype=np.intp)])] = np.arange(len(counts))
+            return [blocks[i] for i in position.tolist()]
+        finally:
+            if gc_enabled:
+                gc.enable()
+    
+    @staticmethod
+    def _labels(values, index):
+        """values[index] as a pandas array, converting each distinct string once"""
+        return pd.Series(values, dtype=str).array.take(index)
     
-    def _calculate_salary(self, job_title, experience_level, location_multiplier):
-        """Calculate salary based on role, experience, and location"""
+    def _base_salary_range(self, job_title, experience_level):
+        """Base salary range for a role and experience level, before location and jitter"""
         # Map experience levels to salary keys
         exp_mapping = {
             "Entry Level": "entry",
@@ -243,93 +424,65 @@ class MockJobData:
         if job_title in self.salary_ranges:
             role_salaries = self.salary_ranges[job_title]
             if exp_key in role_salaries:
-                base_min, base_max = role_salaries[exp_key]
-            else:
-                # Fallback to available experience level
-                available_exp = list(role_salaries.keys())
-                fallback_key = available_exp[0] if available_exp else "mid"
-                base_min, base_max = role_salaries.get(fallback_key, (70000, 120000))
-        else:
-            # Default salary ranges by experience level
-            default_ranges = {
-                "entry": (60000, 90000),
-                "mid": (80000, 130000),
-                "senior": (110000, 180000),
-                "executive": (150000, 300000)
-            }
-            base_min, base_max = default_ranges.get(exp_key, (70000, 120000))
-        
-        # Apply location multiplier
-        salary_min = int(base_min * location_multiplier)
-        salary_max = int(base_max * location_multiplier)
-        
-        # Add some randomization
-        salary_min += random.randint(-5000, 5000)
-        salary_max += random.randint(-5000, 10000)
-        
-        # Ensure min < max
-        if salary_min >= salary_max:
-            salary_max = salary_min + 20000
-        
-        return max(salary_min, 40000), salary_max  # Minimum floor of $40k
-    
-    def _get_skills_for_role(self, job_title, industry, experience_level):
-        """Get skills based on role, industry, and experience level"""
-        # Get base skills for role
-        base_skills = self.skills_by_role.get(job_title, [])
-        
-        # Add industry-specific skills
-        industry_skills = {
-            "Technology": ["Agile", "Git", "Linux", "CI/CD", "Cloud Platforms"],
-            "Finance": ["Excel", "Bloomberg", "Financial Analysis", "Risk Management", "Regulatory Knowledge"],
-            "Healthcare": ["Healthcare Compliance", "HIPAA", "Clinical Knowledge", "Regulatory Affairs", "Medical Terminology"],
-            "Marketing": ["Google Analytics", "Marketing Automation", "Brand Management", "Campaign Management", "Customer Insights"]
-        }
-        
-        # Add experience-level specific skills
-        experience_skills = {
-            "Entry Level": ["Communication", "Time Management", "Attention to Detail"],
-            "Mid Level": ["Project Management", "Team Collaboration", "Problem Solving"],
-            "Senior Level": ["Leadership", "Strategic Planning", "Mentoring", "Decision Making"],
-            "Executive Level": ["Executive Leadership", "Business Strategy", "Stakeholder Management", "Change Management"]
+                return role_salaries[exp_key]
+            
+            # Fallback to available experience level
+            available_exp = list(role_salaries.keys())
+            fallback_key = available_exp[0] if available_exp else "mid"
+            return role_salaries.get(fallback_key, (70000, 120000))
+        
+        # Default salary ranges by experience level
+        default_ranges = {
+            "entry": (60000, 90000),
+            "mid": (80000, 130000),
+            "senior": (110000, 180000),
+            "executive": (150000, 300000)
         }
+        return default_ranges.get(exp_key, (70000, 120000))
+    
+    def _generate_descriptions(self, tables, title, company, skill_slots):
+        """Generate realistic job descriptions from whole columns
+        
+        Openings are formatted once per distinct title/company pair. Postings
+        pick their opening and first five skills by array indexing, and the
+        pieces are concatenated column by column.
+        """
+        # Opening paragraph per (title, company) pair
+        pairs = title * len(tables['companies']) + company
+        unique_pairs, pair_index = np.unique(pairs, return_inverse=True)
+        openings = [
+            self._description_opening(tables['titles'][pair // len(tables['companies'])],
+                                      tables['companies'][pair % len(tables['companies'])])
+            for pair in unique_pairs.tolist()
+        ]
         
-        # Combine skills
-        all_skills = list(base_skills)
-        
-        # Add industry skills (50% chance for each)
-        for skill in industry_skills.get(industry, []):
-            if skill not in all_skills and random.random() > 0.5:
-                all_skills.append(skill)
-        
-        # Add experience skills (70% chance for each)
-        for skill in experience_skills.get(experience_level, []):
-            if skill not in all_skills and random.random() > 0.3:
-                all_skills.append(skill)
-        
-        # Add some random technical skills based on industry
-        if industry == "Technology":
-            tech_pool = ["Docker", "Kubernetes", "AWS", "Python", "JavaScript", "SQL", "React", "Node.js", "Machine Learning", "Data Analysis"]
-        elif industry == "Finance":
-            tech_pool = ["Python", "R", "SQL", "VBA", "MATLAB", "Tableau", "Power BI", "SAS", "Statistical Analysis", "Data Modeling"]
-        elif industry == "Healthcare":
-            tech_pool = ["SAS", "R", "SQL", "Python", "Clinical Data Management", "Statistical Software", "Electronic Health Records", "Data Analysis"]
-        else:  # Marketing
-            tech_pool = ["Google Analytics", "SQL", "Python", "Tableau", "Adobe Creative Suite", "Marketing Automation Tools", "CRM Software", "Social Media Platforms"]
-        
-        # Randomly add 1-3 additional skills
-        additional_count = random.randint(1, 3)
-        additional_skills = random.sample(tech_pool, min(additional_count, len(tech_pool)))
-        
-        for skill in additional_skills:
-            if skill not in all_skills:
-                all_skills.append(skill)
-        
-        # Remove duplicates and return
-        return list(set(all_skills))
+        # Skills come first in each row, so the leading slots are the first
+        # skills listed; shifted by one so 0 marks an empty slot
+        leading = np.zeros((len(title), 5), dtype=np.int64)
+        width = min(skill_slots.shape[1], 5)
+        leading[:, :width] = skill_slots[:, :width] + 1
+        
+        # Each slot as ", skill" or empty, concatenated across the slot columns
+        items = [''] + [', ' + skill for skill in tables['skills'].tolist()]
+        slots = [pd.Series(self._labels(items, leading[:, j])) for j in range(5)]
+        first_three = (slots[0] + slots[1] + slots[2]).str[2:]
+        next_two = slots[3] + slots[4]  # Empty when a posting has three skills or fewer
+        
+        return (
+            pd.Series(self._labels(openings, pair_index)) + "\n\nResponsibilities:\n"
+            "• Utilize " + first_three + " in daily work\n"
+            "• Collaborate with cross-functional teams\n"
+            "• Contribute to project planning and execution\n"
+            "• Maintain high standards of quality and performance"
+            "\n\nRequirements:\n"
+            "• Experience with " + first_three + next_two + "\n"
+            "• Strong analytical and problem-solving skills\n"
+            "• Excellent communication and teamwork abilities\n"
+            "• Bachelor's degree in relevant field"
+        ).array
     
-    def _generate_job_description(self, job_title, company, industry, skills):
-        """Generate a realistic job description"""
+    def _description_opening(self, job_title, company):
+        """Opening paragraph of a job description"""
         descriptions = {
             "Software Engineer": f"We are looking for a talented Software Engineer to join our team at {company}. You will be responsible for developing high-quality software solutions and working collaboratively with cross-functional teams.",
             "Data Scientist": f"{company} is seeking a Data Scientist to analyze complex datasets and drive data-driven decision making across the organization. You will work with large-scale data and machine learning models.",
@@ -337,42 +490,7 @@ class MockJobData:
             "Marketing Analyst": f"We are hiring a Marketing Analyst at {company} to analyze marketing performance and provide insights for campaign optimization and growth strategies."
         }
         
-        base_description = descriptions.get(job_title, f"We are looking for a {job_title} to join our team at {company}.")
-        
-        # Add responsibilities
-        responsibilities = [
-            f"Utilize {', '.join(skills[:3])} in daily work",
-            "Collaborate with cross-functional teams",
-            "Contribute to project planning and execution",
-            "Maintain high standards of quality and performance"
-        ]
-        
-        requirements = [
-            f"Experience with {', '.join(skills[:5])}",
-            "Strong analytical and problem-solving skills",
-            "Excellent communication and teamwork abilities",
-            "Bachelor's degree in relevant field"
-        ]
-        
-        full_description = f"{base_description}\n\nResponsibilities:\n" + "\n".join([f"• {r}" for r in responsibilities])
-        full_description += f"\n\nRequirements:\n" + "\n".join([f"• {r}" for r in requirements])
-        
-        return full_description
-    
-    def _generate_benefits(self):
-        """Generate realistic benefits list"""
-        possible_benefits = [
-            "Health Insurance", "Dental Insurance", "Vision Insurance",
-            "401(k) Matching", "Flexible PTO", "Remote Work Options",
-            "Professional Development Budget", "Stock Options",
-            "Life Insurance", "Disability Insurance", "Wellness Programs",
-            "Flexible Hours", "Parental Leave", "Tuition Reimbursement",
-            "Free Meals", "Gym Membership", "Transit Benefits"
-        ]
-        
-        # Randomly select 5-10 benefits
-        num_benefits = random.randint(5, 10)
-        return random.sample(possible_benefits, num_benefits)
+        return descriptions.get(job_title, f"We are looking for a {job_title} to join our team at {company}.")
     
     def get_trending_skills(self, industry=None, days_back=30):
         """Get trending skills data (mock time series)"""
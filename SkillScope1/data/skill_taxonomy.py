@@ -1,280 +1,402 @@
-from collections import defaultdict
-import re
+from collections import defaultdict, namedtuple
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Comprehensive skill categories with variations and synonyms
+SKILL_CATEGORIES = {
+    'Programming Languages': {
+        'python': ['python', 'py', 'python3', 'python2'],
+        'java': ['java', 'java8', 'java11', 'openjdk'],
+        'javascript': ['javascript', 'js', 'ecmascript', 'es6', 'es5'],
+        'typescript': ['typescript', 'ts'],
+        'c++': ['c++', 'cpp', 'c plus plus'],
+        'c#': ['c#', 'csharp', 'c sharp'],
+        'php': ['php', 'php7', 'php8'],
+        'ruby': ['ruby'],
+        'go': ['go', 'golang'],
+        'swift': ['swift'],
+        'kotlin': ['kotlin'],
+        'scala': ['scala'],
+        'r': ['r', 'r programming', 'r language'],
+        'sql': ['sql', 't-sql'],
+        'html': ['html', 'html5'],
+        'css': ['css', 'css3'],
+        'matlab': ['matlab'],
+        'perl': ['perl'],
+        'rust': ['rust'],
+        'dart': ['dart'],
+        'lua': ['lua'],
+        'shell': ['bash', 'shell scripting', 'powershell', 'zsh']
+    },
+    
+    'Web Frameworks & Libraries': {
+        'react': ['react', 'reactjs', 'react.js'],
+        'angular': ['angular', 'angularjs'],
+        'vue': ['vue', 'vuejs', 'vue.js'],
+        'django': ['django'],
+        'flask': ['flask'],
+        'express': ['express', 'express.js', 'expressjs'],
+        'node.js': ['node.js', 'nodejs', 'node js'],
+        'spring': ['spring', 'spring boot', 'spring framework'],
+        'laravel': ['laravel'],
+        'asp.net': ['asp.net', 'aspnet'],
+        'jquery': ['jquery'],
+        'bootstrap': ['bootstrap'],
+        'next.js': ['next.js', 'nextjs'],
+        'nuxt.js': ['nuxt.js', 'nuxtjs'],
+        'svelte': ['svelte'],
+        'ember': ['ember', 'ember.js'],
+        'backbone': ['backbone', 'backbone.js'],
+        'rails': ['ruby on rails', 'rails', 'ror']
+    },
+    
+    'Databases': {
+        'mysql': ['mysql'],
+        'postgresql': ['postgresql', 'postgres'],
+        'mongodb': ['mongodb', 'mongo'],
+        'redis': ['redis'],
+        'elasticsearch': ['elasticsearch', 'elastic search'],
+        'cassandra': ['cassandra'],
+        'dynamodb': ['dynamodb', 'dynamo db'],
+        'oracle': ['oracle database', 'oracle db', 'oracle'],
+        'sql server': ['sql server', 'microsoft sql server'],
+        'sqlite': ['sqlite'],
+        'couchdb': ['couchdb'],
+        'neo4j': ['neo4j'],
+        'influxdb': ['influxdb'],
+        'mariadb': ['mariadb'],
+        'firebase': ['firebase', 'firestore']
+    },
+    
+    'Cloud Platforms & Services': {
+        'aws': ['aws', 'amazon web services'],
+        'azure': ['microsoft azure', 'azure'],
+        'gcp': ['google cloud', 'gcp', 'google cloud platform'],
+        'heroku': ['heroku'],
+        'digital ocean': ['digital ocean', 'digitalocean'],
+        'linode': ['linode'],
+        'vultr': ['vultr'],
+        'cloudflare': ['cloudflare'],
+        'netlify': ['netlify'],
+        'vercel': ['vercel']
+    },
+    
+    'DevOps & Infrastructure': {
+        'docker': ['docker', 'containerization'],
+        'kubernetes': ['kubernetes', 'k8s'],
+        'jenkins': ['jenkins'],
+        'git': ['git', 'github', 'gitlab', 'bitbucket'],
+        'terraform': ['terraform'],
+        'ansible': ['ansible'],
+        'puppet': ['puppet'],
+        'chef': ['chef'],
+        'vagrant': ['vagrant'],
+        'linux': ['linux', 'ubuntu', 'centos', 'rhel', 'debian'],
+        'unix': ['unix'],
+        'ci/cd': ['ci/cd', 'continuous integration', 'continuous deployment'],
+        'monitoring': ['monitoring', 'observability'],
+        'nginx': ['nginx'],
+        'apache': ['apache', 'apache http server']
+    },
+    
+    'Data Science & Analytics': {
+        'machine learning': ['machine learning', 'ml'],
+        'deep learning': ['deep learning', 'neural networks'],
+        'artificial intelligence': ['artificial intelligence', 'ai'],
+        'data analysis': ['data analysis', 'data analytics'],
+        'statistics': ['statistics', 'statistical analysis'],
+        'data mining': ['data mining'],
+        'predictive modeling': ['predictive modeling'],
+        'feature engineering': ['feature engineering'],
+        'model deployment': ['model deployment'],
+        'nlp': ['natural language processing', 'nlp'],
+        'computer vision': ['computer vision', 'cv'],
+        'time series': ['time series analysis'],
+        'a/b testing': ['a/b testing', 'ab testing', 'split testing']
+    },
+    
+    'ML/AI Frameworks & Tools': {
+        'tensorflow': ['tensorflow', 'tf'],
+        'pytorch': ['pytorch'],
+        'keras': ['keras'],
+        'scikit-learn': ['scikit-learn', 'sklearn'],
+        'pandas': ['pandas'],
+        'numpy': ['numpy'],
+        'matplotlib': ['matplotlib'],
+        'seaborn': ['seaborn'],
+        'plotly': ['plotly'],
+        'jupyter': ['jupyter', 'jupyter notebook'],
+        'spark': ['apache spark', 'pyspark', 'spark'],
+        'hadoop': ['hadoop'],
+        'kafka': ['apache kafka', 'kafka'],
+        'airflow': ['apache airflow', 'airflow'],
+        'mlflow': ['mlflow'],
+        'kubeflow': ['kubeflow']
+    },
+    
+    'Business Intelligence & Visualization': {
+        'tableau': ['tableau'],
+        'power bi': ['power bi', 'powerbi'],
+        'qlik': ['qlikview', 'qlik sense', 'qlik'],
+        'looker': ['looker'],
+        'sas': ['sas'],
+        'spss': ['spss'],
+        'excel': ['excel', 'microsoft excel'],
+        'google sheets': ['google sheets'],
+        'r shiny': ['shiny', 'r shiny'],
+        'dash': ['plotly dash', 'dash'],
+        'streamlit': ['streamlit']
+    },
+    
+    'Design & Creative Tools': {
+        'figma': ['figma'],
+        'sketch': ['sketch'],
+        'adobe xd': ['adobe xd', 'xd'],
+        'photoshop': ['photoshop', 'adobe photoshop'],
+        'illustrator': ['illustrator', 'adobe illustrator'],
+        'indesign': ['indesign', 'adobe indesign'],
+        'after effects': ['after effects', 'adobe after effects'],
+        'premiere pro': ['premiere pro', 'adobe premiere'],
+        'canva': ['canva'],
+        'invision': ['invision']
+    },
+    
+    'Project Management & Collaboration': {
+        'agile': ['agile', 'agile methodology'],
+        'scrum': ['scrum'],
+        'kanban': ['kanban'],
+        'waterfall': ['waterfall'],
+        'lean': ['lean', 'lean methodology'],
+        'six sigma': ['six sigma'],
+        'jira': ['jira'],
+        'confluence': ['confluence'],
+        'trello': ['trello'],
+        'asana': ['asana'],
+        'monday': ['monday.com', 'monday'],
+        'slack': ['slack'],
+        'microsoft teams': ['microsoft teams', 'teams'],
+        'zoom': ['zoom'],
+        'notion': ['notion']
+    },
+    
+    'Microsoft Office Suite': {
+        'excel': ['excel', 'microsoft excel'],
+        'powerpoint': ['powerpoint', 'microsoft powerpoint'],
+        'word': ['microsoft word', 'ms word', 'word'],
+        'outlook': ['outlook', 'microsoft outlook'],
+        'sharepoint': ['sharepoint'],
+        'onenote': ['onenote'],
+        'access': ['microsoft access', 'access'],
+        'visio': ['microsoft visio', 'visio']
+    },
+    
+    'Finance & Trading Tools': {
+        'bloomberg': ['bloomberg terminal', 'bloomberg'],
+        'reuters': ['reuters', 'refinitiv'],
+        'factset': ['factset'],
+        'eikon': ['eikon'],
+        'capital iq': ['capital iq'],
+        'morningstar': ['morningstar'],
+        'quickbooks': ['quickbooks'],
+        'sap': ['sap'],
+        'oracle financials': ['oracle financials']
+    },
+    
+    'Security & Compliance': {
+        'cybersecurity': ['cybersecurity', 'information security'],
+        'penetration testing': ['penetration testing', 'pen testing'],
+        'ethical hacking': ['ethical hacking'],
+        'network security': ['network security'],
+        'application security': ['application security'],
+        'security frameworks': ['security frameworks'],
+        'compliance': ['compliance'],
+        'audit': ['audit', 'auditing'],
+        'risk management': ['risk management'],
+        'incident response': ['incident response'],
+        'vulnerability assessment': ['vulnerability assessment'],
+        'siem': ['siem']
+    },
+    
+    'Soft Skills': {
+        'leadership': ['leadership', 'team leadership', 'leading teams'],
+        'communication': ['communication', 'verbal communication', 'written communication'],
+        'problem solving': ['problem solving', 'analytical thinking'],
+        'teamwork': ['teamwork', 'collaboration'],
+        'time management': ['time management', 'organization'],
+        'critical thinking': ['critical thinking', 'analytical skills'],
+        'creativity': ['creativity', 'innovation'],
+        'adaptability': ['adaptability', 'flexibility'],
+        'emotional intelligence': ['emotional intelligence', 'eq'],
+        'negotiation': ['negotiation', 'negotiation skills'],
+        'presentation': ['presentation skills', 'public speaking'],
+        'mentoring': ['mentoring', 'coaching'],
+        'decision making': ['decision making'],
+        'strategic thinking': ['strategic thinking', 'strategic planning']
+    },
+    
+    'Industry Knowledge': {
+        'healthcare': ['healthcare', 'medical', 'clinical'],
+        'finance': ['finance', 'financial services', 'banking'],
+        'e-commerce': ['e-commerce', 'ecommerce', 'retail'],
+        'manufacturing': ['manufacturing', 'industrial'],
+        'telecommunications': ['telecommunications', 'telecom'],
+        'education': ['education', 'edtech'],
+        'real estate': ['real estate', 'property'],
+        'automotive': ['automotive', 'automotive industry'],
+        'energy': ['energy', 'oil and gas', 'renewable energy'],
+        'logistics': ['logistics', 'supply chain'],
+        'gaming': ['gaming', 'game development'],
+        'media': ['media', 'entertainment']
+    },
+    
+    'Specialized Skills': {
+        'blockchain': ['blockchain', 'cryptocurrency', 'bitcoin', 'ethereum'],
+        'iot': ['iot', 'internet of things'],
+        'ar/vr': ['augmented reality', 'virtual reality', 'ar', 'vr'],
+        'robotics': ['robotics', 'automation'],
+        'quantum computing': ['quantum computing'],
+        'edge computing': ['edge computing'],
+        'microservices': ['microservices', 'service oriented architecture'],
+        'api development': ['api development', 'rest apis', 'graphql'],
+        'mobile development': ['mobile development', 'ios development', 'android development'],
+        'game development': ['game development', 'unity', 'unreal engine']
+    }
+}
+
+
+class FrozenDict(dict):
+    """Read-only dict for lookup tables shared by every taxonomy in the process"""
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("taxonomy lookup tables are read-only")
+    
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+    
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+TaxonomyTables = namedtuple('TaxonomyTables', [
+    'skill_categories',    # category -> canonical skill -> variations
+    'variation_to_skill',  # lowercase variation -> canonical skill
+    'skill_to_category',   # canonical skill -> category
+    'skill_variations',    # canonical skill -> variations
+    'category_skills',     # category -> canonical skills in curated order
+    'partial_match'        # PartialMatchIndex for skills missing from the tables
+])
+
+PartialMatchIndex = namedtuple('PartialMatchIndex', [
+    'variation_ranks',    # (variation, category) by rank
+    'needle_rank',        # variation or variation word -> lowest rank
+    'needles_by_prefix',  # first 3 characters -> (rank, needle) pairs by rank
+    'short_rank',         # substring of 0-2 characters -> lowest rank
+    'trigram_ranks'       # trigram -> ranks of variations containing it
+])
+
+# Tables built from SKILL_CATEGORIES, shared by every SkillTaxonomy in the process
+_taxonomy_tables = None
+_taxonomy_lock = threading.Lock()
+
+
+def _build_partial_match_index(skill_categories):
+    """Index every variation for the partial matching fallback
+    
+    Variations are ranked in category order, so the lowest matching rank
+    is the variation a scan over the categories would reach first.
+    """
+    variation_ranks = []
+    needle_rank = {}
+    short_rank = {}
+    trigram_ranks = defaultdict(list)
+    
+    for category, skills in skill_categories.items():
+        for variations in skills.values():
+            for variation in variations:
+                rank = len(variation_ranks)
+                variation_ranks.append((variation, category))
+                
+                # Needles that match when they occur inside the skill
+                needles = [word for word in variation.split() if len(word) > 2] + [variation]
+                for needle in needles:
+                    needle_rank.setdefault(needle, rank)
+                
+                # Substrings for skills that occur inside the variation
+                for length in range(3):
+                    for i in range(len(variation) - length + 1):
+                        short_rank.setdefault(variation[i:i + length], rank)
+                for trigram in {variation[i:i + 3] for i in range(len(variation) - 2)}:
+                    trigram_ranks[trigram].append(rank)
+    
+    needles_by_prefix = defaultdict(list)
+    for needle, rank in needle_rank.items():
+        if len(needle) >= 3:
+            needles_by_prefix[needle[:3]].append((rank, needle))
+    
+    return PartialMatchIndex(
+        variation_ranks=tuple(variation_ranks),
+        needle_rank=FrozenDict(needle_rank),
+        needles_by_prefix=FrozenDict((prefix, tuple(sorted(needles))) for prefix, needles in needles_by_prefix.items()),
+        short_rank=FrozenDict(short_rank),
+        trigram_ranks=FrozenDict((trigram, tuple(ranks)) for trigram, ranks in trigram_ranks.items())
+    )
+
+
+def build_taxonomy_tables(skill_categories):
+    """Build the immutable lookup tables of a taxonomy"""
+    variation_to_skill = {}
+    skill_to_category = {}
+    skill_variations = {}
+    
+    for category, skills in skill_categories.items():
+        for main_skill, variations in skills.items():
+            skill_to_category[main_skill] = category
+            for variation in variations:
+                variation_to_skill[variation.lower()] = main_skill
+    
+    # Like the category scan it replaces, synonyms come from the first category listing a skill
+    for skills in skill_categories.values():
+        for main_skill, variations in skills.items():
+            skill_variations.setdefault(main_skill, tuple(variations))
+    
+    return TaxonomyTables(
+        skill_categories=FrozenDict(
+            (category, FrozenDict((main_skill, tuple(variations)) for main_skill, variations in skills.items()))
+            for category, skills in skill_categories.items()
+        ),
+        variation_to_skill=FrozenDict(variation_to_skill),
+        skill_to_category=FrozenDict(skill_to_category),
+        skill_variations=FrozenDict(skill_variations),
+        category_skills=FrozenDict((category, tuple(skills)) for category, skills in skill_categories.items()),
+        partial_match=_build_partial_match_index(skill_categories)
+    )
+
+
+def get_taxonomy_tables():
+    """Get the lookup tables of SKILL_CATEGORIES, built once per process"""
+    global _taxonomy_tables
+    
+    if _taxonomy_tables is None:
+        with _taxonomy_lock:
+            if _taxonomy_tables is None:
+                _taxonomy_tables = build_taxonomy_tables(SKILL_CATEGORIES)
+    return _taxonomy_tables
+
 
 class SkillTaxonomy:
     """Class to categorize and organize skills into meaningful taxonomies"""
     
-    def __init__(self):
-        # Define comprehensive skill categories with variations and synonyms
-        self.skill_categories = {
-            'Programming Languages': {
-                'python': ['python', 'py', 'python3', 'python2'],
-                'java': ['java', 'java8', 'java11', 'openjdk'],
-                'javascript': ['javascript', 'js', 'ecmascript', 'es6', 'es5'],
-                'typescript': ['typescript', 'ts'],
-                'c++': ['c++', 'cpp', 'c plus plus'],
-                'c#': ['c#', 'csharp', 'c sharp'],
-                'php': ['php', 'php7', 'php8'],
-                'ruby': ['ruby'],
-                'go': ['go', 'golang'],
-                'swift': ['swift'],
-                'kotlin': ['kotlin'],
-                'scala': ['scala'],
-                'r': ['r', 'r programming', 'r language'],
-                'sql': ['sql', 't-sql'],
-                'html': ['html', 'html5'],
-                'css': ['css', 'css3'],
-                'matlab': ['matlab'],
-                'perl': ['perl'],
-                'rust': ['rust'],
-                'dart': ['dart'],
-                'lua': ['lua'],
-                'shell': ['bash', 'shell scripting', 'powershell', 'zsh']
-            },
-            
-            'Web Frameworks & Libraries': {
-                'react': ['react', 'reactjs', 'react.js'],
-                'angular': ['angular', 'angularjs'],
-                'vue': ['vue', 'vuejs', 'vue.js'],
-                'django': ['django'],
-                'flask': ['flask'],
-                'express': ['express', 'express.js', 'expressjs'],
-                'node.js': ['node.js', 'nodejs', 'node js'],
-                'spring': ['spring', 'spring boot', 'spring framework'],
-                'laravel': ['laravel'],
-                'asp.net': ['asp.net', 'aspnet'],
-                'jquery': ['jquery'],
-                'bootstrap': ['bootstrap'],
-                'next.js': ['next.js', 'nextjs'],
-                'nuxt.js': ['nuxt.js', 'nuxtjs'],
-                'svelte': ['svelte'],
-                'ember': ['ember', 'ember.js'],
-                'backbone': ['backbone', 'backbone.js'],
-                'rails': ['ruby on rails', 'rails', 'ror']
-            },
-            
-            'Databases': {
-                'mysql': ['mysql'],
-                'postgresql': ['postgresql', 'postgres'],
-                'mongodb': ['mongodb', 'mongo'],
-                'redis': ['redis'],
-                'elasticsearch': ['elasticsearch', 'elastic search'],
-                'cassandra': ['cassandra'],
-                'dynamodb': ['dynamodb', 'dynamo db'],
-                'oracle': ['oracle database', 'oracle db', 'oracle'],
-                'sql server': ['sql server', 'microsoft sql server'],
-                'sqlite': ['sqlite'],
-                'couchdb': ['couchdb'],
-                'neo4j': ['neo4j'],
-                'influxdb': ['influxdb'],
-                'mariadb': ['mariadb'],
-                'firebase': ['firebase', 'firestore']
-            },
-            
-            'Cloud Platforms & Services': {
-                'aws': ['aws', 'amazon web services'],
-                'azure': ['microsoft azure', 'azure'],
-                'gcp': ['google cloud', 'gcp', 'google cloud platform'],
-                'heroku': ['heroku'],
-                'digital ocean': ['digital ocean', 'digitalocean'],
-                'linode': ['linode'],
-                'vultr': ['vultr'],
-                'cloudflare': ['cloudflare'],
-                'netlify': ['netlify'],
-                'vercel': ['vercel']
-            },
-            
-            'DevOps & Infrastructure': {
-                'docker': ['docker', 'containerization'],
-                'kubernetes': ['kubernetes', 'k8s'],
-                'jenkins': ['jenkins'],
-                'git': ['git', 'github', 'gitlab', 'bitbucket'],
-                'terraform': ['terraform'],
-                'ansible': ['ansible'],
-                'puppet': ['puppet'],
-                'chef': ['chef'],
-                'vagrant': ['vagrant'],
-                'linux': ['linux', 'ubuntu', 'centos', 'rhel', 'debian'],
-                'unix': ['unix'],
-                'ci/cd': ['ci/cd', 'continuous integration', 'continuous deployment'],
-                'monitoring': ['monitoring', 'observability'],
-                'nginx': ['nginx'],
-                'apache': ['apache', 'apache http server']
-            },
-            
-            'Data Science & Analytics': {
-                'machine learning': ['machine learning', 'ml'],
-                'deep learning': ['deep learning', 'neural networks'],
-                'artificial intelligence': ['artificial intelligence', 'ai'],
-                'data analysis': ['data analysis', 'data analytics'],
-                'statistics': ['statistics', 'statistical analysis'],
-                'data mining': ['data mining'],
-                'predictive modeling': ['predictive modeling'],
-                'feature engineering': ['feature engineering'],
-                'model deployment': ['model deployment'],
-                'nlp': ['natural language processing', 'nlp'],
-                'computer vision': ['computer vision', 'cv'],
-                'time series': ['time series analysis'],
-                'a/b testing': ['a/b testing', 'ab testing', 'split testing']
-            },
-            
-            'ML/AI Frameworks & Tools': {
-                'tensorflow': ['tensorflow', 'tf'],
-                'pytorch': ['pytorch'],
-                'keras': ['keras'],
-                'scikit-learn': ['scikit-learn', 'sklearn'],
-                'pandas': ['pandas'],
-                'numpy': ['numpy'],
-                'matplotlib': ['matplotlib'],
-                'seaborn': ['seaborn'],
-                'plotly': ['plotly'],
-                'jupyter': ['jupyter', 'jupyter notebook'],
-                'spark': ['apache spark', 'pyspark', 'spark'],
-                'hadoop': ['hadoop'],
-                'kafka': ['apache kafka', 'kafka'],
-                'airflow': ['apache airflow', 'airflow'],
-                'mlflow': ['mlflow'],
-                'kubeflow': ['kubeflow']
-            },
-            
-            'Business Intelligence & Visualization': {
-                'tableau': ['tableau'],
-                'power bi': ['power bi', 'powerbi'],
-                'qlik': ['qlikview', 'qlik sense', 'qlik'],
-                'looker': ['looker'],
-                'sas': ['sas'],
-                'spss': ['spss'],
-                'excel': ['excel', 'microsoft excel'],
-                'google sheets': ['google sheets'],
-                'r shiny': ['shiny', 'r shiny'],
-                'dash': ['plotly dash', 'dash'],
-                'streamlit': ['streamlit']
-            },
-            
-            'Design & Creative Tools': {
-                'figma': ['figma'],
-                'sketch': ['sketch'],
-                'adobe xd': ['adobe xd', 'xd'],
-                'photoshop': ['photoshop', 'adobe photoshop'],
-                'illustrator': ['illustrator', 'adobe illustrator'],
-                'indesign': ['indesign', 'adobe indesign'],
-                'after effects': ['after effects', 'adobe after effects'],
-                'premiere pro': ['premiere pro', 'adobe premiere'],
-                'canva': ['canva'],
-                'invision': ['invision']
-            },
-            
-            'Project Management & Collaboration': {
-                'agile': ['agile', 'agile methodology'],
-                'scrum': ['scrum'],
-                'kanban': ['kanban'],
-                'waterfall': ['waterfall'],
-                'lean': ['lean', 'lean methodology'],
-                'six sigma': ['six sigma'],
-                'jira': ['jira'],
-                'confluence': ['confluence'],
-                'trello': ['trello'],
-                'asana': ['asana'],
-                'monday': ['monday.com', 'monday'],
-                'slack': ['slack'],
-                'microsoft teams': ['microsoft teams', 'teams'],
-                'zoom': ['zoom'],
-                'notion': ['notion']
-            },
-            
-            'Microsoft Office Suite': {
-                'excel': ['excel', 'microsoft excel'],
-                'powerpoint': ['powerpoint', 'microsoft powerpoint'],
-                'word': ['microsoft word', 'ms word', 'word'],
-                'outlook': ['outlook', 'microsoft outlook'],
-                'sharepoint': ['sharepoint'],
-                'onenote': ['onenote'],
-                'access': ['microsoft access', 'access'],
-                'visio': ['microsoft visio', 'visio']
-            },
-            
-            'Finance & Trading Tools': {
-                'bloomberg': ['bloomberg terminal', 'bloomberg'],
-                'reuters': ['reuters', 'refinitiv'],
-                'factset': ['factset'],
-                'eikon': ['eikon'],
-                'capital iq': ['capital iq'],
-                'morningstar': ['morningstar'],
-                'quickbooks': ['quickbooks'],
-                'sap': ['sap'],
-                'oracle financials': ['oracle financials']
-            },
-            
-            'Security & Compliance': {
-                'cybersecurity': ['cybersecurity', 'information security'],
-                'penetration testing': ['penetration testing', 'pen testing'],
-                'ethical hacking': ['ethical hacking'],
-                'network security': ['network security'],
-                'application security': ['application security'],
-                'security frameworks': ['security frameworks'],
-                'compliance': ['compliance'],
-                'audit': ['audit', 'auditing'],
-                'risk management': ['risk management'],
-                'incident response': ['incident response'],
-                'vulnerability assessment': ['vulnerability assessment'],
-                'siem': ['siem']
-            },
-            
-            'Soft Skills': {
-                'leadership': ['leadership', 'team leadership', 'leading teams'],
-                'communication': ['communication', 'verbal communication', 'written communication'],
-                'problem solving': ['problem solving', 'analytical thinking'],
-                'teamwork': ['teamwork', 'collaboration'],
-                'time management': ['time management', 'organization'],
-                'critical thinking': ['critical thinking', 'analytical skills'],
-                'creativity': ['creativity', 'innovation'],
-                'adaptability': ['adaptability', 'flexibility'],
-                'emotional intelligence': ['emotional intelligence', 'eq'],
-                'negotiation': ['negotiation', 'negotiation skills'],
-                'presentation': ['presentation skills', 'public speaking'],
-                'mentoring': ['mentoring', 'coaching'],
-                'decision making': ['decision making'],
-                'strategic thinking': ['strategic thinking', 'strategic planning']
-            },
-            
-            'Industry Knowledge': {
-                'healthcare': ['healthcare', 'medical', 'clinical'],
-                'finance': ['finance', 'financial services', 'banking'],
-                'e-commerce': ['e-commerce', 'ecommerce', 'retail'],
-                'manufacturing': ['manufacturing', 'industrial'],
-                'telecommunications': ['telecommunications', 'telecom'],
-                'education': ['education', 'edtech'],
-                'real estate': ['real estate', 'property'],
-                'automotive': ['automotive', 'automotive industry'],
-                'energy': ['energy', 'oil and gas', 'renewable energy'],
-                'logistics': ['logistics', 'supply chain'],
-                'gaming': ['gaming', 'game development'],
-                'media': ['media', 'entertainment']
-            },
-            
-            'Specialized Skills': {
-                'blockchain': ['blockchain', 'cryptocurrency', 'bitcoin', 'ethereum'],
-                'iot': ['iot', 'internet of things'],
-                'ar/vr': ['augmented reality', 'virtual reality', 'ar', 'vr'],
-                'robotics': ['robotics', 'automation'],
-                'quantum computing': ['quantum computing'],
-                'edge computing': ['edge computing'],
-                'microservices': ['microservices', 'service oriented architecture'],
-                'api development': ['api development', 'rest apis', 'graphql'],
-                'mobile development': ['mobile development', 'ios development', 'android development'],
-                'game development': ['game development', 'unity', 'unreal engine']
-            }
-        }
-        
-        # Create reverse mapping for faster lookup
-        self.skill_to_category = {}
-        self.variation_to_skill = {}
+    def __init__(self, tables=None):
+        # Immutable lookup tables, shared across instances (and sessions) unless given
+        self.tables = tables if tables is not None else get_taxonomy_tables()
         
-        for category, skills in self.skill_categories.items():
-            for main_skill, variations in skills.items():
-                self.skill_to_category[main_skill] = category
-                for variation in variations:
-                    self.variation_to_skill[variation.lower()] = main_skill
+        self.skill_categories = self.tables.skill_categories
+        self.skill_to_category = self.tables.skill_to_category
+        self.variation_to_skill = self.tables.variation_to_skill
+        self._partial_match = self.tables.partial_match
     
     def categorize_skills(self, skills):
         """Categorize a list of skills into their respective categories"""
@@ -307,21 +429,39 @@ class SkillTaxonomy:
     
     def _find_partial_match(self, skill):
         """Find category through partial matching"""
-        skill_words = skill.split()
+        index = self._partial_match
+        best = len(index.variation_ranks)
         
-        for category, skills in self.skill_categories.items():
-            for main_skill, variations in skills.items():
-                for variation in variations:
-                    variation_words = variation.split()
-                    
-                    # Check if any word from skill matches any word from variation
-                    if any(word in skill for word in variation_words if len(word) > 2):
-                        return category
-                    
-                    # Check if skill contains the variation
-                    if variation in skill or skill in variation:
-                        return category
+        # A variation, or one of its words longer than two characters, inside the skill:
+        # at every offset, try the needles starting with the skill's next characters
+        for i in range(len(skill)):
+            # Needles of one or two characters are whole short variations
+            for piece in (skill[i], skill[i:i + 2]):
+                rank = index.needle_rank.get(piece)
+                if rank is not None and rank < best:
+                    best = rank
+            for rank, needle in index.needles_by_prefix.get(skill[i:i + 3], ()):
+                if rank >= best:
+                    break
+                if skill.startswith(needle, i):
+                    best = rank
+                    break
+        
+        # The skill inside a variation: direct lookup for short skills, else
+        # verify the variations sharing the skill's rarest trigram
+        if len(skill) < 3:
+            best = min(best, index.short_rank.get(skill, best))
+        else:
+            postings = min((index.trigram_ranks.get(skill[i:i + 3], ()) for i in range(len(skill) - 2)), key=len)
+            for rank in postings:
+                if rank >= best:
+                    break
+                if skill in index.variation_ranks[rank][0]:
+                    best = rank
+                    break
         
+        if best < len(index.variation_ranks):
+            return index.variation_ranks[best][1]
         return None
     
     def get_category_for_skill(self, skill):
@@ -336,9 +476,7 @@ class SkillTaxonomy:
     
     def get_skills_in_category(self, category):
         """Get all skills in a specific category"""
-        if category in self.skill_categories:
-            return list(self.skill_categories[category].keys())
-        return []
+        return list(self.tables.category_skills.get(category, ()))
     
     def get_all_categories(self):
         """Get all available categories"""
@@ -348,10 +486,15 @@ class SkillTaxonomy:
         """Get skills related to the given skill (same category)"""
         category = self.get_category_for_skill(skill)
         if category:
-            related_skills = self.get_skills_in_category(category)
-            # Remove the input skill itself
-            related_skills = [s for s in related_skills if s.lower() != skill.lower()]
-            return related_skills[:limit]
+            # Walk the category only until limit skills other than the input are found
+            skill_lower = skill.lower()
+            related_skills = []
+            for candidate in self.tables.category_skills[category]:
+                if len(related_skills) >= limit:
+                    break
+                if candidate.lower() != skill_lower:
+                    related_skills.append(candidate)
+            return related_skills
         return []
     
     def analyze_skill_distribution(self, skills):
@@ -372,6 +515,54 @@ class SkillTaxonomy:
         
         return analysis
     
+    def explode_skill_categories(self, df, skills_column='required_skills', columns=None):
+        """One row per (posting, skill) with the skill's category
+        
+        The category column is categorical over the taxonomy's categories plus
+        'Other'. Each distinct skill is categorized once, however many postings
+        list it. Extra columns (e.g. industry) are carried along.
+        """
+        columns = [columns] if isinstance(columns, str) else list(columns or [])
+        
+        # Explode on positions so duplicate index labels in df are harmless
+        skills = pd.Series(df[skills_column].to_numpy(), index=pd.RangeIndex(len(df))).explode().dropna()
+        positions = skills.index.to_numpy()
+        
+        exploded = pd.DataFrame({'posting': positions})
+        for column in columns:
+            exploded[column] = df[column].to_numpy()[positions]
+        exploded['skill'] = skills.to_numpy()
+        
+        category_of = {skill: self.get_category_for_skill(skill) or 'Other' for skill in pd.unique(skills)}
+        exploded['category'] = pd.Categorical(exploded['skill'].map(category_of), categories=self.get_all_categories() + ['Other'])
+        
+        return exploded
+    
+    def get_category_distribution(self, df, skills_column='required_skills', by=None, normalize=False):
+        """Category distribution of every posting's skills, or of each group of postings
+        
+        Without by, returns a postings x categories count table aligned with
+        df's index. With by (a column name or list, e.g. 'industry'), counts
+        are summed per group. normalize gives percentages of each row's skills,
+        as analyze_skill_distribution does for a single list.
+        """
+        exploded = self.explode_skill_categories(df, skills_column)
+        categories = exploded['category'].cat.categories
+        
+        # Count (posting, category) pairs in one bincount over combined codes
+        codes = exploded['posting'].to_numpy() * len(categories) + exploded['category'].cat.codes.to_numpy()
+        counts = np.bincount(codes, minlength=len(df) * len(categories)).reshape(len(df), len(categories))
+        distribution = pd.DataFrame(counts, index=df.index, columns=categories)
+        
+        if by is not None:
+            distribution = distribution.groupby([df[column] for column in ([by] if isinstance(by, str) else by)]).sum()
+        
+        if normalize:
+            totals = distribution.sum(axis=1).replace(0, np.nan)
+            distribution = (distribution.div(totals, axis=0) * 100).round(1).fillna(0.0)
+        
+        return distribution
+    
     def suggest_skill_gaps(self, current_skills, target_role_skills):
         """Suggest skill gaps organized by category"""
         current_categorized = self.categorize_skills(current_skills)
@@ -425,9 +616,8 @@ class SkillTaxonomy:
         skill_lower = skill.lower().strip()
         main_skill = self.variation_to_skill.get(skill_lower, skill_lower)
         
-        # Find the category and variations
-        for category, skills in self.skill_categories.items():
-            if main_skill in skills:
-                return skills[main_skill]
+        variations = self.tables.skill_variations.get(main_skill)
+        if variations is not None:
+            return list(variations)
         
         return [skill]
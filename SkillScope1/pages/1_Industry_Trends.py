@@ -12,8 +12,8 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data'))
 
-from data_loader import DataLoader
-from mock_job_data import MockJobData
+from data_loader import DataLoader, build_skills_table, count_skills
+from dataset_service import get_job_postings
 
 st.set_page_config(
     page_title="Industry Trends - SkillScope",
@@ -25,15 +25,23 @@ def main():
     st.title("📈 Industry Skill Trends")
     st.markdown("### Analyze trending skills and market demands by industry")
     
-    # Load data
-    mock_data = MockJobData()
-    job_data = mock_data.get_job_postings()
+    # Load data; with a postings store only the columns and partitions
+    # needed for the filters are read from disk
+    data_loader = DataLoader()
+    store = data_loader.store
+    if store is not None:
+        # Bring the store up to the shared postings once per run; reads don't sync
+        data_loader.sync_store()
+        job_data = data_loader.get_job_data(columns=['experience_level', 'salary_min', 'salary_max'])
+        industries = store.get_partition_values('industry')
+    else:
+        job_data = get_job_postings()
+        industries = sorted(job_data['industry'].unique())
     
     # Sidebar filters
     st.sidebar.header("Filters")
     
     # Industry selector
-    industries = sorted(job_data['industry'].unique())
     selected_industries = st.sidebar.multiselect(
         "Select Industries",
         industries,
@@ -58,17 +66,31 @@ def main():
     )
     
     # Filter data
-    filtered_data = job_data[
-        (job_data['industry'].isin(selected_industries)) &
-        (job_data['experience_level'].isin(selected_experience)) &
-        (job_data['salary_max'] >= min_salary) &
-        (job_data['salary_min'] <= max_salary)
-    ]
+    if store is not None:
+        filtered_data = data_loader.get_job_data(
+            columns=['id', 'industry', 'company', 'experience_level', 'salary_min', 'salary_max', 'required_skills'],
+            industries=selected_industries,
+            filters=[
+                ('experience_level', 'in', selected_experience),
+                ('salary_max', '>=', min_salary),
+                ('salary_min', '<=', max_salary)
+            ]
+        )
+    else:
+        filtered_data = job_data[
+            (job_data['industry'].isin(selected_industries)) &
+            (job_data['experience_level'].isin(selected_experience)) &
+            (job_data['salary_max'] >= min_salary) &
+            (job_data['salary_min'] <= max_salary)
+        ]
     
     if filtered_data.empty:
         st.warning("No data matches your current filters. Please adjust your selection.")
         return
     
+    # One row per (posting_id, skill) of the filtered postings, shared by the sections below
+    skills_table = build_skills_table(filtered_data, columns=['industry', 'salary_max'])
+    
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -85,10 +107,7 @@ def main():
     
     with col4:
         # Calculate skill diversity
-        all_skills = []
-        for skills in filtered_data['required_skills']:
-            all_skills.extend(skills)
-        unique_skills = len(set(all_skills))
+        unique_skills = skills_table['skill'].nunique()
         st.metric("Unique Skills", unique_skills)
     
     st.markdown("---")
@@ -133,13 +152,11 @@ def main():
             with tabs[i]:
                 industry_data = filtered_data[filtered_data['industry'] == industry]
                 
-                # Extract skills for this industry
-                industry_skills = []
-                for skills in industry_data['required_skills']:
-                    industry_skills.extend(skills)
+                # Skills for this industry
+                industry_skills = skills_table[skills_table['industry'] == industry]
                 
-                if industry_skills:
-                    skill_counts = pd.Series(industry_skills).value_counts().head(15)
+                if len(industry_skills):
+                    skill_counts = count_skills(industry_skills).head(15)
                     
                     col1, col2 = st.columns([2, 1])
                     
@@ -183,11 +200,7 @@ def main():
     
     if selected_industries:
         # Generate mock time series data for top skills
-        all_filtered_skills = []
-        for skills in filtered_data['required_skills']:
-            all_filtered_skills.extend(skills)
-        
-        top_skills = pd.Series(all_filtered_skills).value_counts().head(8).index.tolist()
+        top_skills = count_skills(skills_table).head(8).index.tolist()
         
         # Create mock time series data
         dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='M')
@@ -272,20 +285,9 @@ def main():
     st.subheader("💰 Salary Insights by Skills")
     
     # Calculate average salary by skill
-    skill_salary_data = []
-    for _, row in filtered_data.iterrows():
-        for skill in row['required_skills']:
-            skill_salary_data.append({
-                'skill': skill,
-                'salary_max': row['salary_max'],
-                'industry': row['industry']
-            })
-    
-    if skill_salary_data:
-        skill_salary_df = pd.DataFrame(skill_salary_data)
-        
+    if len(skills_table):
         # Get top skills by salary
-        top_salary_skills = skill_salary_df.groupby('skill')['salary_max'].agg(['mean', 'count']).reset_index()
+        top_salary_skills = skills_table.groupby('skill', observed=True)['salary_max'].agg(['mean', 'count']).reset_index()
         top_salary_skills = top_salary_skills[top_salary_skills['count'] >= 3]  # Filter skills with at least 3 occurrences
         top_salary_skills = top_salary_skills.sort_values('mean', ascending=False).head(15)
         
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import os
 import sys
@@ -10,10 +9,9 @@ import re
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data'))
 
-from nlp_processor import NLPProcessor
-from skill_extractor import SkillExtractor
-from mock_job_data import MockJobData
-from skill_taxonomy import SkillTaxonomy
+from data_loader import build_skills_table, count_skills
+from dataset_service import get_job_postings
+from resource_registry import get_skill_extractor, get_skill_taxonomy
 
 st.set_page_config(
     page_title="Resume Analyzer - SkillScope",
@@ -40,14 +38,14 @@ def extract_text_from_uploaded_file(uploaded_file):
 
 def analyze_resume_skills(resume_text):
     """Analyze resume and extract skills"""
-    skill_extractor = SkillExtractor()
-    nlp_processor = NLPProcessor()
+    # Shared, process-wide instances
+    skill_extractor = get_skill_extractor()
     
     # Extract skills from resume
     extracted_skills = skill_extractor.extract_skills_from_text(resume_text)
     
     # Get skill categories
-    skill_taxonomy = SkillTaxonomy()
+    skill_taxonomy = get_skill_taxonomy()
     categorized_skills = skill_taxonomy.categorize_skills(extracted_skills)
     
     return extracted_skills, categorized_skills
@@ -165,8 +163,7 @@ def main():
         st.subheader("🎯 Job Matching & Skill Gap Analysis")
         
         # Load job data for matching
-        mock_data = MockJobData()
-        job_data = mock_data.get_job_postings()
+        job_data = get_job_postings()
         
         # Industry and job title filters
         col1, col2 = st.columns(2)
@@ -269,13 +266,8 @@ def main():
         else:
             industry_jobs = job_data
         
-        # Extract all skills from target industry
-        industry_skills = []
-        for skills in industry_jobs['required_skills']:
-            industry_skills.extend(skills)
-        
-        # Count skill frequency
-        skill_counts = pd.Series(industry_skills).value_counts()
+        # Count skill frequency in target industry
+        skill_counts = count_skills(build_skills_table(industry_jobs))
         
         # Find skills user doesn't have but are popular in target industry
         user_skills_lower = [skill.lower() for skill in user_skills]
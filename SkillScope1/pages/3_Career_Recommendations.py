@@ -10,8 +10,8 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data'))
 
-from mock_job_data import MockJobData
-from skill_taxonomy import SkillTaxonomy
+from dataset_service import get_job_postings
+from resource_registry import get_skill_taxonomy
 
 st.set_page_config(
     page_title="Career Recommendations - SkillScope",
@@ -57,7 +57,7 @@ def get_career_path_data():
 
 def get_skill_requirements_by_role():
     """Get skill requirements for different roles"""
-    skill_taxonomy = SkillTaxonomy()
+    skill_taxonomy = get_skill_taxonomy()
     
     role_skills = {
         # Data Science roles
@@ -111,8 +111,7 @@ def main():
     st.markdown("### Discover your ideal career path and skill development roadmap")
     
     # Load job data
-    mock_data = MockJobData()
-    job_data = mock_data.get_job_postings()
+    job_data = get_job_postings()
     
     # Career exploration section
     st.subheader("🎯 Career Path Explorer")
@@ -13,7 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data'))
 
 from api_integrator import JobAPIIntegrator, SalaryPredictor
 from auth_manager import AuthManager
-from skill_extractor import SkillExtractor
+from resource_registry import get_skill_extractor
 
 st.set_page_config(
     page_title="Live Job Search - SkillScope",
@@ -286,7 +286,7 @@ def main():
                     
                     # Skills extraction
                     if st.button(f"🔍 Extract Skills", key=f"skills_{job.get('id', i)}"):
-                        skill_extractor = SkillExtractor()
+                        skill_extractor = get_skill_extractor()
                         job_text = f"{job.get('title', '')} {job.get('description', '')}"
                         extracted_skills = skill_extractor.extract_skills_from_text(job_text)
                         
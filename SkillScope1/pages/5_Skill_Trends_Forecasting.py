@@ -18,7 +18,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data'))
 
 from api_integrator import JobAPIIntegrator, SalaryPredictor
-from mock_job_data import MockJobData
+from data_loader import build_skills_table, count_skills
+from dataset_service import get_job_postings
 from skill_extractor import SkillExtractor
 
 st.set_page_config(
@@ -204,15 +205,10 @@ def main():
     st.subheader("🎯 Select Skills for Analysis")
     
     # Get trending skills from API or mock data
-    mock_data = MockJobData()
-    job_data = mock_data.get_job_postings()
+    job_data = get_job_postings()
     
-    # Extract all skills
-    all_skills = []
-    for skills in job_data['required_skills']:
-        all_skills.extend(skills)
-    
-    skill_counts = pd.Series(all_skills).value_counts()
+    # Count all skills
+    skill_counts = count_skills(build_skills_table(job_data))
     popular_skills = skill_counts.head(30).index.tolist()
     
     col1, col2 = st.columns([2, 1])
@@ -12,7 +12,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data'))
 
 from api_integrator import SalaryPredictor
-from mock_job_data import MockJobData
+from dataset_service import get_job_postings
 from auth_manager import AuthManager
 
 st.set_page_config(
@@ -44,8 +44,7 @@ def main():
     # Train model if not already trained
     if not salary_predictor.is_trained:
         with st.spinner("Training salary prediction model..."):
-            mock_data = MockJobData()
-            job_data = mock_data.get_job_postings()
+            job_data = get_job_postings()
             salary_predictor.train_model(job_data)
     
     # Salary prediction form
@@ -416,8 +415,7 @@ def main():
     st.subheader("📈 Market Insights")
     
     # Load market data for insights
-    mock_data = MockJobData()
-    job_data = mock_data.get_job_postings()
+    job_data = get_job_postings()
     
     col1, col2, col3 = st.columns(3)
     
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The app imports its modules from utils/ and data/ directly, as the pages do
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'utils'))
+sys.path.insert(0, os.path.join(ROOT, 'data'))
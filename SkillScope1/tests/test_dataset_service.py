@@ -0,0 +1,17 @@
+from dataset_service import content_version
+from mock_job_data import MockJobData
+
+
+def test_content_version_is_stable_for_the_same_seed():
+    first = MockJobData().get_job_postings(200)
+    second = MockJobData().get_job_postings(200)
+
+    assert content_version(first) == content_version(second)
+
+
+def test_content_version_changes_with_the_data():
+    job_data = MockJobData().get_job_postings(200)
+    changed = job_data.copy()
+    changed.loc[0, 'salary_max'] += 1
+
+    assert content_version(job_data) != content_version(changed)
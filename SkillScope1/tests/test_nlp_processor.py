@@ -0,0 +1,37 @@
+import pytest
+
+from nlp_processor import NLPProcessor
+
+
+@pytest.fixture(scope='module')
+def processor():
+    return NLPProcessor()
+
+
+@pytest.mark.parametrize('text, expected', [
+    # Parts of dotted, hyphenated and slashed tokens
+    ("Vue.js and React.js", {'vue', 'react'}),
+    ("python-based services", {'python'}),
+    ("MS-Excel", {'excel'}),
+    ("C++/Java", {'c++', 'java'}),
+    # Short skills as whole tokens or members of '/' lists
+    ("Go/Rust, JS/TS", {'go', 'javascript', 'typescript'}),
+    ("Skills: R, Go (JS), python.", {'r', 'go', 'javascript', 'python'}),
+    # Whole tokens that are skills themselves
+    ("node.js, scikit-learn and ICD-10", {'node.js', 'scikit-learn', 'icd-10'}),
+])
+def test_extract_skills_basic_finds_skills(processor, text, expected):
+    assert set(processor.extract_skills_basic(text)) == expected
+
+
+@pytest.mark.parametrize('text', [
+    "Own our go-to-market strategy",
+    "Explain r-squared",
+    "R&D engineer",
+])
+def test_extract_skills_basic_ignores_short_word_fragments(processor, text):
+    assert processor.extract_skills_basic(text) == []
+
+
+def test_extract_entities_uses_the_same_matching(processor):
+    assert set(processor.extract_entities("Vue.js in our R&D team")['skills']) == {'vue'}
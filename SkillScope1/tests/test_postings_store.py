@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from mock_job_data import MockJobData
+from postings_store import GENERATION_INFIX, PostingsStore
+
+pytest.importorskip('pyarrow')
+
+
+def _generations(path):
+    prefix = os.path.basename(path) + GENERATION_INFIX
+    return sorted(name for name in os.listdir(os.path.dirname(path)) if name.startswith(prefix))
+
+
+def test_sync_skips_the_current_version(tmp_path):
+    store = PostingsStore(str(tmp_path / 'postings'))
+    job_data = MockJobData().get_job_postings(50)
+
+    assert store.sync(job_data, 'v1')
+    assert not store.sync(job_data, 'v1')
+    assert store.get_version() == 'v1'
+    assert len(store.read(columns=['id'])) == 50
+
+
+def test_sync_keeps_the_current_and_previous_generations(tmp_path):
+    path = str(tmp_path / 'postings')
+    store = PostingsStore(path)
+    job_data = MockJobData().get_job_postings(50)
+
+    for version in ['v1', 'v2', 'v3']:
+        store.sync(job_data, version)
+
+    generations = _generations(path)
+    assert len(generations) == 2
+    assert os.readlink(path) == generations[-1]
+    assert store.get_version() == 'v3'
+
+
+def test_sync_never_removes_newer_generations(tmp_path):
+    path = str(tmp_path / 'postings')
+    store = PostingsStore(path)
+    job_data = MockJobData().get_job_postings(50)
+    store.sync(job_data, 'v1')
+    store.sync(job_data, 'v2')
+
+    # A generation linked by another process after this one's cleanup started
+    newer = path + GENERATION_INFIX + '9' * 20 + '-newer'
+    os.makedirs(newer)
+    store._remove_generations()
+
+    assert _generations(path) == [os.readlink(path), os.path.basename(newer)]
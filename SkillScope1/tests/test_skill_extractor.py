@@ -0,0 +1,24 @@
+from skill_extractor import SkillExtractor
+
+TEXT = "Experience with Python, SQL and Docker is required."
+
+
+def _rule_stats(extractor):
+    stats = extractor.get_context_rule_stats()
+    return stats[stats['matches'] > 0].set_index('rule')[['matches', 'skills_found']].to_dict('index')
+
+
+def test_cache_hits_replay_context_rule_counts():
+    SkillExtractor.result_cache.clear()
+    extractor = SkillExtractor()
+
+    first = extractor.extract_skills_from_text(TEXT)
+    once = _rule_stats(extractor)
+    second = extractor.extract_skills_from_text(TEXT)
+
+    assert sorted(first) == sorted(second)
+    assert once
+    assert _rule_stats(extractor) == {
+        rule: {'matches': 2 * counts['matches'], 'skills_found': 2 * counts['skills_found']}
+        for rule, counts in once.items()
+    }
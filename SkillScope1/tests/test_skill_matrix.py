@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from skill_matrix import SkillIncidenceMatrix
+
+
+@pytest.fixture
+def matrix():
+    return SkillIncidenceMatrix([['python', 'sql'], ['sql'], ['docker', 'python']])
+
+
+@pytest.mark.parametrize('documents', [[], np.array([], dtype=np.int64), np.zeros(3, dtype=bool)])
+def test_empty_selection_counts_nothing(matrix, documents):
+    assert matrix.skill_counts(documents).tolist() == [0, 0, 0]
+    assert matrix.to_dense(documents).shape == (0, 3)
+
+
+def test_selection_by_position_and_mask_agree(matrix):
+    by_position = matrix.skill_counts([0, 2])
+    by_mask = matrix.skill_counts(np.array([True, False, True]))
+
+    assert by_position.tolist() == by_mask.tolist() == [1, 2, 1]
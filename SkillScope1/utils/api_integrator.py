@@ -24,6 +24,10 @@ class JobAPIIntegrator:
         # Rate limiting
         self.last_request_time = 0
         self.min_request_interval = 1.0  # Minimum seconds between requests
+        
+        # Skill extraction: one shared extractor, parallel only for large batches
+        self.batch_extractor = None
+        self.parallel_extraction_threshold = 5000
     
     def rate_limit(self):
         """Implement rate limiting for API requests"""
@@ -270,19 +274,21 @@ class JobAPIIntegrator:
     
     def extract_skills_from_job_data(self, jobs: List[Dict[str, Any]]) -> Dict[str, int]:
         """Extract and count skills from job descriptions"""
-        from .skill_extractor import SkillExtractor
+        from batch_extractor import BatchSkillExtractor
+        from resource_registry import get_batch_skill_extractor, get_skill_extractor
         
-        skill_extractor = SkillExtractor()
-        skill_counts = {}
+        if self.batch_extractor is None:
+            self.batch_extractor = BatchSkillExtractor(workers=1, extractor=get_skill_extractor())
         
-        for job in jobs:
-            description = job.get('description', '') + ' ' + job.get('title', '')
-            skills = skill_extractor.extract_skills_from_text(description)
-            
-            for skill in skills:
-                skill_counts[skill] = skill_counts.get(skill, 0) + 1
+        texts = [job.get('description', '') + ' ' + job.get('title', '') for job in jobs]
+        
+        if len(texts) >= self.parallel_extraction_threshold:
+            # Large archives are sharded across all cores by the process-wide pool
+            batch = get_batch_skill_extractor()
+        else:
+            batch = self.batch_extractor
         
-        return skill_counts
+        return dict(batch.extract(texts)['skill_counts'])
     
     def search_all_sources(self, 
                           query: str = "", 
@@ -0,0 +1,108 @@
+import multiprocessing
+import os
+import threading
+from collections import Counter
+
+from skill_extractor import SkillExtractor
+
+# Extractor used inside pool workers, installed once per process by _init_worker
+_worker_extractor = None
+
+
+def _init_worker(extractor):
+    """Install the shared extractor in a pool worker"""
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _extract_one(text):
+    """Extract skills for a single document inside a pool worker"""
+    return _worker_extractor.extract_skills_from_text(text)
+
+
+def _pool_context():
+    """Start workers from a fresh server process or interpreter, never by forking
+
+    Forking a process that runs threads, such as a Streamlit server, can
+    copy locks other threads hold into the child.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+class BatchSkillExtractor:
+    """Extract skills from large collections of documents across a process pool
+
+    The pool is started on first use and kept for later batches, so its
+    workers and their copy of the extractor are set up once. close shuts it
+    down; pools still open are terminated when the interpreter exits.
+    """
+
+    def __init__(self, workers=None, chunk_size=256, extractor=None):
+        # workers=None uses every available core; 1 keeps everything in-process
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        # One compiled extractor handed to every worker instead of one per document
+        self.extractor = extractor or SkillExtractor()
+
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        """The long-lived worker pool, started on first use"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = _pool_context().Pool(self.workers, initializer=_init_worker, initargs=(self.extractor,))
+            return self._pool
+
+    def close(self):
+        """Shut down the worker pool; a later batch starts a new one"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def iter_extract(self, texts):
+        """Yield the skill list of each text, in input order"""
+        if self.workers <= 1:
+            for text in texts:
+                yield self.extractor.extract_skills_from_text(text)
+            return
+
+        yield from self._get_pool().imap(_extract_one, texts, chunksize=self.chunk_size)
+
+    def iter_extract_chunks(self, chunks):
+        """Yield the skill lists of each chunk of texts
+
+        Unlike iter_extract, only one chunk is handed to the pool at a time, so
+        memory stays bounded by the chunk size however long the input is.
+        """
+        if self.workers <= 1:
+            for chunk in chunks:
+                yield [self.extractor.extract_skills_from_text(text) for text in chunk]
+            return
+
+        pool = self._get_pool()
+        for chunk in chunks:
+            yield pool.map(_extract_one, chunk, chunksize=self.chunk_size)
+
+    def extract(self, texts):
+        """Extract skills from an iterable of texts
+
+        Returns the skill list of every document plus the number of documents
+        each skill appears in.
+        """
+        document_skills = []
+        skill_counts = Counter()
+
+        for skills in self.iter_extract(texts):
+            document_skills.append(skills)
+            skill_counts.update(skills)
+
+        return {
+            'document_skills': document_skills,
+            'skill_counts': skill_counts,
+            'total_documents': len(document_skills)
+        }
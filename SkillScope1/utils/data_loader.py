@@ -2,277 +2,417 @@ import pandas as pd
 import numpy as np
 import os
 import sys
+from itertools import chain
+
+from dataset_service import sync_postings_store
+from postings_store import PostingsStore, get_postings_store
+
+# Lookup tables for the mock data generator
+COMPANIES = [
+    "Google", "Microsoft", "Amazon", "Apple", "Meta", "Netflix", "Tesla",
+    "Goldman Sachs", "JPMorgan", "Bank of America", "Citigroup",
+    "Johnson & Johnson", "Pfizer", "Moderna", "CVS Health",
+    "McKinsey", "BCG", "Deloitte", "PwC", "EY"
+]
+
+INDUSTRIES = ["Technology", "Finance", "Healthcare", "Consulting"]
+
+# Companies hiring in each industry, as slices of COMPANIES
+INDUSTRY_COMPANIES = {
+    "Technology": COMPANIES[:7],
+    "Finance": COMPANIES[7:11],
+    "Healthcare": COMPANIES[11:15],
+    "Consulting": COMPANIES[15:]
+}
+
+INDUSTRY_ROLES = {
+    "Technology": [
+        "Software Engineer", "Data Scientist", "Machine Learning Engineer",
+        "DevOps Engineer", "Frontend Developer", "Backend Developer",
+        "Full Stack Developer", "Data Analyst", "Product Manager",
+        "UI/UX Designer", "Security Engineer", "Cloud Engineer"
+    ],
+    "Finance": [
+        "Financial Analyst", "Investment Banker", "Risk Analyst",
+        "Quantitative Analyst", "Portfolio Manager", "Trading Analyst",
+        "Credit Analyst", "Financial Consultant", "Compliance Officer"
+    ],
+    "Healthcare": [
+        "Data Analyst", "Healthcare Consultant", "Clinical Research Associate",
+        "Biostatistician", "Health Informatics Specialist", "Medical Coder",
+        "Healthcare Data Scientist", "Clinical Data Manager"
+    ],
+    "Consulting": [
+        "Management Consultant", "Strategy Consultant", "Business Analyst",
+        "Operations Consultant", "IT Consultant", "Digital Transformation Consultant"
+    ]
+}
+
+LOCATIONS = [
+    "San Francisco, CA", "New York, NY", "Seattle, WA", "Austin, TX",
+    "Boston, MA", "Chicago, IL", "Los Angeles, CA", "Remote"
+]
+
+EXPERIENCE_LEVELS = ["Entry Level", "Mid Level", "Senior Level", "Executive Level"]
+EXPERIENCE_WEIGHTS = [0.3, 0.4, 0.25, 0.05]
+
+ROLE_BASE_SALARIES = {
+    # Technology roles
+    "Software Engineer": 120000,
+    "Data Scientist": 130000,
+    "Machine Learning Engineer": 140000,
+    "DevOps Engineer": 125000,
+    "Frontend Developer": 110000,
+    "Backend Developer": 115000,
+    "Full Stack Developer": 120000,
+    "Product Manager": 140000,
+    "UI/UX Designer": 95000,
+    "Security Engineer": 130000,
+    "Cloud Engineer": 125000,
+    
+    # Finance roles
+    "Financial Analyst": 80000,
+    "Investment Banker": 150000,
+    "Risk Analyst": 90000,
+    "Quantitative Analyst": 160000,
+    "Portfolio Manager": 180000,
+    "Trading Analyst": 140000,
+    "Credit Analyst": 85000,
+    "Financial Consultant": 100000,
+    "Compliance Officer": 95000,
+    
+    # Healthcare roles (Data Analyst is shared with Technology)
+    "Data Analyst": 75000,
+    "Healthcare Consultant": 110000,
+    "Clinical Research Associate": 85000,
+    "Biostatistician": 120000,
+    "Health Informatics Specialist": 95000,
+    "Medical Coder": 45000,
+    "Healthcare Data Scientist": 125000,
+    "Clinical Data Manager": 100000,
+    
+    # Consulting roles
+    "Management Consultant": 120000,
+    "Strategy Consultant": 130000,
+    "Business Analyst": 85000,
+    "Operations Consultant": 110000,
+    "IT Consultant": 105000,
+    "Digital Transformation Consultant": 125000
+}
+
+# Consulting stays at base
+INDUSTRY_SALARY_MULTIPLIERS = {"Technology": 1.1, "Finance": 1.15, "Healthcare": 0.95}
+
+ROLE_SKILLS = {
+    # Technology roles
+    "Software Engineer": ["Python", "Java", "JavaScript", "Git", "SQL", "React", "Node.js", "Docker", "AWS"],
+    "Data Scientist": ["Python", "R", "SQL", "Machine Learning", "Pandas", "NumPy", "Scikit-learn", "TensorFlow", "Statistics"],
+    "Machine Learning Engineer": ["Python", "TensorFlow", "PyTorch", "Docker", "Kubernetes", "MLOps", "Git", "Linux", "Cloud Platforms"],
+    "DevOps Engineer": ["Docker", "Kubernetes", "AWS", "Linux", "Python", "Terraform", "Jenkins", "Monitoring", "CI/CD"],
+    "Frontend Developer": ["JavaScript", "React", "HTML", "CSS", "TypeScript", "Vue.js", "Webpack", "Git"],
+    "Backend Developer": ["Python", "Java", "Node.js", "SQL", "NoSQL", "REST APIs", "Microservices", "Docker"],
+    "Full Stack Developer": ["JavaScript", "React", "Node.js", "Python", "SQL", "MongoDB", "Git", "AWS"],
+    "Product Manager": ["Analytics", "SQL", "A/B Testing", "Product Strategy", "Agile", "User Research"],
+    "UI/UX Designer": ["Figma", "Adobe XD", "Sketch", "Prototyping", "User Research", "Design Thinking"],
+    "Security Engineer": ["Network Security", "Penetration Testing", "SIEM", "Incident Response", "Risk Assessment"],
+    "Cloud Engineer": ["AWS", "Azure", "GCP", "Terraform", "Docker", "Kubernetes", "Linux", "Networking"],
+    
+    # Finance roles
+    "Financial Analyst": ["Excel", "SQL", "Financial Modeling", "VBA", "Bloomberg", "Python", "Statistics"],
+    "Investment Banker": ["Excel", "PowerPoint", "Financial Modeling", "Valuation", "M&A", "Bloomberg"],
+    "Risk Analyst": ["Excel", "SQL", "Python", "R", "Risk Management", "Statistics", "Monte Carlo"],
+    "Quantitative Analyst": ["Python", "R", "C++", "MATLAB", "Statistics", "Machine Learning", "Financial Modeling"],
+    "Portfolio Manager": ["Excel", "Bloomberg", "Python", "Risk Management", "Asset Allocation", "Performance Analysis"],
+    "Trading Analyst": ["Excel", "Bloomberg", "Python", "Market Analysis", "Technical Analysis", "Risk Management"],
+    "Credit Analyst": ["Excel", "SQL", "Credit Analysis", "Financial Modeling", "Risk Assessment"],
+    "Financial Consultant": ["Excel", "Financial Planning", "Client Management", "Investment Analysis"],
+    "Compliance Officer": ["Regulatory Knowledge", "Risk Assessment", "Audit", "Documentation"],
+    
+    # Healthcare roles (Data Analyst is shared with Technology)
+    "Data Analyst": ["SQL", "Python", "R", "Excel", "Tableau", "Healthcare Data", "Statistics"],
+    "Healthcare Consultant": ["Healthcare Knowledge", "Data Analysis", "Process Improvement", "Project Management"],
+    "Clinical Research Associate": ["Clinical Trials", "GCP", "Data Management", "Regulatory Knowledge"],
+    "Biostatistician": ["R", "SAS", "Python", "Clinical Statistics", "Study Design", "Statistical Analysis"],
+    "Health Informatics Specialist": ["Healthcare IT", "EHR Systems", "Data Analysis", "SQL", "Healthcare Standards"],
+    "Medical Coder": ["ICD-10", "CPT", "Medical Terminology", "Healthcare Documentation"],
+    "Healthcare Data Scientist": ["Python", "R", "Machine Learning", "Healthcare Data", "Statistics", "SQL"],
+    "Clinical Data Manager": ["Clinical Data", "EDC Systems", "Data Quality", "Regulatory Standards"],
+    
+    # Consulting roles
+    "Management Consultant": ["Strategy", "Business Analysis", "PowerPoint", "Excel", "Problem Solving"],
+    "Strategy Consultant": ["Strategic Planning", "Market Analysis", "Financial Modeling", "PowerPoint", "Excel"],
+    "Business Analyst": ["Business Analysis", "SQL", "Excel", "Process Mapping", "Requirements Gathering"],
+    "Operations Consultant": ["Operations Management", "Process Improvement", "Lean Six Sigma", "Data Analysis"],
+    "IT Consultant": ["IT Strategy", "System Analysis", "Project Management", "Technology Assessment"],
+    "Digital Transformation Consultant": ["Digital Strategy", "Change Management", "Technology Assessment", "Business Analysis"]
+}
+
+DEFAULT_ROLE_SKILLS = ["Communication", "Problem Solving", "Teamwork"]
+
+# Common industry skills, each added with 50% chance
+INDUSTRY_EXTRA_SKILLS = {
+    "Technology": ["Agile", "Scrum", "Git", "Linux"],
+    "Finance": ["Excel", "Financial Analysis", "Bloomberg", "Risk Management"],
+    "Healthcare": ["Healthcare Compliance", "HIPAA", "Medical Knowledge"],
+    "Consulting": ["Client Management", "Presentation Skills", "Strategic Thinking"]
+}
+
+# General professional skills, each added with 30% chance
+GENERAL_SKILLS = ["Communication", "Leadership", "Project Management", "Analytical Thinking", "Problem Solving"]
+
+
+def _base_salary(role, industry):
+    """Base salary for a role and industry combination"""
+    return int(ROLE_BASE_SALARIES.get(role, 80000) * INDUSTRY_SALARY_MULTIPLIERS.get(industry, 1))
+
+
+def _role_skills(role, industry):
+    """A role's own skills and the optional skills it may gain
+
+    Returns (skills, optional, thresholds): an optional skill is added when
+    a uniform draw exceeds its threshold.
+    """
+    skills = ROLE_SKILLS.get(role, DEFAULT_ROLE_SKILLS)
+    optional = []
+    thresholds = []
+    for extras, threshold in [(INDUSTRY_EXTRA_SKILLS[industry], 0.5), (GENERAL_SKILLS, 0.7)]:
+        for skill in extras:
+            if skill not in skills and skill not in optional:
+                optional.append(skill)
+                thresholds.append(threshold)
+    return skills, optional, thresholds
+
+
+def _text_array(values):
+    """Lookup array of strings, in pandas' default string dtype so take needs no conversion"""
+    return pd.Series(values).array
+
+
+def _build_generator_tables():
+    """Array lookup tables over every (industry, role) slot"""
+    slots = [(industry, role) for industry in INDUSTRIES for role in INDUSTRY_ROLES[industry]]
+    role_counts = np.array([len(INDUSTRY_ROLES[industry]) for industry in INDUSTRIES])
+    company_counts = np.array([len(INDUSTRY_COMPANIES[industry]) for industry in INDUSTRIES])
+    slot_skills = [_role_skills(role, industry) for industry, role in slots]
+    
+    # Padded (slot x optional skill) thresholds; padding is 2 so it is never drawn
+    width = max(len(optional) for _, optional, _ in slot_skills)
+    thresholds = np.full((len(slots), width), 2.0)
+    for i, (_, _, slot_thresholds) in enumerate(slot_skills):
+        thresholds[i, :len(slot_thresholds)] = slot_thresholds
+    
+    return {
+        'industries': _text_array(INDUSTRIES),
+        'roles': _text_array([role for _, role in slots]),
+        'role_offsets': np.concatenate([[0], np.cumsum(role_counts)[:-1]]),
+        'role_counts': role_counts,
+        'companies': _text_array([company for industry in INDUSTRIES for company in INDUSTRY_COMPANIES[industry]]),
+        'company_offsets': np.concatenate([[0], np.cumsum(company_counts)[:-1]]),
+        'company_counts': company_counts,
+        'base_salaries': np.array([_base_salary(role, industry) for industry, role in slots]),
+        'locations': _text_array(LOCATIONS),
+        'experience_levels': _text_array(EXPERIENCE_LEVELS),
+        'role_skills': [skills for skills, _, _ in slot_skills],
+        'optional_skills': [optional for _, optional, _ in slot_skills],
+        'thresholds': thresholds
+    }
+
+
+GENERATOR_TABLES = _build_generator_tables()
+
+
+# Posting columns carried into the skills table behind the summaries
+SKILLS_TABLE_COLUMNS = ['industry', 'salary_min', 'salary_max']
+
+
+def build_skills_table(job_data, skills_column='required_skills', columns=None, id_column='id'):
+    """Long-format table with one row per (posting_id, skill)
+    
+    posting_id is taken from id_column, or is the row position in job_data
+    when it has no such column. skill is categorical, so summaries are
+    groupbys on small integer codes. Extra columns (e.g. industry,
+    salary_max) are carried along; text columns as categoricals.
+    """
+    columns = [columns] if isinstance(columns, str) else list(columns or [])
+    
+    skill_lists = job_data[skills_column].tolist()
+    try:
+        lengths = np.fromiter(map(len, skill_lists), dtype=np.int64, count=len(skill_lists))
+    except TypeError:
+        # Missing skill lists (e.g. NaN in live data) count as empty
+        skill_lists = [skills if isinstance(skills, (list, tuple, np.ndarray)) else () for skills in skill_lists]
+        lengths = np.fromiter(map(len, skill_lists), dtype=np.int64, count=len(skill_lists))
+    positions = np.repeat(np.arange(len(skill_lists), dtype=np.int32), lengths)
+    
+    skills_table = pd.DataFrame({'posting_id': positions})
+    carried = [(id_column, 'posting_id')] if id_column in job_data.columns else []
+    for source, column in carried + [(column, column) for column in columns]:
+        values = job_data[source]
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+            skills_table[column] = values.to_numpy()[positions]
+        else:
+            codes, uniques = pd.factorize(values)
+            skills_table[column] = pd.Categorical.from_codes(codes[positions], categories=uniques)
+    
+    codes, skills = pd.factorize(np.fromiter(chain.from_iterable(skill_lists), dtype=object, count=lengths.sum()))
+    skills_table['skill'] = pd.Categorical.from_codes(codes, categories=skills)
+    return skills_table
+
+
+def count_skills(skills_table):
+    """Number of rows per skill, most frequent first and ties in alphabetical order"""
+    skill = skills_table['skill']
+    categories = skill.cat.categories
+    counts = np.bincount(skill.cat.codes.to_numpy(), minlength=len(categories))
+    
+    # Alphabetical first, then a stable sort by count keeps ties alphabetical
+    by_name = np.argsort(categories.to_numpy(dtype=str), kind='stable')
+    by_name = by_name[counts[by_name] > 0]
+    order = by_name[np.argsort(-counts[by_name], kind='stable')]
+    
+    return pd.Series(counts[order], index=pd.Index(categories[order], name='skill'), name='count')
+
 
 class DataLoader:
     """Class to handle loading and processing of job market data"""
     
-    def __init__(self):
+    def __init__(self, store_path=None, storage_format='parquet'):
         self.job_data = None
         self.skills_data = None
+        self.skills_postings = None
+        self.skills_version = None
         self.processed = False
+        
+        # Optional on-disk store; defaults to POSTINGS_STORE_PATH when set
+        if store_path is not None:
+            self.store = PostingsStore(store_path, storage_format)
+        else:
+            self.store = get_postings_store(storage_format)
     
-    def load_mock_data(self):
+    def load_mock_data(self, num_jobs=1000):
         """Load mock job posting data for demonstration"""
         # This would normally load from Kaggle datasets or APIs
         # For now, we'll create realistic mock data
         
         np.random.seed(42)  # For reproducible results
+        tables = GENERATOR_TABLES
         
-        # Define realistic job data structure
-        companies = [
-            "Google", "Microsoft", "Amazon", "Apple", "Meta", "Netflix", "Tesla",
-            "Goldman Sachs", "JPMorgan", "Bank of America", "Citigroup",
-            "Johnson & Johnson", "Pfizer", "Moderna", "CVS Health",
-            "McKinsey", "BCG", "Deloitte", "PwC", "EY"
-        ]
-        
-        industries = ["Technology", "Finance", "Healthcare", "Consulting"]
+        # Select industry, then one of its roles and companies
+        industry = np.random.randint(0, len(tables['industries']), num_jobs)
+        role = tables['role_offsets'][industry] + np.random.randint(0, tables['role_counts'][industry])
+        company = tables['company_offsets'][industry] + np.random.randint(0, tables['company_counts'][industry])
         
-        tech_roles = [
-            "Software Engineer", "Data Scientist", "Machine Learning Engineer",
-            "DevOps Engineer", "Frontend Developer", "Backend Developer",
-            "Full Stack Developer", "Data Analyst", "Product Manager",
-            "UI/UX Designer", "Security Engineer", "Cloud Engineer"
-        ]
+        # Generate realistic salary ranges based on role and industry
+        salary_min = tables['base_salaries'][role] + np.random.randint(-20000, 10000, num_jobs)
+        salary_max = salary_min + np.random.randint(20000, 60000, num_jobs)
         
-        finance_roles = [
-            "Financial Analyst", "Investment Banker", "Risk Analyst",
-            "Quantitative Analyst", "Portfolio Manager", "Trading Analyst",
-            "Credit Analyst", "Financial Consultant", "Compliance Officer"
-        ]
+        location = np.random.randint(0, len(tables['locations']), num_jobs)
+        experience = np.random.choice(len(tables['experience_levels']), size=num_jobs, p=EXPERIENCE_WEIGHTS)
         
-        healthcare_roles = [
-            "Data Analyst", "Healthcare Consultant", "Clinical Research Associate",
-            "Biostatistician", "Health Informatics Specialist", "Medical Coder",
-            "Healthcare Data Scientist", "Clinical Data Manager"
-        ]
+        # Draw the optional skills, then build one skill tuple per distinct
+        # (role, drawn skills) pattern and index it by posting. Tuples are
+        # immutable, so rows can share them, and the garbage collector never
+        # has to traverse a million per-row lists.
+        thresholds = tables['thresholds'][role]
+        drawn = np.random.random(thresholds.shape) > thresholds
+        patterns = (role << thresholds.shape[1]) + drawn @ (1 << np.arange(thresholds.shape[1]))
+        unique_patterns, pattern_index = np.unique(patterns, return_inverse=True)
+        pattern_skills = np.fromiter(
+            (self._pattern_skills(tables, pattern) for pattern in unique_patterns.tolist()),
+            dtype=object, count=len(unique_patterns)
+        )
+        required_skills = pattern_skills[pattern_index]
         
-        consulting_roles = [
-            "Management Consultant", "Strategy Consultant", "Business Analyst",
-            "Operations Consultant", "IT Consultant", "Digital Transformation Consultant"
-        ]
+        posted_days = np.random.randint(1, 90, num_jobs)
         
-        # Create job postings
-        job_postings = []
-        
-        for i in range(1000):  # Generate 1000 job postings
-            # Select industry and corresponding roles
-            industry = np.random.choice(industries)
-            
-            if industry == "Technology":
-                role = np.random.choice(tech_roles)
-                company = np.random.choice(companies[:7])  # Tech companies
-            elif industry == "Finance":
-                role = np.random.choice(finance_roles)
-                company = np.random.choice(companies[7:11])  # Finance companies
-            elif industry == "Healthcare":
-                role = np.random.choice(healthcare_roles)
-                company = np.random.choice(companies[11:15])  # Healthcare companies
-            else:  # Consulting
-                role = np.random.choice(consulting_roles)
-                company = np.random.choice(companies[15:])  # Consulting companies
-            
-            # Generate realistic salary ranges based on role and industry
-            base_salary = self._get_base_salary(role, industry)
-            salary_min = base_salary + np.random.randint(-20000, 10000)
-            salary_max = salary_min + np.random.randint(20000, 60000)
-            
-            # Generate location
-            locations = ["San Francisco, CA", "New York, NY", "Seattle, WA", "Austin, TX",
-                        "Boston, MA", "Chicago, IL", "Los Angeles, CA", "Remote"]
-            location = np.random.choice(locations)
-            
-            # Generate experience level
-            experience_levels = ["Entry Level", "Mid Level", "Senior Level", "Executive Level"]
-            experience_weights = [0.3, 0.4, 0.25, 0.05]
-            experience = np.random.choice(experience_levels, p=experience_weights)
-            
-            job_postings.append({
-                'id': i + 1,
-                'title': role,
-                'company': company,
-                'industry': industry,
-                'location': location,
-                'salary_min': max(salary_min, 40000),  # Minimum floor
-                'salary_max': salary_max,
-                'experience_level': experience,
-                'required_skills': self._get_skills_for_role(role, industry),
-                'posted_date': pd.Timestamp.now() - pd.Timedelta(days=np.random.randint(1, 90))
-            })
-        
-        self.job_data = pd.DataFrame(job_postings)
+        self.job_data = pd.DataFrame({
+            'id': np.arange(1, num_jobs + 1),
+            'title': tables['roles'].take(role),
+            'company': tables['companies'].take(company),
+            'industry': tables['industries'].take(industry),
+            'location': tables['locations'].take(location),
+            'salary_min': np.maximum(salary_min, 40000),  # Minimum floor
+            'salary_max': salary_max,
+            'experience_level': tables['experience_levels'].take(experience),
+            'required_skills': required_skills,
+            'posted_date': pd.Timestamp.now().to_datetime64() - posted_days.astype('timedelta64[D]')
+        })
+        self.skills_data = None
         self.processed = True
         return self.job_data
     
-    def _get_base_salary(self, role, industry):
-        """Get base salary for role and industry combination"""
-        salary_mapping = {
-            # Technology roles
-            "Software Engineer": 120000,
-            "Data Scientist": 130000,
-            "Machine Learning Engineer": 140000,
-            "DevOps Engineer": 125000,
-            "Frontend Developer": 110000,
-            "Backend Developer": 115000,
-            "Full Stack Developer": 120000,
-            "Data Analyst": 85000,
-            "Product Manager": 140000,
-            "UI/UX Designer": 95000,
-            "Security Engineer": 130000,
-            "Cloud Engineer": 125000,
-            
-            # Finance roles
-            "Financial Analyst": 80000,
-            "Investment Banker": 150000,
-            "Risk Analyst": 90000,
-            "Quantitative Analyst": 160000,
-            "Portfolio Manager": 180000,
-            "Trading Analyst": 140000,
-            "Credit Analyst": 85000,
-            "Financial Consultant": 100000,
-            "Compliance Officer": 95000,
-            
-            # Healthcare roles
-            "Data Analyst": 75000,
-            "Healthcare Consultant": 110000,
-            "Clinical Research Associate": 85000,
-            "Biostatistician": 120000,
-            "Health Informatics Specialist": 95000,
-            "Medical Coder": 45000,
-            "Healthcare Data Scientist": 125000,
-            "Clinical Data Manager": 100000,
-            
-            # Consulting roles
-            "Management Consultant": 120000,
-            "Strategy Consultant": 130000,
-            "Business Analyst": 85000,
-            "Operations Consultant": 110000,
-            "IT Consultant": 105000,
-            "Digital Transformation Consultant": 125000
-        }
-        
-        base = salary_mapping.get(role, 80000)
-        
-        # Industry multipliers
-        if industry == "Technology":
-            base *= 1.1
-        elif industry == "Finance":
-            base *= 1.15
-        elif industry == "Healthcare":
-            base *= 0.95
-        # Consulting stays at base
-        
-        return int(base)
+    @staticmethod
+    def _pattern_skills(tables, pattern):
+        """Skill tuple of a (role, drawn optional skills) pattern"""
+        width = tables['thresholds'].shape[1]
+        role = pattern >> width
+        optional = tables['optional_skills'][role]
+        return tuple(tables['role_skills'][role]) + tuple(optional[j] for j in range(len(optional)) if pattern >> j & 1)
     
-    def _get_skills_for_role(self, role, industry):
-        """Get realistic skills for a given role and industry"""
-        skill_mapping = {
-            # Technology roles
-            "Software Engineer": ["Python", "Java", "JavaScript", "Git", "SQL", "React", "Node.js", "Docker", "AWS"],
-            "Data Scientist": ["Python", "R", "SQL", "Machine Learning", "Pandas", "NumPy", "Scikit-learn", "TensorFlow", "Statistics"],
-            "Machine Learning Engineer": ["Python", "TensorFlow", "PyTorch", "Docker", "Kubernetes", "MLOps", "Git", "Linux", "Cloud Platforms"],
-            "DevOps Engineer": ["Docker", "Kubernetes", "AWS", "Linux", "Python", "Terraform", "Jenkins", "Monitoring", "CI/CD"],
-            "Frontend Developer": ["JavaScript", "React", "HTML", "CSS", "TypeScript", "Vue.js", "Webpack", "Git"],
-            "Backend Developer": ["Python", "Java", "Node.js", "SQL", "NoSQL", "REST APIs", "Microservices", "Docker"],
-            "Full Stack Developer": ["JavaScript", "React", "Node.js", "Python", "SQL", "MongoDB", "Git", "AWS"],
-            "Data Analyst": ["SQL", "Python", "Excel", "Tableau", "Power BI", "Statistics", "Data Visualization"],
-            "Product Manager": ["Analytics", "SQL", "A/B Testing", "Product Strategy", "Agile", "User Research"],
-            "UI/UX Designer": ["Figma", "Adobe XD", "Sketch", "Prototyping", "User Research", "Design Thinking"],
-            "Security Engineer": ["Network Security", "Penetration Testing", "SIEM", "Incident Response", "Risk Assessment"],
-            "Cloud Engineer": ["AWS", "Azure", "GCP", "Terraform", "Docker", "Kubernetes", "Linux", "Networking"],
-            
-            # Finance roles
-            "Financial Analyst": ["Excel", "SQL", "Financial Modeling", "VBA", "Bloomberg", "Python", "Statistics"],
-            "Investment Banker": ["Excel", "PowerPoint", "Financial Modeling", "Valuation", "M&A", "Bloomberg"],
-            "Risk Analyst": ["Excel", "SQL", "Python", "R", "Risk Management", "Statistics", "Monte Carlo"],
-            "Quantitative Analyst": ["Python", "R", "C++", "MATLAB", "Statistics", "Machine Learning", "Financial Modeling"],
-            "Portfolio Manager": ["Excel", "Bloomberg", "Python", "Risk Management", "Asset Allocation", "Performance Analysis"],
-            "Trading Analyst": ["Excel", "Bloomberg", "Python", "Market Analysis", "Technical Analysis", "Risk Management"],
-            "Credit Analyst": ["Excel", "SQL", "Credit Analysis", "Financial Modeling", "Risk Assessment"],
-            "Financial Consultant": ["Excel", "Financial Planning", "Client Management", "Investment Analysis"],
-            "Compliance Officer": ["Regulatory Knowledge", "Risk Assessment", "Audit", "Documentation"],
-            
-            # Healthcare roles
-            "Data Analyst": ["SQL", "Python", "R", "Excel", "Tableau", "Healthcare Data", "Statistics"],
-            "Healthcare Consultant": ["Healthcare Knowledge", "Data Analysis", "Process Improvement", "Project Management"],
-            "Clinical Research Associate": ["Clinical Trials", "GCP", "Data Management", "Regulatory Knowledge"],
-            "Biostatistician": ["R", "SAS", "Python", "Clinical Statistics", "Study Design", "Statistical Analysis"],
-            "Health Informatics Specialist": ["Healthcare IT", "EHR Systems", "Data Analysis", "SQL", "Healthcare Standards"],
-            "Medical Coder": ["ICD-10", "CPT", "Medical Terminology", "Healthcare Documentation"],
-            "Healthcare Data Scientist": ["Python", "R", "Machine Learning", "Healthcare Data", "Statistics", "SQL"],
-            "Clinical Data Manager": ["Clinical Data", "EDC Systems", "Data Quality", "Regulatory Standards"],
-            
-            # Consulting roles
-            "Management Consultant": ["Strategy", "Business Analysis", "PowerPoint", "Excel", "Problem Solving"],
-            "Strategy Consultant": ["Strategic Planning", "Market Analysis", "Financial Modeling", "PowerPoint", "Excel"],
-            "Business Analyst": ["Business Analysis", "SQL", "Excel", "Process Mapping", "Requirements Gathering"],
-            "Operations Consultant": ["Operations Management", "Process Improvement", "Lean Six Sigma", "Data Analysis"],
-            "IT Consultant": ["IT Strategy", "System Analysis", "Project Management", "Technology Assessment"],
-            "Digital Transformation Consultant": ["Digital Strategy", "Change Management", "Technology Assessment", "Business Analysis"]
-        }
-        
-        base_skills = skill_mapping.get(role, ["Communication", "Problem Solving", "Teamwork"])
-        
-        # Add some randomization and industry-specific skills
-        skills = base_skills.copy()
+    def sync_store(self):
+        """Rewrite the postings store if the shared job_postings dataset changed
         
-        # Add common industry skills
-        if industry == "Technology":
-            additional_skills = ["Agile", "Scrum", "Git", "Linux"]
-        elif industry == "Finance":
-            additional_skills = ["Excel", "Financial Analysis", "Bloomberg", "Risk Management"]
-        elif industry == "Healthcare":
-            additional_skills = ["Healthcare Compliance", "HIPAA", "Medical Knowledge"]
-        else:  # Consulting
-            additional_skills = ["Client Management", "Presentation Skills", "Strategic Thinking"]
-        
-        # Randomly add some additional skills
-        for skill in additional_skills:
-            if skill not in skills and np.random.random() > 0.5:
-                skills.append(skill)
+        Returns the dataset's version. Reads never sync, so call this (or run
+        the postings_store build step) before reading from a store.
+        """
+        return sync_postings_store(self.store)
+    
+    def get_job_data(self, columns=None, industries=None, months=None, filters=None):
+        """Get processed job data
         
-        # Add some general professional skills randomly
-        general_skills = ["Communication", "Leadership", "Project Management", "Analytical Thinking", "Problem Solving"]
-        for skill in general_skills:
-            if skill not in skills and np.random.random() > 0.7:
-                skills.append(skill)
+        With a postings store, the postings last synced to it are read from
+        disk; the arguments select columns, partitions and rows as in
+        PostingsStore.read. Without one the loader's own mock postings are
+        returned in full.
+        """
+        if self.store is not None:
+            return self.store.read(columns=columns, industries=industries, months=months, filters=filters)
         
-        return skills
-    
-    def get_job_data(self):
-        """Get processed job data"""
         if not self.processed:
             return self.load_mock_data()
         return self.job_data
     
+    def get_skills_table(self):
+        """Long-format (posting_id, skill) table of the postings get_job_data serves
+        
+        Built once per version of those postings: the version stamped on the
+        store by its last sync, or each load of the loader's own mock postings.
+        """
+        if self.store is not None:
+            version = self.store.get_version()
+            if self.skills_data is None or self.skills_version != version:
+                self.skills_postings = self.store.read(columns=['id', 'required_skills'] + SKILLS_TABLE_COLUMNS)
+                self.skills_data = build_skills_table(self.skills_postings, columns=SKILLS_TABLE_COLUMNS)
+                self.skills_version = version
+        elif self.skills_data is None:
+            self.skills_postings = self.get_job_data()
+            self.skills_data = build_skills_table(self.skills_postings, columns=SKILLS_TABLE_COLUMNS)
+        return self.skills_data
+    
     def get_skills_summary(self):
         """Get summary of skills across all jobs"""
-        if not self.processed:
-            self.load_mock_data()
-        
-        all_skills = []
-        for skills in self.job_data['required_skills']:
-            all_skills.extend(skills)
-        
-        skills_df = pd.Series(all_skills).value_counts().reset_index()
-        skills_df.columns = ['skill', 'count']
-        skills_df['percentage'] = skills_df['count'] / len(self.job_data) * 100
+        skills_df = count_skills(self.get_skills_table()).reset_index()
+        skills_df['percentage'] = skills_df['count'] / len(self.skills_postings) * 100
         
         return skills_df
     
     def get_industry_skills(self, industry):
         """Get skills specific to an industry"""
-        if not self.processed:
-            self.load_mock_data()
-        
-        industry_data = self.job_data[self.job_data['industry'] == industry]
+        skills_table = self.get_skills_table()
         
-        industry_skills = []
-        for skills in industry_data['required_skills']:
-            industry_skills.extend(skills)
+        industry_postings = (self.skills_postings['industry'] == industry).sum()
         
-        skills_df = pd.Series(industry_skills).value_counts().reset_index()
-        skills_df.columns = ['skill', 'count']
-        skills_df['percentage'] = skills_df['count'] / len(industry_data) * 100
+        skills_df = count_skills(skills_table[skills_table['industry'] == industry]).reset_index()
+        skills_df['percentage'] = skills_df['count'] / industry_postings * 100
         
         return skills_df
+    
+    def get_skill_salaries(self, by=None, min_count=1):
+        """Mean and count of salary_max per skill, optionally per skill within each value of by"""
+        skills_table = self.get_skills_table()
+        keys = ['skill'] if by is None else [by, 'skill']
+        
+        salaries = skills_table.groupby(keys, observed=True)['salary_max'].agg(['mean', 'count']).reset_index()
+        for key in keys:
+            salaries[key] = salaries[key].astype(skills_table[key].cat.categories.dtype)
+        return salaries[salaries['count'] >= min_count].reset_index(drop=True)
@@ -0,0 +1,140 @@
+import hashlib
+import threading
+import time
+from collections import namedtuple
+
+import pandas as pd
+
+Dataset = namedtuple('Dataset', ['data', 'version', 'built_at', 'build_seconds', 'list_columns'])
+
+
+def content_version(df):
+    """Short hash of a DataFrame's contents, including list-valued columns"""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update('|'.join(map(str, df.columns)).encode('utf-8'))
+
+    for column in df.columns:
+        values = df[column]
+        if len(values) and isinstance(values.iloc[0], (list, tuple)):
+            values = values.str.join('\x1f')
+        digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+class DatasetService:
+    """Process-wide cache of datasets, built once and shared by every page
+
+    Each dataset is built by its registered builder on first use and kept
+    with a content version. Callers get private copies, including copies of
+    list cells such as required_skills, so edits never reach the cached
+    frame. refresh rebuilds a dataset explicitly; nothing is rebuilt
+    implicitly.
+    """
+
+    def __init__(self):
+        self._builders = {}
+        self._datasets = {}
+        self._lock = threading.RLock()
+
+    def register(self, name, builder):
+        """Register a zero-argument builder returning a DataFrame"""
+        with self._lock:
+            self._builders[name] = builder
+
+    def _get_dataset(self, name):
+        dataset = self._datasets.get(name)
+        if dataset is not None:
+            return dataset
+
+        if name not in self._builders:
+            raise KeyError(f"No dataset registered as '{name}'")
+
+        with self._lock:
+            dataset = self._datasets.get(name)
+            if dataset is None:
+                dataset = self._build(name)
+            return dataset
+
+    def _build(self, name):
+        """Build a dataset and store it with its content version"""
+        start = time.perf_counter()
+        data = self._builders[name]()
+        dataset = Dataset(
+            data=data,
+            version=content_version(data),
+            built_at=time.time(),
+            build_seconds=time.perf_counter() - start,
+            list_columns=[column for column in data.columns if len(data) and isinstance(data[column].iloc[0], list)]
+        )
+        self._datasets[name] = dataset
+        return dataset
+
+    def get(self, name):
+        """Private copy of a dataset, building it on first use"""
+        dataset = self._get_dataset(name)
+        data = dataset.data.copy()
+
+        # DataFrame.copy keeps references to the same list objects
+        for column in dataset.list_columns:
+            data[column] = [list(values) for values in data[column]]
+        return data
+
+    def get_shared(self, name):
+        """The cached dataset itself, as a (data, version) pair, without copying
+
+        For read-only consumers such as on-disk stores; data is the frame
+        every caller shares and must not be modified.
+        """
+        dataset = self._get_dataset(name)
+        return dataset.data, dataset.version
+
+    def get_version(self, name):
+        """Content version of a dataset, e.g. as a cache key for derived results"""
+        return self._get_dataset(name).version
+
+    def refresh(self, name=None):
+        """Rebuild one or all built datasets now; returns the new version(s)"""
+        with self._lock:
+            names = [name] if name is not None else list(self._datasets)
+            return {dataset_name: self._build(dataset_name).version for dataset_name in names}
+
+    def get_stats(self):
+        """Version, size and build time of every built dataset"""
+        return pd.DataFrame([
+            {
+                'dataset': name,
+                'version': dataset.version,
+                'rows': len(dataset.data),
+                'memory_mb': dataset.data.memory_usage(deep=False).sum() / (1024 * 1024),
+                'build_seconds': dataset.build_seconds,
+                'built_at': dataset.built_at
+            }
+            for name, dataset in self._datasets.items()
+        ], columns=['dataset', 'version', 'rows', 'memory_mb', 'build_seconds', 'built_at'])
+
+
+def _build_job_postings():
+    from mock_job_data import MockJobData
+    return MockJobData().get_job_postings()
+
+
+# Service shared by every page and session in the process
+datasets = DatasetService()
+datasets.register('job_postings', _build_job_postings)
+
+
+def get_job_postings():
+    """Shared mock job postings (MockJobData.get_job_postings)"""
+    return datasets.get('job_postings')
+
+
+def sync_postings_store(store, name='job_postings'):
+    """Make an on-disk PostingsStore hold the dataset's current version
+
+    The store is rewritten only when its stamped version differs, e.g. after
+    a refresh. Returns the version.
+    """
+    data, version = datasets.get_shared(name)
+    store.sync(data, version)
+    return version
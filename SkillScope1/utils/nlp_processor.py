@@ -1,11 +1,35 @@
 import re
-import string
-from collections import Counter
-import pandas as pd
+
+from skill_matrix import SkillIncidenceMatrix
+from skill_similarity import SkillSimilarityIndex
+from text_normalizer import nlp_text_normalizer
 
 class NLPProcessor:
     """Class to handle NLP processing for job descriptions and resumes"""
     
+    # Entity patterns, one combined alternation per entity type compiled once for
+    # every processor. Text is lowercased before matching, so no IGNORECASE is
+    # needed. Every repetition is bounded, so matching stays linear in the text.
+    TECHNOLOGY_PATTERN = re.compile(
+        r'\b(\w+)(?=\s+(?:software|platform|framework|library|tool|system)\b)'
+    )
+    COMPANY_PATTERN = re.compile(
+        r'\b(?:at|employed\s+by)\s+(\w+(?:\s+\w+)?)\b'
+    )
+    EDUCATION_PATTERN = re.compile(
+        r'\b((?:\w+\s+){0,2}\w+)\s+(?:university|college|institute|school|degree|bachelor|master|phd)\b'
+    )
+    
+    # Skills of at most this many letters are also ordinary words or word
+    # fragments ("r" in "r&d", "go" in "go-to-market"), so they only count
+    # when they stand as a whole token, or a member of a '/' list, in the
+    # original text
+    SHORT_SKILL_LENGTH = 2
+    TOKEN_EDGE_PUNCTUATION = '.,;:!?()[]{}"\''
+    
+    # Separators inside a token, e.g. "vue.js" or "python-based"
+    TOKEN_SEPARATOR_PATTERN = re.compile(r'[.\-/]+')
+    
     def __init__(self):
         # Common stop words for skill extraction
         self.stop_words = {
@@ -72,70 +96,85 @@ class NLPProcessor:
         # Combine all skill sets
         self.all_skills = (self.tech_skills | self.business_skills | 
                           self.finance_skills | self.healthcare_skills)
+        
+        # Common variations of programming languages
+        self.skill_variations = {
+            'py': 'python',
+            'js': 'javascript',
+            'ts': 'typescript',
+            'cpp': 'c++',
+            'csharp': 'c#',
+        }
+        
+        # Phrase index: every skill and variation maps to its skill, looked up
+        # by n-gram so matching is a dict probe per token window
+        self.skill_index = {skill: skill for skill in self.all_skills}
+        self.skill_index.update(self.skill_variations)
+        self.skill_ngram_sizes = sorted({len(phrase.split()) for phrase in self.skill_index})
     
     def preprocess_text(self, text):
         """Clean and preprocess text for analysis"""
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove extra whitespace and newlines
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep important ones like + and #
-        text = re.sub(r'[^\w\s\+\#\.\-]', ' ', text)
-        
-        # Handle common abbreviations and variations
-        text = re.sub(r'\bc\+\+\b', 'c++', text)
-        text = re.sub(r'\bc#\b', 'c#', text)
-        text = re.sub(r'\bnode\.js\b', 'node.js', text)
-        text = re.sub(r'\basp\.net\b', 'asp.net', text)
-        
-        return text.strip()
+        # Lowercase, filter special characters (keeping + # . -) and collapse
+        # whitespace in a single pass
+        return nlp_text_normalizer.normalize(text)
     
     def extract_skills_basic(self, text):
         """Basic skill extraction using keyword matching"""
-        text = self.preprocess_text(text)
-        
+        return self._match_skills(self.preprocess_text(text), text)
+    
+    def _match_skills(self, text, original_text):
+        """Look up skills in already preprocessed text"""
         found_skills = set()
-        
-        # Look for exact skill matches
-        for skill in self.all_skills:
-            if skill in text:
-                found_skills.add(skill)
-        
-        # Look for variations and common patterns
-        words = text.split()
-        
-        # Check for programming languages with common variations
-        lang_patterns = {
-            'python': ['python', 'py'],
-            'javascript': ['javascript', 'js'],
-            'typescript': ['typescript', 'ts'],
-            'c++': ['c++', 'cpp'],
-            'c#': ['c#', 'csharp'],
-        }
-        
-        for lang, patterns in lang_patterns.items():
-            if any(pattern in text for pattern in patterns):
-                found_skills.add(lang)
-        
-        # Look for multi-word skills
-        bigrams = [' '.join(words[i:i+2]) for i in range(len(words)-1)]
-        trigrams = [' '.join(words[i:i+3]) for i in range(len(words)-2)]
-        
-        for skill in self.all_skills:
-            if len(skill.split()) == 2 and skill in bigrams:
-                found_skills.add(skill)
-            elif len(skill.split()) == 3 and skill in trigrams:
-                found_skills.add(skill)
+        whole_tokens = None
+        
+        # Tokens with sentence punctuation trimmed, so "python." still matches
+        # while "r" or "go" inside other words never do
+        words = [word.strip('.-') for word in text.split()]
+        
+        # The same tokens split on internal '.', '-' and '/', so "vue.js",
+        # "python-based" and "ms-excel" also match their longer parts
+        parts = [part for word in words for part in self.TOKEN_SEPARATOR_PATTERN.split(word) if part]
+        
+        # Look up every n-gram up to the longest skill in the phrase index
+        for tokens in ([words, parts] if parts != words else [words]):
+            for n in self.skill_ngram_sizes:
+                for i in range(len(tokens) - n + 1):
+                    phrase = ' '.join(tokens[i:i+n]) if n > 1 else tokens[i]
+                    skill = self.skill_index.get(phrase)
+                    if skill is None:
+                        continue
+                    if len(phrase) <= self.SHORT_SKILL_LENGTH:
+                        # Parts never yield short skills ("go" in "go-to-market")
+                        if tokens is parts:
+                            continue
+                        if phrase.isalpha():
+                            if whole_tokens is None:
+                                whole_tokens = self._whole_tokens(original_text)
+                            if phrase not in whole_tokens:
+                                continue
+                    found_skills.add(skill)
         
         return list(found_skills)
     
+    def _whole_tokens(self, original_text):
+        """Whitespace tokens of the original text and the members of '/' lists like "go/rust"
+        
+        Edge punctuation is trimmed from both, so "(r)" and "js/ts," count.
+        """
+        whole_tokens = set()
+        for token in original_text.lower().split():
+            token = token.strip(self.TOKEN_EDGE_PUNCTUATION)
+            whole_tokens.add(token)
+            if '/' in token:
+                whole_tokens.update(member.strip(self.TOKEN_EDGE_PUNCTUATION) for member in token.split('/'))
+        return whole_tokens
+    
     def extract_entities(self, text):
         """Extract named entities (simplified version)"""
+        original_text = text
         text = self.preprocess_text(text)
         
         entities = {
@@ -146,32 +185,16 @@ class NLPProcessor:
         }
         
         # Extract skills
-        entities['skills'] = self.extract_skills_basic(text)
+        entities['skills'] = self._match_skills(text, original_text)
         
-        # Extract technology mentions
-        tech_keywords = ['software', 'platform', 'framework', 'library', 'tool', 'system']
-        for keyword in tech_keywords:
-            pattern = rf'\b(\w+)\s+{keyword}\b'
-            matches = re.findall(pattern, text)
-            entities['technologies'].extend(matches)
+        # Extract technology mentions: the word before a technology keyword
+        entities['technologies'] = self.TECHNOLOGY_PATTERN.findall(text)
         
         # Extract company mentions (simplified)
-        company_patterns = [
-            r'\bat\s+(\w+(?:\s+\w+)?)\b',
-            r'\bworked\s+at\s+(\w+(?:\s+\w+)?)\b',
-            r'\bemployed\s+by\s+(\w+(?:\s+\w+)?)\b'
-        ]
-        
-        for pattern in company_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['companies'].extend(matches)
-        
-        # Extract education mentions
-        education_keywords = ['university', 'college', 'institute', 'school', 'degree', 'bachelor', 'master', 'phd']
-        for keyword in education_keywords:
-            pattern = rf'\b(\w+(?:\s+\w+)*)\s+{keyword}\b'
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            entities['education'].extend(matches)
+        entities['companies'] = self.COMPANY_PATTERN.findall(text)
+        
+        # Extract education mentions: up to three words before an education keyword
+        entities['education'] = self.EDUCATION_PATTERN.findall(text)
         
         # Clean up duplicates
         for key in entities:
@@ -197,17 +220,17 @@ class NLPProcessor:
         
         return metrics
     
+    def build_skill_matrix(self, texts):
+        """Extract skills from every text once into a document x skill incidence matrix"""
+        return SkillIncidenceMatrix((self.extract_skills_basic(text) for text in texts), skills=self.all_skills)
+    
     def get_skill_frequency(self, texts):
-        """Get frequency of skills across multiple texts"""
-        all_skills = []
-        
-        for text in texts:
-            skills = self.extract_skills_basic(text)
-            all_skills.extend(skills)
+        """Get frequency of skills across multiple texts
         
-        skill_freq = Counter(all_skills)
-        
-        return pd.DataFrame(list(skill_freq.items()), columns=['skill', 'frequency']).sort_values('frequency', ascending=False)
+        To answer several filters over one corpus, build the matrix once with
+        build_skill_matrix and query it with document masks instead.
+        """
+        return self.build_skill_matrix(texts).get_skill_frequency()
     
     def compare_texts(self, text1, text2):
         """Compare two texts and find similarities/differences"""
@@ -223,6 +246,25 @@ class NLPProcessor:
         
         return comparison
     
+    def build_similarity_index(self, texts):
+        """Extract skills from every text once into an index for similarity queries"""
+        return SkillSimilarityIndex(self.build_skill_matrix(texts))
+    
+    def compare_many(self, texts1, texts2=None, metric='jaccard'):
+        """Skill similarity of every text in texts1 against every text in texts2
+        
+        Returns an N x M array; with texts2 omitted, texts1 is compared with
+        itself (e.g. to cluster postings).
+        """
+        queries = self.build_skill_matrix(texts1)
+        index = SkillSimilarityIndex(queries if texts2 is None else self.build_skill_matrix(texts2))
+        
+        return index.similarity(queries, metric=metric)
+    
+    def find_similar_texts(self, texts, index, k=10, metric='jaccard'):
+        """Top-k most similar indexed texts for each text, as (indices, scores) arrays"""
+        return index.top_k(self.build_skill_matrix(texts), k=k, metric=metric)
+    
     def suggest_skill_improvements(self, user_skills, target_skills):
         """Suggest skill improvements based on target requirements"""
         user_skills_set = set(skill.lower() for skill in user_skills)
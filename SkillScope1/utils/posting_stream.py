@@ -0,0 +1,126 @@
+import csv
+import json
+import os
+from collections import Counter
+from itertools import islice, tee
+
+import pandas as pd
+
+from batch_extractor import BatchSkillExtractor
+
+
+class PostingStream:
+    """Stream skill extraction over JSONL or CSV posting dumps with bounded memory
+
+    Postings are read chunk by chunk, skills are yielded as soon as each chunk
+    is extracted and running skill counts are kept in ``skill_counts``. With a
+    checkpoint path the stream records its position after every chunk and a
+    new stream over the same file resumes from there.
+    """
+
+    def __init__(self, path, file_format=None, text_fields=('description', 'title'),
+                 id_field='id', chunk_size=1000, checkpoint_path=None,
+                 batch_extractor=None):
+        self.path = path
+        self.file_format = file_format or self._detect_format(path)
+        self.text_fields = text_fields
+        self.id_field = id_field
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.batch_extractor = batch_extractor or BatchSkillExtractor(workers=1)
+
+        # Byte offset for JSONL, rows consumed for CSV
+        self.position = 0
+        self.documents_processed = 0
+        self.skill_counts = Counter()
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            self._load_checkpoint()
+
+    @staticmethod
+    def _detect_format(path):
+        """Infer the dump format from the file extension"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension in ('.jsonl', '.ndjson'):
+            return 'jsonl'
+        if extension == '.csv':
+            return 'csv'
+        raise ValueError(f"Cannot infer posting format from '{path}'; pass file_format='jsonl' or 'csv'")
+
+    def _iter_jsonl(self):
+        """Yield (position, record) pairs from a JSONL file"""
+        with open(self.path, 'rb') as f:
+            f.seek(self.position)
+            while True:
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    yield f.tell(), json.loads(line)
+
+    def _iter_csv(self):
+        """Yield (position, record) pairs from a CSV file"""
+        with open(self.path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            rows = islice(reader, self.position, None)
+            for position, record in enumerate(rows, start=self.position + 1):
+                yield position, record
+
+    def _iter_chunks(self):
+        """Group records into chunks of at most chunk_size"""
+        records = self._iter_jsonl() if self.file_format == 'jsonl' else self._iter_csv()
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                break
+            yield chunk
+
+    def _record_text(self, record):
+        """Join the text fields of a posting into one document"""
+        return ' '.join(str(record.get(field) or '') for field in self.text_fields)
+
+    def extract(self):
+        """Yield (posting_id, skills) for every posting not yet processed"""
+        # tee buffers at most the one chunk currently being extracted
+        chunks, text_source = tee(self._iter_chunks())
+        texts = ([self._record_text(record) for _, record in chunk] for chunk in text_source)
+
+        for chunk, chunk_skills in zip(chunks, self.batch_extractor.iter_extract_chunks(texts)):
+            for (_, record), skills in zip(chunk, chunk_skills):
+                posting_id = record.get(self.id_field, self.documents_processed + 1)
+                self.documents_processed += 1
+                self.skill_counts.update(skills)
+                yield posting_id, skills
+
+            self.position = chunk[-1][0]
+            if self.checkpoint_path:
+                self._save_checkpoint()
+
+    def get_skill_frequency(self):
+        """Running skill frequencies as a DataFrame, like NLPProcessor.get_skill_frequency"""
+        return pd.DataFrame(list(self.skill_counts.items()), columns=['skill', 'frequency']).sort_values('frequency', ascending=False)
+
+    def _save_checkpoint(self):
+        """Atomically persist position and running counts"""
+        state = {
+            'path': os.path.abspath(self.path),
+            'position': self.position,
+            'documents_processed': self.documents_processed,
+            'skill_counts': dict(self.skill_counts)
+        }
+        temp_path = self.checkpoint_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _load_checkpoint(self):
+        """Restore position and running counts from a previous run"""
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            state = json.load(f)
+
+        if state.get('path') != os.path.abspath(self.path):
+            raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to {state.get('path')}, not {self.path}")
+
+        self.position = state['position']
+        self.documents_processed = state['documents_processed']
+        self.skill_counts = Counter(state['skill_counts'])
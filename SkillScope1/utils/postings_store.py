@@ -0,0 +1,292 @@
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from urllib.parse import unquote
+
+try:
+    import fcntl
+except ImportError:  # Windows: syncs are serialized within the process only
+    fcntl = None
+
+import pandas as pd
+
+STORAGE_FORMATS = {'parquet': 'parquet', 'arrow': 'ipc'}
+PARTITION_COLUMNS = ['industry', 'posted_month']
+
+# Directory of the shared store; unset keeps postings in memory only
+POSTINGS_STORE_ENV = 'POSTINGS_STORE_PATH'
+
+# Content version of the postings in a store; pyarrow skips '_' files when reading
+VERSION_FILE = '_version'
+
+# Sibling directories holding synced generations of a store, e.g.
+# postings.gen-<nanoseconds>-<id> so names sort by age, and the ones still
+# being written
+GENERATION_INFIX = '.gen-'
+BUILD_INFIX = '.build-'
+
+# Sibling file locked while a store is synced or cleared, e.g. postings.lock
+LOCK_SUFFIX = '.lock'
+
+# Serializes syncs between threads; the lock file serializes processes
+_sync_lock = threading.Lock()
+
+
+def _require_pyarrow():
+    """Import pyarrow on first use so it stays an optional dependency"""
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "The postings store needs pyarrow. Install it with 'pip install pyarrow'."
+        ) from e
+    return pa, ds, pq
+
+
+class PostingsStore:
+    """Columnar on-disk store of job postings
+
+    Postings are written as Parquet (or Arrow IPC) files in a hive-style
+    directory tree partitioned by industry and posted month, e.g.
+    industry=Finance/posted_month=2024-05/. Reads project only the requested
+    columns and push industry/month predicates down to the directory level,
+    so only matching partitions are opened; other predicates are applied
+    while scanning the files. sync keeps a store in step with a versioned
+    source. A sync writes the new postings to a sibling generation
+    directory and then atomically repoints the store path, a symlink, at
+    it, so readers see either the old or the new postings, never a partial
+    write.
+    """
+
+    def __init__(self, path, storage_format='parquet'):
+        if storage_format not in STORAGE_FORMATS:
+            raise ValueError(f"Unknown storage format '{storage_format}', expected one of {list(STORAGE_FORMATS)}")
+
+        self.path = path
+        self.storage_format = storage_format
+
+    def _partitioning(self):
+        pa, ds, _ = _require_pyarrow()
+        schema = pa.schema([(column, pa.string()) for column in PARTITION_COLUMNS])
+        return ds.partitioning(schema, flavor='hive')
+
+    def exists(self):
+        """Whether postings have been written to the store"""
+        return os.path.isdir(self.path) and any(name.startswith('industry=') for name in os.listdir(self.path))
+
+    def write(self, job_data):
+        """Write postings, replacing the partitions they cover
+
+        The store no longer matches any synced version afterwards, so its
+        version stamp is removed.
+        """
+        version_path = os.path.join(self.path, VERSION_FILE)
+        if os.path.exists(version_path):
+            os.remove(version_path)
+
+        self._write_to(self.path, job_data)
+
+    def _write_to(self, directory, job_data):
+        pa, ds, _ = _require_pyarrow()
+
+        job_data = job_data.copy(deep=False)
+        job_data['posted_month'] = pd.to_datetime(job_data['posted_date']).dt.strftime('%Y-%m')
+
+        ds.write_dataset(
+            pa.Table.from_pandas(job_data, preserve_index=False),
+            directory,
+            format=STORAGE_FORMATS[self.storage_format],
+            partitioning=self._partitioning(),
+            existing_data_behavior='delete_matching'
+        )
+
+    def get_version(self):
+        """Version stamped by the last sync, or None"""
+        try:
+            with open(os.path.join(self.path, VERSION_FILE)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def _locked(self):
+        """Hold the store's lock file, so one process at a time swaps or removes generations"""
+        with _sync_lock, open(os.path.abspath(self.path) + LOCK_SUFFIX, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def clear(self):
+        """Remove all postings and the version stamp"""
+        with self._locked():
+            if os.path.islink(self.path):
+                os.remove(self.path)
+                self._remove_generations()
+                return
+            if not os.path.isdir(self.path):
+                return
+            for name in os.listdir(self.path):
+                if name.startswith('industry='):
+                    shutil.rmtree(os.path.join(self.path, name))
+            version_path = os.path.join(self.path, VERSION_FILE)
+            if os.path.exists(version_path):
+                os.remove(version_path)
+
+    def sync(self, job_data, version):
+        """Replace the store's contents with job_data unless already at version
+
+        The postings and version stamp are written to a new generation
+        directory, and the store path, a symlink, is then repointed at it in
+        a single rename. Syncs hold the store's lock file, so concurrent
+        processes write a version once. The generation just replaced is kept
+        for readers still scanning it; older ones are removed. Returns whether
+        the store was rewritten.
+        """
+        if self.exists() and self.get_version() == version:
+            return False
+
+        with self._locked():
+            # Another process may have synced while this one waited
+            if self.exists() and self.get_version() == version:
+                return False
+
+            path = os.path.abspath(self.path)
+            token = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+            build_path = path + BUILD_INFIX + token
+            generation_path = path + GENERATION_INFIX + token
+            try:
+                os.makedirs(build_path)
+                self._write_to(build_path, job_data)
+                with open(os.path.join(build_path, VERSION_FILE), 'w') as f:
+                    f.write(version)
+                os.rename(build_path, generation_path)
+            except BaseException:
+                shutil.rmtree(build_path, ignore_errors=True)
+                raise
+
+            if os.path.isdir(path) and not os.path.islink(path):
+                # A store written in place before generations: move it aside once,
+                # named to sort before every synced generation
+                os.rename(path, path + GENERATION_INFIX + '0' * 20 + '-legacy')
+
+            # Point a fresh link at the new generation and swap it in atomically
+            link_path = path + BUILD_INFIX + token + '.link'
+            os.symlink(os.path.basename(generation_path), link_path)
+            os.replace(link_path, path)
+
+            self._remove_generations(keep_previous=True)
+            return True
+
+    def _remove_generations(self, keep_previous=False):
+        """Delete generation directories older than the one the store links to
+
+        With no link every generation is removed. keep_previous spares the
+        newest of the older ones. Callers hold the store's lock.
+        """
+        path = os.path.abspath(self.path)
+        parent, prefix = os.path.dirname(path), os.path.basename(path) + GENERATION_INFIX
+        current = os.path.basename(os.readlink(path)) if os.path.islink(path) else None
+
+        older = sorted(
+            name for name in os.listdir(parent)
+            if name.startswith(prefix) and (current is None or name < current)
+        )
+        if keep_previous and current is not None:
+            older = older[:-1]
+        for name in older:
+            shutil.rmtree(os.path.join(parent, name), ignore_errors=True)
+
+    def _dataset(self):
+        _, ds, _ = _require_pyarrow()
+        # Resolve the link once so a sync during the scan cannot mix generations
+        return ds.dataset(os.path.realpath(self.path), format=STORAGE_FORMATS[self.storage_format],
+                          partitioning=self._partitioning())
+
+    def read(self, columns=None, industries=None, months=None, filters=None):
+        """Read postings as a DataFrame
+
+        columns limits the columns read. industries and months (as 'YYYY-MM')
+        select partitions. filters adds row predicates as a list of
+        (column, op, value) tuples, e.g. [('salary_max', '>=', 100000)].
+        """
+        pa, ds, pq = _require_pyarrow()
+        dataset = self._dataset()
+
+        def isin(column, values):
+            # Typed from the schema so an empty selection matches no rows
+            return ds.field(column).isin(pa.array(list(values), type=dataset.schema.field(column).type))
+
+        expression = None
+        conditions = []
+        if industries is not None:
+            conditions.append(isin('industry', industries))
+        if months is not None:
+            conditions.append(isin('posted_month', months))
+        for column, op, value in filters or []:
+            if op == 'in':
+                conditions.append(isin(column, value))
+            elif op == 'not in':
+                conditions.append(~isin(column, value))
+            else:
+                conditions.append(pq.filters_to_expression([(column, op, value)]))
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        if columns is not None:
+            columns = list(columns)
+        table = dataset.to_table(columns=columns, filter=expression)
+
+        job_data = table.to_pandas()
+        # Keep list columns as Python lists, as the in-memory generators produce,
+        # with object dtype even when no rows match
+        for name in table.column_names:
+            if str(table.schema.field(name).type).startswith('list'):
+                job_data[name] = pd.Series(table.column(name).to_pylist(), index=job_data.index, dtype=object)
+
+        if columns is None and 'posted_month' in job_data.columns:
+            job_data = job_data.drop(columns='posted_month')
+        return job_data
+
+    def get_partition_values(self, column):
+        """Distinct values of a partition column, read from the directory tree only"""
+        if column not in PARTITION_COLUMNS:
+            raise ValueError(f"'{column}' is not a partition column, expected one of {PARTITION_COLUMNS}")
+        if not self.exists():
+            return []
+
+        # Walk down to the column's level, e.g. industry=*/posted_month=*
+        directories = [os.path.realpath(self.path)]
+        for level in PARTITION_COLUMNS[:PARTITION_COLUMNS.index(column) + 1]:
+            prefix = level + '='
+            directories = [
+                os.path.join(directory, name)
+                for directory in directories
+                for name in os.listdir(directory)
+                if name.startswith(prefix)
+            ]
+
+        return sorted({unquote(os.path.basename(directory)[len(column) + 1:]) for directory in directories})
+
+
+def get_postings_store(storage_format='parquet'):
+    """Store configured through POSTINGS_STORE_PATH, or None when unset"""
+    path = os.getenv(POSTINGS_STORE_ENV)
+    return PostingsStore(path, storage_format) if path else None
+
+
+if __name__ == "__main__":
+    # Build step: python utils/postings_store.py <path> [parquet|arrow]
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data'))
+    from dataset_service import sync_postings_store
+
+    output_path = sys.argv[1]
+    output_format = sys.argv[2] if len(sys.argv) > 2 else 'parquet'
+
+    version = sync_postings_store(PostingsStore(output_path, output_format))
+    print(f"Synced the shared job postings (version {version}) to {output_path}")
@@ -0,0 +1,166 @@
+import threading
+import time
+import tracemalloc
+
+import pandas as pd
+
+
+class ResourceRegistry:
+    """Thread-safe, process-wide registry of shared resources
+
+    Each resource is built by its factory on first use and then handed to
+    every caller, so all Streamlit sessions in the process share one copy.
+    Construction time and the memory allocated while building are recorded
+    per resource. The memory figure is approximate: it is the process-wide
+    change in traced memory during the build, so allocations made by other
+    threads at the same time are counted too.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._resources = {}
+        self._stats = {}
+        # Reentrant so a factory can get the resources it depends on
+        self._lock = threading.RLock()
+
+    def register(self, name, factory):
+        """Register a zero-argument factory under name"""
+        with self._lock:
+            self._factories[name] = factory
+
+    def get(self, name):
+        """Get the shared resource, building it on first use"""
+        resource = self._resources.get(name)
+        if resource is not None:
+            return resource
+
+        if name not in self._factories:
+            raise KeyError(f"No resource registered as '{name}'")
+
+        # Concurrent first calls build once; builds are serialized so memory
+        # tracing of one build never overlaps another
+        with self._lock:
+            resource = self._resources.get(name)
+            if resource is None:
+                resource = self._build(name)
+            return resource
+
+    def _build(self, name):
+        """Build a resource, recording its construction time and memory
+
+        Tracing is only on while the build runs, but it covers every thread,
+        so concurrent requests pay its overhead and add to the figure.
+        """
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+
+        try:
+            resource = self._factories[name]()
+        finally:
+            build_seconds = time.perf_counter() - start
+            memory_after = tracemalloc.get_traced_memory()[0]
+            if started_tracing:
+                tracemalloc.stop()
+
+        self._stats[name] = {
+            'resource': name,
+            'build_seconds': build_seconds,
+            'process_memory_mb': max(memory_after - memory_before, 0) / (1024 * 1024),
+            'built_at': time.time()
+        }
+        self._resources[name] = resource
+        return resource
+
+    def is_built(self, name):
+        """Whether the resource has already been built in this process"""
+        return name in self._resources
+
+    def reset(self, name=None):
+        """Drop one or all built resources so the next get rebuilds them"""
+        with self._lock:
+            names = [name] if name is not None else list(self._resources)
+            for resource_name in names:
+                self._resources.pop(resource_name, None)
+                self._stats.pop(resource_name, None)
+
+    def get_stats(self):
+        """Construction time and approximate, process-wide memory growth of every built resource"""
+        return pd.DataFrame(list(self._stats.values()), columns=['resource', 'build_seconds', 'process_memory_mb', 'built_at'])
+
+
+def _build_skill_taxonomy():
+    from skill_taxonomy import SkillTaxonomy
+    return SkillTaxonomy()
+
+
+def _build_skill_extractor():
+    from skill_extractor import SkillExtractor
+    return SkillExtractor()
+
+
+def _build_batch_skill_extractor():
+    from batch_extractor import BatchSkillExtractor
+    return BatchSkillExtractor(extractor=registry.get('skill_extractor'))
+
+
+def _build_nlp_processor():
+    from nlp_processor import NLPProcessor
+    return NLPProcessor()
+
+
+# Registry shared by every page and session in the process
+registry = ResourceRegistry()
+registry.register('skill_taxonomy', _build_skill_taxonomy)
+registry.register('skill_extractor', _build_skill_extractor)
+registry.register('batch_skill_extractor', _build_batch_skill_extractor)
+registry.register('nlp_processor', _build_nlp_processor)
+
+
+def get_skill_taxonomy():
+    """Shared SkillTaxonomy"""
+    return registry.get('skill_taxonomy')
+
+
+# Version of the postings the shared co-occurrence graph was learned from
+_skill_graph_version = None
+_skill_graph_lock = threading.Lock()
+
+
+def sync_skill_graph(name='job_postings'):
+    """Relearn the co-occurrence graph behind suggest_related_skills when the postings change
+
+    The graph is rebuilt from the dataset's required_skills only when its
+    version differs from the one last learned, e.g. after datasets.refresh.
+    Returns that version.
+    """
+    global _skill_graph_version
+    from dataset_service import datasets
+    from skill_extractor import SkillExtractor
+
+    data, version = datasets.get_shared(name)
+    with _skill_graph_lock:
+        if version != _skill_graph_version:
+            SkillExtractor.rebuild_skill_graph(data['required_skills'])
+            _skill_graph_version = version
+    return version
+
+
+def get_skill_extractor():
+    """Shared SkillExtractor, with its co-occurrence graph in step with the shared postings"""
+    # Synced outside the factory so the postings are neither copied nor
+    # counted in the extractor's memory
+    sync_skill_graph()
+    return registry.get('skill_extractor')
+
+
+def get_batch_skill_extractor():
+    """Shared BatchSkillExtractor over every core, reusing one worker pool across batches"""
+    return registry.get('batch_skill_extractor')
+
+
+def get_nlp_processor():
+    """Shared NLPProcessor"""
+    return registry.get('nlp_processor')
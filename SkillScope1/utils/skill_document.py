@@ -0,0 +1,45 @@
+import re
+from bisect import bisect_right
+
+from skill_matcher import has_word_boundaries
+
+_TOKEN_PATTERN = re.compile(r'\S+')
+
+
+class SkillDocument:
+    """Pre-analyzed text shared by every skill extraction pass
+
+    The document is built once from preprocessed (lowercase) text. Tokens,
+    their offsets and the raw variation hits of the matcher are computed up
+    front so the extraction passes and the confidence scorer never re-scan,
+    re-split or re-lowercase the text.
+    """
+
+    def __init__(self, text, matcher):
+        # Lowercase buffer every pass works on
+        self.text = text
+
+        # Whitespace tokens with their (start, end) offsets into self.text
+        self.tokens = []
+        self.offsets = []
+        for match in _TOKEN_PATTERN.finditer(text):
+            self.tokens.append(match.group())
+            self.offsets.append(match.span())
+
+        # Every occurrence of every variation, with or without word boundaries,
+        # ordered by end offset as the automaton reports them
+        self.hits = list(matcher.iter_matches(text, word_boundaries=False))
+        self._hit_ends = [hit[1] for hit in self.hits]
+
+    def hits_within(self, start, end):
+        """Return the hits lying entirely inside text[start:end]"""
+        first = bisect_right(self._hit_ends, start)
+        last = bisect_right(self._hit_ends, end)
+        return [hit for hit in self.hits[first:last] if hit[0] >= start]
+
+    def bounded_hits(self):
+        """Yield the hits that sit on word boundaries"""
+        text = self.text
+        for hit in self.hits:
+            if has_word_boundaries(text, hit[0], hit[1]):
+                yield hit
@@ -1,355 +1,532 @@
 import re
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict, namedtuple
+import numpy as np
 import pandas as pd
 
+from extraction_cache import ExtractionCache, text_digest
+from skill_index import DEFAULT_MAX_NGRAM, get_skill_index
+from skill_document import SkillDocument
+from skill_graph import SkillCooccurrenceGraph
+from text_normalizer import skill_text_normalizer
+
+# Comprehensive skill database with variations
+SKILL_DATABASE = {
+    # Programming Languages
+    'python': ['python', 'py', 'python3', 'python2'],
+    'java': ['java', 'java8', 'java11', 'openjdk'],
+    'javascript': ['javascript', 'js', 'ecmascript', 'es6', 'es5'],
+    'typescript': ['typescript', 'ts'],
+    'c++': ['c++', 'cpp', 'c plus plus'],
+    'c#': ['c#', 'csharp', 'c sharp'],
+    'php': ['php', 'php7', 'php8'],
+    'ruby': ['ruby', 'ruby on rails', 'ror'],
+    'go': ['go', 'golang'],
+    'swift': ['swift', 'swift ui'],
+    'kotlin': ['kotlin'],
+    'scala': ['scala'],
+    'r': ['r programming', 'r language'],
+    'sql': ['sql', 'mysql', 'postgresql', 'sqlite', 't-sql'],
+    'html': ['html', 'html5'],
+    'css': ['css', 'css3'],
+    'matlab': ['matlab'],
+    'perl': ['perl'],
+    'shell': ['bash', 'shell scripting', 'powershell'],
+    
+    # Web Frameworks
+    'react': ['react', 'reactjs', 'react.js'],
+    'angular': ['angular', 'angularjs'],
+    'vue': ['vue', 'vuejs', 'vue.js'],
+    'django': ['django'],
+    'flask': ['flask'],
+    'express': ['express', 'express.js', 'expressjs'],
+    'node.js': ['node.js', 'nodejs', 'node js'],
+    'spring': ['spring', 'spring boot', 'spring framework'],
+    'laravel': ['laravel'],
+    'asp.net': ['asp.net', 'aspnet'],
+    'jquery': ['jquery'],
+    'bootstrap': ['bootstrap'],
+    
+    # Databases
+    'mysql': ['mysql'],
+    'postgresql': ['postgresql', 'postgres'],
+    'mongodb': ['mongodb', 'mongo'],
+    'redis': ['redis'],
+    'elasticsearch': ['elasticsearch', 'elastic search'],
+    'cassandra': ['cassandra'],
+    'dynamodb': ['dynamodb', 'dynamo db'],
+    'oracle': ['oracle database', 'oracle db'],
+    'sql server': ['sql server', 'microsoft sql server'],
+    'sqlite': ['sqlite'],
+    
+    # Cloud Platforms
+    'aws': ['aws', 'amazon web services'],
+    'azure': ['microsoft azure', 'azure'],
+    'gcp': ['google cloud', 'gcp', 'google cloud platform'],
+    'heroku': ['heroku'],
+    'digital ocean': ['digital ocean', 'digitalocean'],
+    
+    # DevOps & Tools
+    'docker': ['docker', 'containerization'],
+    'kubernetes': ['kubernetes', 'k8s'],
+    'jenkins': ['jenkins'],
+    'git': ['git', 'github', 'gitlab', 'bitbucket'],
+    'terraform': ['terraform'],
+    'ansible': ['ansible'],
+    'linux': ['linux', 'ubuntu', 'centos', 'rhel'],
+    'unix': ['unix'],
+    'ci/cd': ['ci/cd', 'continuous integration', 'continuous deployment'],
+    
+    # Data Science & ML
+    'machine learning': ['machine learning', 'ml', 'artificial intelligence', 'ai'],
+    'deep learning': ['deep learning', 'neural networks'],
+    'tensorflow': ['tensorflow', 'tf'],
+    'pytorch': ['pytorch'],
+    'keras': ['keras'],
+    'scikit-learn': ['scikit-learn', 'sklearn'],
+    'pandas': ['pandas'],
+    'numpy': ['numpy'],
+    'matplotlib': ['matplotlib'],
+    'seaborn': ['seaborn'],
+    'jupyter': ['jupyter', 'jupyter notebook'],
+    'spark': ['apache spark', 'pyspark'],
+    'hadoop': ['hadoop'],
+    'kafka': ['apache kafka', 'kafka'],
+    
+    # Business Intelligence
+    'tableau': ['tableau'],
+    'power bi': ['power bi', 'powerbi'],
+    'qlik': ['qlikview', 'qlik sense'],
+    'looker': ['looker'],
+    'sas': ['sas'],
+    'spss': ['spss'],
+    
+    # Design Tools
+    'figma': ['figma'],
+    'sketch': ['sketch'],
+    'adobe xd': ['adobe xd', 'xd'],
+    'photoshop': ['photoshop', 'adobe photoshop'],
+    'illustrator': ['illustrator', 'adobe illustrator'],
+    'indesign': ['indesign', 'adobe indesign'],
+    
+    # Project Management
+    'agile': ['agile', 'agile methodology'],
+    'scrum': ['scrum'],
+    'kanban': ['kanban'],
+    'jira': ['jira'],
+    'confluence': ['confluence'],
+    'trello': ['trello'],
+    'asana': ['asana'],
+    'project management': ['project management', 'pm'],
+    
+    # Microsoft Office
+    'excel': ['excel', 'microsoft excel'],
+    'powerpoint': ['powerpoint', 'microsoft powerpoint'],
+    'word': ['microsoft word', 'ms word'],
+    'outlook': ['outlook', 'microsoft outlook'],
+    'sharepoint': ['sharepoint'],
+    
+    # Finance & Analytics
+    'bloomberg': ['bloomberg terminal', 'bloomberg'],
+    'reuters': ['reuters', 'refinitiv'],
+    'factset': ['factset'],
+    'matlab': ['matlab'],
+    'r': ['r programming', 'r statistical'],
+    'stata': ['stata'],
+    'financial modeling': ['financial modeling', 'financial models'],
+    'valuation': ['valuation', 'dcf', 'comparable analysis'],
+    'risk management': ['risk management', 'var', 'stress testing'],
+    
+    # Soft Skills
+    'leadership': ['leadership', 'team leadership', 'leading teams'],
+    'communication': ['communication', 'verbal communication', 'written communication'],
+    'problem solving': ['problem solving', 'analytical thinking'],
+    'teamwork': ['teamwork', 'collaboration'],
+    'time management': ['time management', 'organization'],
+    'critical thinking': ['critical thinking', 'analytical skills'],
+    'creativity': ['creativity', 'innovation'],
+    'adaptability': ['adaptability', 'flexibility'],
+    
+    # Industry Specific
+    'healthcare': ['hipaa', 'hl7', 'epic', 'cerner', 'clinical research'],
+    'cybersecurity': ['cybersecurity', 'information security', 'penetration testing', 'ethical hacking'],
+    'networking': ['networking', 'tcp/ip', 'vpn', 'firewall', 'routing'],
+    'mobile development': ['ios development', 'android development', 'mobile apps'],
+    'game development': ['unity', 'unreal engine', 'game development'],
+    'blockchain': ['blockchain', 'ethereum', 'smart contracts', 'cryptocurrency']
+}
+
+# Categories used by categorize_skills
+SKILL_CATEGORIES = {
+    'Programming Languages': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'swift', 'kotlin', 'scala', 'r', 'matlab'],
+    'Web Technologies': ['html', 'css', 'react', 'angular', 'vue', 'django', 'flask', 'express', 'node.js', 'spring', 'laravel', 'asp.net', 'jquery', 'bootstrap'],
+    'Databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'dynamodb', 'oracle', 'sql server', 'sqlite'],
+    'Cloud & DevOps': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'terraform', 'ansible', 'linux', 'ci/cd'],
+    'Data Science & ML': ['machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'spark', 'hadoop'],
+    'Business Intelligence': ['tableau', 'power bi', 'excel', 'qlik', 'looker', 'sas', 'spss'],
+    'Design Tools': ['figma', 'sketch', 'adobe xd', 'photoshop', 'illustrator'],
+    'Project Management': ['agile', 'scrum', 'kanban', 'jira', 'project management'],
+    'Soft Skills': ['leadership', 'communication', 'problem solving', 'teamwork', 'time management', 'critical thinking']
+}
+
+# Curated skill relationships used until co-occurrence data has been ingested
+SKILL_RELATIONSHIPS = {
+    'python': ['pandas', 'numpy', 'django', 'flask', 'machine learning', 'tensorflow'],
+    'javascript': ['react', 'angular', 'vue', 'node.js', 'typescript'],
+    'react': ['redux', 'next.js', 'javascript', 'typescript'],
+    'machine learning': ['python', 'r', 'tensorflow', 'pytorch', 'scikit-learn'],
+    'aws': ['docker', 'kubernetes', 'terraform', 'linux'],
+    'sql': ['mysql', 'postgresql', 'database design', 'data analysis'],
+    'docker': ['kubernetes', 'linux', 'ci/cd', 'aws'],
+    'data analysis': ['python', 'r', 'sql', 'tableau', 'excel']
+}
+
+def _build_category_index(categories):
+    """Invert categories into a lowercased skill -> category map; the first category listing a skill wins"""
+    index = {}
+    for category, category_skills in categories.items():
+        for skill in category_skills:
+            index.setdefault(skill.lower(), category)
+    return index
+
+SKILL_CATEGORY_INDEX = _build_category_index(SKILL_CATEGORIES)
+
+# A skill mention with offsets into the preprocessed text and the pass that found it
+SkillSpan = namedtuple('SkillSpan', ['start', 'end', 'skill', 'variation', 'method'])
+
 class SkillExtractor:
     """Advanced skill extraction from job descriptions and resumes"""
     
-    def __init__(self):
-        # Comprehensive skill database with variations
-        self.skill_database = {
-            # Programming Languages
-            'python': ['python', 'py', 'python3', 'python2'],
-            'java': ['java', 'java8', 'java11', 'openjdk'],
-            'javascript': ['javascript', 'js', 'ecmascript', 'es6', 'es5'],
-            'typescript': ['typescript', 'ts'],
-            'c++': ['c++', 'cpp', 'c plus plus'],
-            'c#': ['c#', 'csharp', 'c sharp'],
-            'php': ['php', 'php7', 'php8'],
-            'ruby': ['ruby', 'ruby on rails', 'ror'],
-            'go': ['go', 'golang'],
-            'swift': ['swift', 'swift ui'],
-            'kotlin': ['kotlin'],
-            'scala': ['scala'],
-            'r': ['r programming', 'r language'],
-            'sql': ['sql', 'mysql', 'postgresql', 'sqlite', 't-sql'],
-            'html': ['html', 'html5'],
-            'css': ['css', 'css3'],
-            'matlab': ['matlab'],
-            'perl': ['perl'],
-            'shell': ['bash', 'shell scripting', 'powershell'],
-            
-            # Web Frameworks
-            'react': ['react', 'reactjs', 'react.js'],
-            'angular': ['angular', 'angularjs'],
-            'vue': ['vue', 'vuejs', 'vue.js'],
-            'django': ['django'],
-            'flask': ['flask'],
-            'express': ['express', 'express.js', 'expressjs'],
-            'node.js': ['node.js', 'nodejs', 'node js'],
-            'spring': ['spring', 'spring boot', 'spring framework'],
-            'laravel': ['laravel'],
-            'asp.net': ['asp.net', 'aspnet'],
-            'jquery': ['jquery'],
-            'bootstrap': ['bootstrap'],
-            
-            # Databases
-            'mysql': ['mysql'],
-            'postgresql': ['postgresql', 'postgres'],
-            'mongodb': ['mongodb', 'mongo'],
-            'redis': ['redis'],
-            'elasticsearch': ['elasticsearch', 'elastic search'],
-            'cassandra': ['cassandra'],
-            'dynamodb': ['dynamodb', 'dynamo db'],
-            'oracle': ['oracle database', 'oracle db'],
-            'sql server': ['sql server', 'microsoft sql server'],
-            'sqlite': ['sqlite'],
-            
-            # Cloud Platforms
-            'aws': ['aws', 'amazon web services'],
-            'azure': ['microsoft azure', 'azure'],
-            'gcp': ['google cloud', 'gcp', 'google cloud platform'],
-            'heroku': ['heroku'],
-            'digital ocean': ['digital ocean', 'digitalocean'],
-            
-            # DevOps & Tools
-            'docker': ['docker', 'containerization'],
-            'kubernetes': ['kubernetes', 'k8s'],
-            'jenkins': ['jenkins'],
-            'git': ['git', 'github', 'gitlab', 'bitbucket'],
-            'terraform': ['terraform'],
-            'ansible': ['ansible'],
-            'linux': ['linux', 'ubuntu', 'centos', 'rhel'],
-            'unix': ['unix'],
-            'ci/cd': ['ci/cd', 'continuous integration', 'continuous deployment'],
-            
-            # Data Science & ML
-            'machine learning': ['machine learning', 'ml', 'artificial intelligence', 'ai'],
-            'deep learning': ['deep learning', 'neural networks'],
-            'tensorflow': ['tensorflow', 'tf'],
-            'pytorch': ['pytorch'],
-            'keras': ['keras'],
-            'scikit-learn': ['scikit-learn', 'sklearn'],
-            'pandas': ['pandas'],
-            'numpy': ['numpy'],
-            'matplotlib': ['matplotlib'],
-            'seaborn': ['seaborn'],
-            'jupyter': ['jupyter', 'jupyter notebook'],
-            'spark': ['apache spark', 'pyspark'],
-            'hadoop': ['hadoop'],
-            'kafka': ['apache kafka', 'kafka'],
-            
-            # Business Intelligence
-            'tableau': ['tableau'],
-            'power bi': ['power bi', 'powerbi'],
-            'qlik': ['qlikview', 'qlik sense'],
-            'looker': ['looker'],
-            'sas': ['sas'],
-            'spss': ['spss'],
-            
-            # Design Tools
-            'figma': ['figma'],
-            'sketch': ['sketch'],
-            'adobe xd': ['adobe xd', 'xd'],
-            'photoshop': ['photoshop', 'adobe photoshop'],
-            'illustrator': ['illustrator', 'adobe illustrator'],
-            'indesign': ['indesign', 'adobe indesign'],
-            
-            # Project Management
-            'agile': ['agile', 'agile methodology'],
-            'scrum': ['scrum'],
-            'kanban': ['kanban'],
-            'jira': ['jira'],
-            'confluence': ['confluence'],
-            'trello': ['trello'],
-            'asana': ['asana'],
-            'project management': ['project management', 'pm'],
-            
-            # Microsoft Office
-            'excel': ['excel', 'microsoft excel'],
-            'powerpoint': ['powerpoint', 'microsoft powerpoint'],
-            'word': ['microsoft word', 'ms word'],
-            'outlook': ['outlook', 'microsoft outlook'],
-            'sharepoint': ['sharepoint'],
-            
-            # Finance & Analytics
-            'bloomberg': ['bloomberg terminal', 'bloomberg'],
-            'reuters': ['reuters', 'refinitiv'],
-            'factset': ['factset'],
-            'matlab': ['matlab'],
-            'r': ['r programming', 'r statistical'],
-            'stata': ['stata'],
-            'financial modeling': ['financial modeling', 'financial models'],
-            'valuation': ['valuation', 'dcf', 'comparable analysis'],
-            'risk management': ['risk management', 'var', 'stress testing'],
-            
-            # Soft Skills
-            'leadership': ['leadership', 'team leadership', 'leading teams'],
-            'communication': ['communication', 'verbal communication', 'written communication'],
-            'problem solving': ['problem solving', 'analytical thinking'],
-            'teamwork': ['teamwork', 'collaboration'],
-            'time management': ['time management', 'organization'],
-            'critical thinking': ['critical thinking', 'analytical skills'],
-            'creativity': ['creativity', 'innovation'],
-            'adaptability': ['adaptability', 'flexibility'],
-            
-            # Industry Specific
-            'healthcare': ['hipaa', 'hl7', 'epic', 'cerner', 'clinical research'],
-            'cybersecurity': ['cybersecurity', 'information security', 'penetration testing', 'ethical hacking'],
-            'networking': ['networking', 'tcp/ip', 'vpn', 'firewall', 'routing'],
-            'mobile development': ['ios development', 'android development', 'mobile apps'],
-            'game development': ['unity', 'unreal engine', 'game development'],
-            'blockchain': ['blockchain', 'ethereum', 'smart contracts', 'cryptocurrency']
-        }
-        
-        # Create reverse mapping for faster lookup
-        self.variation_to_skill = {}
-        for skill, variations in self.skill_database.items():
-            for variation in variations:
-                self.variation_to_skill[variation.lower()] = skill
+    # Common contexts where skills appear, compiled once for every extractor.
+    # Documents are lowercased before matching, so no IGNORECASE is needed.
+    CONTEXT_PATTERNS = [
+        ('experience_phrase', re.compile(r'(?:experience (?:with|in)|skilled in|proficient in|knowledge of|familiar with|expertise in|worked with|using|utilize|implement|develop(?:ed|ing)?(?:\s+with)?)\s+([^,.\n]+)')),
+        ('skill_list', re.compile(r'(?:languages?|technologies?|tools?|frameworks?|platforms?|software|skills?)[:\s]+([^.\n]+)')),
+        ('programming_experience', re.compile(r'(?:programming|coding|development)\s+(?:languages?|experience)\s*[:\s]+([^.\n]+)')),
+        ('database', re.compile(r'(?:database|db)\s*[:\s]+([^.\n]+)')),
+        ('cloud', re.compile(r'(?:cloud|hosting)\s*[:\s]+([^.\n]+)'))
+    ]
+    
+    # Fragments between list delimiters inside a context match
+    CONTEXT_PART_PATTERN = re.compile(r'[^,;/&\n\r]+')
+    
+    # Confidence contributed by each extraction pass, in column order
+    EXTRACTION_METHODS = ['pattern', 'context', 'ngram']
+    METHOD_WEIGHTS = np.array([0.8, 0.6, 0.4])
+    
+    # Extraction results shared by every extractor in the process
+    result_cache = ExtractionCache(maxsize=4096, ttl=3600)
+    
+    # Skill co-occurrence learned from ingested postings, shared by every extractor
+    skill_graph = SkillCooccurrenceGraph()
+    
+    def __init__(self, max_ngram=DEFAULT_MAX_NGRAM, use_cache=True):
+        self.max_ngram = max_ngram
+        self.use_cache = use_cache
+        
+        # Per-instance copy so rebuild_index can be used after local edits
+        self.skill_database = {skill: list(variations) for skill, variations in SKILL_DATABASE.items()}
+        
+        self.rebuild_index()
+        
+        # Per-rule counters showing which context patterns earn their cost.
+        # A shared extractor serves many threads, so updates hold a lock
+        self.context_rule_matches = Counter()
+        self.context_rule_skills = Counter()
+        self._stats_lock = threading.Lock()
+    
+    def __getstate__(self):
+        # Locks cannot be pickled, e.g. when handing the extractor to pool workers
+        state = self.__dict__.copy()
+        del state['_stats_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
+    
+    def rebuild_index(self):
+        """Rebuild lookup structures after skill_database has been changed"""
+        # Compiled once per process and shared read-only by every extractor
+        # with the same database
+        index = get_skill_index(self.skill_database, self.max_ngram)
+        
+        # Reverse mapping, multi-pattern automaton and n-gram trie
+        self.variation_to_skill = index.variation_to_skill
+        self.matcher = index.matcher
+        self.ngram_index = index.ngram_index
+        
+        # Cached results are keyed by this, so a changed database never reuses stale entries
+        self.database_fingerprint = index.fingerprint
+    
+    def _cache_key(self, kind, text):
+        """Build the result cache key for a text"""
+        return (kind, self.database_fingerprint, text_digest(text))
+    
+    def get_cache_stats(self):
+        """Get hit/miss statistics of the shared result cache"""
+        return self.result_cache.get_stats()
     
     def extract_skills_from_text(self, text):
         """Extract skills from text using pattern matching and NLP"""
         if not text:
             return []
         
-        # Preprocess text
-        text = self.preprocess_text(text)
+        if self.use_cache:
+            cache_key = self._cache_key('skills', text)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                skills, rule_counts = cached
+                self._record_context_rules(rule_counts)
+                return list(skills)
+        
+        # Preprocess and tokenize once for all passes
+        doc = self.analyze_text(text)
         
         found_skills = set()
         
         # Method 1: Direct pattern matching
-        skills_from_patterns = self._extract_by_patterns(text)
+        skills_from_patterns = self._extract_by_patterns(doc)
         found_skills.update(skills_from_patterns)
         
         # Method 2: Context-based extraction
-        skills_from_context = self._extract_by_context(text)
+        skills_from_context, rule_counts = self._extract_by_context(doc)
+        self._record_context_rules(rule_counts)
         found_skills.update(skills_from_context)
         
         # Method 3: N-gram analysis
-        skills_from_ngrams = self._extract_by_ngrams(text)
+        skills_from_ngrams = self._extract_by_ngrams(doc)
         found_skills.update(skills_from_ngrams)
         
-        return list(found_skills)
+        result = list(found_skills)
+        if self.use_cache:
+            # Stored with the rule counts so cache hits still show in get_context_rule_stats
+            self.result_cache.put(cache_key, (tuple(result), rule_counts))
+        
+        return result
     
     def preprocess_text(self, text):
         """Clean and preprocess text"""
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Handle special cases
-        text = re.sub(r'\bc\+\+\b', 'c++', text)
-        text = re.sub(r'\bc#\b', 'c#', text)
-        text = re.sub(r'\bnode\.js\b', 'node.js', text)
-        text = re.sub(r'\basp\.net\b', 'asp.net', text)
-        
-        return text
+        # Lowercase and collapse whitespace in a single pass
+        return skill_text_normalizer.normalize(text)
     
-    def _extract_by_patterns(self, text):
+    def analyze_text(self, text):
+        """Preprocess text into a SkillDocument shared by the extraction passes"""
+        return SkillDocument(self.preprocess_text(text), self.matcher)
+    
+    def _extract_by_patterns(self, doc):
         """Extract skills using direct pattern matching"""
-        found_skills = set()
-        
-        for variation, skill in self.variation_to_skill.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(variation) + r'\b'
-            if re.search(pattern, text):
-                found_skills.add(skill)
-        
-        return found_skills
+        # Word boundaries avoid partial matches
+        return {skill for _, _, _, skill in doc.bounded_hits()}
     
-    def _extract_by_context(self, text):
-        """Extract skills based on context clues"""
-        found_skills = set()
-        
-        # Common contexts where skills appear
-        context_patterns = [
-            r'(?:experience (?:with|in)|skilled in|proficient in|knowledge of|familiar with|expertise in|worked with|using|utilize|implement|develop(?:ed|ing)?(?:\s+with)?)\s+([^,.\n]+)',
-            r'(?:languages?|technologies?|tools?|frameworks?|platforms?|software|skills?)[:\s]+([^.\n]+)',
-            r'(?:programming|coding|development)\s+(?:languages?|experience)\s*[:\s]+([^.\n]+)',
-            r'(?:database|db)\s*[:\s]+([^.\n]+)',
-            r'(?:cloud|hosting)\s*[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in context_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
+    def _extract_by_context(self, doc):
+        """Extract skills based on context clues, with the per-rule counts of _context_hits"""
+        found_hits, rule_counts = self._context_hits(doc)
+        return {skill for _, _, _, skill in found_hits}, rule_counts
+    
+    def _context_hits(self, doc):
+        """Find the variation hits that sit inside context-clue fragments
+        
+        Also returns (rule, matches, skills found) for every rule that
+        matched, for the caller to record with _record_context_rules.
+        """
+        found_hits = set()
+        text = doc.text
+        rule_counts = []
+        
+        for rule, pattern in self.CONTEXT_PATTERNS:
+            rule_skills = set()
+            matches = 0
+            
+            for match in pattern.finditer(text):
+                matches += 1
+                
                 # Split by common delimiters and check each part
-                parts = re.split(r'[,;/&\n\r]+', match)
-                for part in parts:
-                    part = part.strip()
-                    if part and len(part) > 1:
-                        # Check if this part contains any known skill variations
-                        for variation, skill in self.variation_to_skill.items():
-                            if variation in part.lower():
-                                found_skills.add(skill)
-        
-        return found_skills
-    
-    def _extract_by_ngrams(self, text):
+                fragment_start, fragment_end = match.span(1)
+                for part in self.CONTEXT_PART_PATTERN.finditer(text, fragment_start, fragment_end):
+                    part_text = part.group()
+                    stripped = part_text.strip()
+                    if len(stripped) > 1:
+                        # Known variations inside this part, read from the document's hit table
+                        start = part.start() + len(part_text) - len(part_text.lstrip())
+                        for hit in doc.hits_within(start, start + len(stripped)):
+                            found_hits.add(hit)
+                            rule_skills.add(hit[3])
+            
+            if matches:
+                rule_counts.append((rule, matches, len(rule_skills)))
+        
+        return found_hits, tuple(rule_counts)
+    
+    def _record_context_rules(self, rule_counts):
+        """Merge one extraction's per-rule counts into the shared counters"""
+        with self._stats_lock:
+            for rule, matches, skills_found in rule_counts:
+                self.context_rule_matches[rule] += matches
+                self.context_rule_skills[rule] += skills_found
+    
+    def get_context_rule_stats(self):
+        """Get how often each context rule matched and how many skills it found
+        
+        Texts served from the result cache are counted again, as if extracted.
+        """
+        rules = [rule for rule, _ in self.CONTEXT_PATTERNS]
+        with self._stats_lock:
+            matches = [self.context_rule_matches[rule] for rule in rules]
+            skills_found = [self.context_rule_skills[rule] for rule in rules]
+        return pd.DataFrame({'rule': rules, 'matches': matches, 'skills_found': skills_found})
+    
+    def _extract_by_ngrams(self, doc):
         """Extract skills using n-gram analysis"""
-        found_skills = set()
+        # Walks token ids through the trie instead of joining every window
+        return self.ngram_index.find_skills(doc.tokens)
+    
+    def extract_skill_spans(self, text):
+        """Extract every skill mention with its offsets and the pass that found it
+
+        Offsets index into preprocess_text(text). Each pass reports its own
+        spans, so the same mention can appear once per method.
+        """
+        if not text:
+            return []
+        
+        spans, rule_counts = self._collect_spans(self.analyze_text(text))
+        self._record_context_rules(rule_counts)
+        return spans
+    
+    def _collect_spans(self, doc):
+        """Gather the spans of all three extraction passes for a document, with the context rule counts"""
+        spans = [SkillSpan(start, end, skill, variation, 'pattern')
+                 for start, end, variation, skill in doc.bounded_hits()]
         
-        words = text.split()
+        context_hits, rule_counts = self._context_hits(doc)
+        spans.extend(SkillSpan(start, end, skill, variation, 'context')
+                     for start, end, variation, skill in sorted(context_hits))
         
-        # Check unigrams, bigrams, and trigrams
-        for n in range(1, 4):
-            ngrams = [' '.join(words[i:i+n]) for i in range(len(words)-n+1)]
-            for ngram in ngrams:
-                if ngram in self.variation_to_skill:
-                    found_skills.add(self.variation_to_skill[ngram])
+        for first, last, skill in self.ngram_index.iter_matches(doc.tokens):
+            start, end = doc.offsets[first][0], doc.offsets[last][1]
+            spans.append(SkillSpan(start, end, skill, doc.text[start:end], 'ngram'))
         
-        return found_skills
+        return spans, rule_counts
     
     def extract_skills_with_confidence(self, text):
         """Extract skills with confidence scores"""
         if not text:
             return []
         
-        text = self.preprocess_text(text)
-        skill_scores = defaultdict(float)
+        if self.use_cache:
+            cache_key = self._cache_key('confidence', text)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                scores, rule_counts = cached
+                self._record_context_rules(rule_counts)
+                return list(scores)
         
-        # Pattern matching (high confidence)
-        pattern_skills = self._extract_by_patterns(text)
-        for skill in pattern_skills:
-            skill_scores[skill] += 0.8
+        doc = self.analyze_text(text)
+        spans, rule_counts = self._collect_spans(doc)
+        self._record_context_rules(rule_counts)
+        result = self._score_spans(spans, len(doc.text))
         
-        # Context-based (medium confidence)
-        context_skills = self._extract_by_context(text)
-        for skill in context_skills:
-            skill_scores[skill] += 0.6
+        if self.use_cache:
+            self.result_cache.put(cache_key, (tuple(result), rule_counts))
+        
+        return result
+    
+    def _score_spans(self, spans, text_length):
+        """Score skills from their spans in one vectorized pass
+        
+        Each method that found a skill adds its weight (pattern 0.8, context
+        0.6, n-gram 0.4). Every distinct mention after the first adds 0.2,
+        where overlapping spans of the same skill count as one mention.
+        """
+        if not spans:
+            return []
         
-        # N-gram analysis (lower confidence)
-        ngram_skills = self._extract_by_ngrams(text)
-        for skill in ngram_skills:
-            skill_scores[skill] += 0.4
+        skills, skill_codes = np.unique([span.skill for span in spans], return_inverse=True)
+        method_codes = np.array([self.EXTRACTION_METHODS.index(span.method) for span in spans])
+        starts = np.array([span.start for span in spans])
+        ends = np.array([span.end for span in spans])
+        
+        # Which passes found each skill
+        found_by = np.zeros((len(skills), len(self.EXTRACTION_METHODS)), dtype=bool)
+        found_by[skill_codes, method_codes] = True
+        scores = found_by @ self.METHOD_WEIGHTS
+        
+        # Count mentions as clusters of overlapping spans per skill. Offsetting
+        # positions by skill keeps the running maximum inside each skill's group.
+        order = np.lexsort((starts, skill_codes))
+        offset = skill_codes[order] * (text_length + 1)
+        start_keys = offset + starts[order]
+        furthest_end = np.maximum.accumulate(offset + ends[order])
+        new_mention = np.ones(len(order), dtype=bool)
+        new_mention[1:] = start_keys[1:] >= furthest_end[:-1]
+        mentions = np.bincount(skill_codes[order][new_mention], minlength=len(skills))
         
         # Boost score for skills mentioned multiple times
-        for skill in skill_scores:
-            variations = self.skill_database.get(skill, [skill])
-            mention_count = sum(text.count(var) for var in variations)
-            if mention_count > 1:
-                skill_scores[skill] += 0.2 * (mention_count - 1)
+        scores += 0.2 * np.maximum(mentions - 1, 0)
+        scores = np.minimum(scores, 1.0)
         
         # Return skills with confidence > 0.5
-        result = [(skill, min(score, 1.0)) for skill, score in skill_scores.items() if score >= 0.5]
-        result.sort(key=lambda x: x[1], reverse=True)
+        keep = np.flatnonzero(scores >= 0.5)
+        keep = keep[np.argsort(-scores[keep], kind='stable')]
         
-        return result
+        return [(str(skills[i]), float(scores[i])) for i in keep]
     
     def categorize_skills(self, skills):
         """Categorize skills into different types"""
-        categories = {
-            'Programming Languages': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'swift', 'kotlin', 'scala', 'r', 'matlab'],
-            'Web Technologies': ['html', 'css', 'react', 'angular', 'vue', 'django', 'flask', 'express', 'node.js', 'spring', 'laravel', 'asp.net', 'jquery', 'bootstrap'],
-            'Databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'dynamodb', 'oracle', 'sql server', 'sqlite'],
-            'Cloud & DevOps': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git', 'terraform', 'ansible', 'linux', 'ci/cd'],
-            'Data Science & ML': ['machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'spark', 'hadoop'],
-            'Business Intelligence': ['tableau', 'power bi', 'excel', 'qlik', 'looker', 'sas', 'spss'],
-            'Design Tools': ['figma', 'sketch', 'adobe xd', 'photoshop', 'illustrator'],
-            'Project Management': ['agile', 'scrum', 'kanban', 'jira', 'project management'],
-            'Soft Skills': ['leadership', 'communication', 'problem solving', 'teamwork', 'time management', 'critical thinking']
-        }
-        
+        category_index = SKILL_CATEGORY_INDEX
         categorized = {}
         uncategorized = []
         
         for skill in skills:
-            categorized_flag = False
-            for category, category_skills in categories.items():
-                if skill.lower() in [s.lower() for s in category_skills]:
-                    if category not in categorized:
-                        categorized[category] = []
-                    categorized[category].append(skill)
-                    categorized_flag = True
-                    break
-            
-            if not categorized_flag:
+            category = category_index.get(skill.lower())
+            if category is None:
                 uncategorized.append(skill)
+            elif category in categorized:
+                categorized[category].append(skill)
+            else:
+                categorized[category] = [skill]
         
         if uncategorized:
             categorized['Other'] = uncategorized
         
         return categorized
     
+    def categorize_many(self, skill_lists):
+        """Categorize many skill lists, e.g. the required skills of every posting"""
+        return [self.categorize_skills(skills) for skills in skill_lists]
+    
     def get_skill_synonyms(self, skill):
         """Get synonyms/variations for a skill"""
         skill_lower = skill.lower()
         return self.skill_database.get(skill_lower, [skill])
     
+    def learn_skill_cooccurrence(self, skill_lists):
+        """Feed skill lists (e.g. postings' required_skills) into the shared co-occurrence graph"""
+        self.skill_graph.add_skill_lists(skill_lists)
+    
+    @classmethod
+    def rebuild_skill_graph(cls, skill_lists):
+        """Replace the shared co-occurrence graph with one learned from skill_lists"""
+        graph = SkillCooccurrenceGraph()
+        graph.add_skill_lists(skill_lists)
+        graph.compile()
+        cls.skill_graph = graph
+    
     def suggest_related_skills(self, skills):
         """Suggest related skills based on current skill set"""
-        suggestions = defaultdict(int)
+        # Learned co-occurrence takes over once any postings have been ingested
+        if len(self.skill_graph):
+            return self.skill_graph.suggest(skills, k=10)
         
-        # Define skill relationships
-        relationships = {
-            'python': ['pandas', 'numpy', 'django', 'flask', 'machine learning', 'tensorflow'],
-            'javascript': ['react', 'angular', 'vue', 'node.js', 'typescript'],
-            'react': ['redux', 'next.js', 'javascript', 'typescript'],
-            'machine learning': ['python', 'r', 'tensorflow', 'pytorch', 'scikit-learn'],
-            'aws': ['docker', 'kubernetes', 'terraform', 'linux'],
-            'sql': ['mysql', 'postgresql', 'database design', 'data analysis'],
-            'docker': ['kubernetes', 'linux', 'ci/cd', 'aws'],
-            'data analysis': ['python', 'r', 'sql', 'tableau', 'excel']
-        }
+        suggestions = defaultdict(int)
+        known_skills = {s.lower() for s in skills}
         
         # Score related skills
         for skill in skills:
-            related = relationships.get(skill.lower(), [])
+            related = SKILL_RELATIONSHIPS.get(skill.lower(), [])
             for related_skill in related:
-                if related_skill not in [s.lower() for s in skills]:
+                if related_skill not in known_skills:
                     suggestions[related_skill] += 1
         
         # Return top suggestions
@@ -0,0 +1,166 @@
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+
+class SkillCooccurrenceGraph:
+    """Weighted skill co-occurrence graph built incrementally from skill lists
+
+    Pair counts are kept as a sparse matrix in CSR form (indptr, indices,
+    data arrays). The strongest neighbors of every skill are precomputed with
+    a partial sort, so related-skill queries only touch top_k entries per
+    input skill. A graph may be shared across threads; ingestion, compilation
+    and queries are serialized by a lock.
+    """
+
+    def __init__(self, top_k=20):
+        self.top_k = top_k
+
+        # Skills are stored lowercased, matching SkillExtractor's canonical names
+        self.skill_ids = {}
+        self.skills = []
+        self.skill_counts = np.zeros(0, dtype=np.int64)
+        self.total_lists = 0
+
+        # Co-occurrence counts in CSR form
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.data = np.zeros(0, dtype=np.int64)
+
+        # Pair arrays ingested since the last compile
+        self._pending_sources = []
+        self._pending_targets = []
+
+        # Top-k (neighbor, weight) pairs per skill id, strongest first
+        self._neighbors = []
+        self._dirty = False
+
+        # Reentrant so queries can compile while holding it
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.skills)
+
+    def _skill_id(self, skill):
+        """Get or assign the id of a skill"""
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = len(self.skills)
+            self.skill_ids[skill] = skill_id
+            self.skills.append(skill)
+        return skill_id
+
+    def add_skill_lists(self, skill_lists):
+        """Ingest skill lists, e.g. the required_skills column of a postings DataFrame"""
+        with self._lock:
+            self._add_skill_lists(skill_lists)
+
+    def _add_skill_lists(self, skill_lists):
+        flat_ids = []
+        lengths = []
+
+        for skills in skill_lists:
+            ids = {self._skill_id(skill.lower()) for skill in skills}
+            flat_ids.extend(ids)
+            lengths.append(len(ids))
+
+        if not lengths:
+            return
+
+        flat_ids = np.array(flat_ids, dtype=np.int64)
+        lengths = np.array(lengths, dtype=np.int64)
+        self.total_lists += len(lengths)
+
+        # Document frequency of each skill
+        counts = np.bincount(flat_ids, minlength=len(self.skills))
+        counts[:len(self.skill_counts)] += self.skill_counts
+        self.skill_counts = counts
+
+        # Every ordered pair within a list: repeat each id once per member of its
+        # list, then pair it with that list's members in turn
+        list_starts = np.cumsum(lengths) - lengths
+        element_list = np.repeat(np.arange(len(lengths)), lengths)
+        repeats = lengths[element_list]
+        sources = np.repeat(flat_ids, repeats)
+        block_starts = np.cumsum(repeats) - repeats
+        local = np.arange(repeats.sum()) - np.repeat(block_starts, repeats)
+        targets = flat_ids[np.repeat(list_starts[element_list], repeats) + local]
+
+        distinct = sources != targets
+        self._pending_sources.append(sources[distinct])
+        self._pending_targets.append(targets[distinct])
+        self._dirty = True
+
+    def compile(self):
+        """Merge pending pairs into the CSR matrix and refresh the top-k tables"""
+        with self._lock:
+            if self._dirty:
+                self._compile()
+
+    def _compile(self):
+        size = len(self.skills)
+        rows = np.repeat(np.arange(len(self.indptr) - 1), np.diff(self.indptr))
+        old_keys = rows * size + self.indices
+        new_keys = np.concatenate(self._pending_sources) * size + np.concatenate(self._pending_targets)
+
+        keys, inverse = np.unique(np.concatenate([old_keys, new_keys]), return_inverse=True)
+        weights = np.bincount(inverse, weights=np.concatenate([self.data, np.ones(len(new_keys))]))
+
+        sources, self.indices = np.divmod(keys, size)
+        self.data = weights.astype(np.int64)
+        self.indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=size), out=self.indptr[1:])
+
+        self._pending_sources = []
+        self._pending_targets = []
+        self._build_neighbors()
+        self._dirty = False
+
+    def _build_neighbors(self):
+        """Precompute each skill's top_k neighbors by conditional co-occurrence"""
+        self._neighbors = []
+
+        for skill_id in range(len(self.skills)):
+            start, end = self.indptr[skill_id], self.indptr[skill_id + 1]
+            if start == end:
+                self._neighbors.append([])
+                continue
+
+            # P(neighbor | skill): share of this skill's lists that also list the neighbor
+            weights = self.data[start:end] / self.skill_counts[skill_id]
+            k = min(self.top_k, end - start)
+            top = np.argpartition(-weights, k - 1)[:k]
+            top = top[np.argsort(-weights[top], kind='stable')]
+
+            self._neighbors.append([
+                (self.skills[neighbor_id], weight)
+                for neighbor_id, weight in zip(self.indices[start:end][top].tolist(), weights[top].tolist())
+            ])
+
+    def neighbors(self, skill, k=10):
+        """Get up to k (at most top_k) skills most often listed together with skill"""
+        with self._lock:
+            self.compile()
+            skill_id = self.skill_ids.get(skill.lower())
+            if skill_id is None:
+                return []
+
+            return self._neighbors[skill_id][:k]
+
+    def suggest(self, skills, k=10):
+        """Score skills related to a skill set by summing their neighbor weights"""
+        known = {skill.lower() for skill in skills}
+        scores = defaultdict(float)
+
+        with self._lock:
+            self.compile()
+            for skill in known:
+                skill_id = self.skill_ids.get(skill)
+                if skill_id is None:
+                    continue
+                for neighbor, weight in self._neighbors[skill_id]:
+                    if neighbor not in known:
+                        scores[neighbor] += weight
+
+        return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
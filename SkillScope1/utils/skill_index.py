@@ -0,0 +1,63 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict, namedtuple
+
+from skill_matcher import NgramIndex, SkillMatcher
+
+# Bump whenever the layout of SkillIndex or the matcher classes changes
+INDEX_VERSION = 2
+DEFAULT_MAX_NGRAM = 5
+
+# Compiled indexes kept in the process; extra databases evict the least recently used
+MAX_SHARED_INDEXES = 4
+
+SkillIndex = namedtuple('SkillIndex', ['fingerprint', 'variation_to_skill', 'matcher', 'ngram_index'])
+
+# Indexes already built in this process, keyed by fingerprint
+_shared_indexes = OrderedDict()
+_shared_lock = threading.Lock()
+
+
+def skill_database_fingerprint(skill_database, max_ngram):
+    """Hash identifying the compiled index for a skill database"""
+    state = json.dumps([INDEX_VERSION, skill_database, max_ngram], sort_keys=True)
+    return hashlib.blake2b(state.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def build_skill_index(skill_database, max_ngram):
+    """Compile the reverse map, matcher automaton and n-gram trie for a database"""
+    # Create reverse mapping for faster lookup
+    variation_to_skill = {}
+    for skill, variations in skill_database.items():
+        for variation in variations:
+            variation_to_skill[variation.lower()] = skill
+
+    return SkillIndex(
+        fingerprint=skill_database_fingerprint(skill_database, max_ngram),
+        variation_to_skill=variation_to_skill,
+        matcher=SkillMatcher(variation_to_skill),
+        ngram_index=NgramIndex(variation_to_skill, max_n=max_ngram)
+    )
+
+
+def get_skill_index(skill_database, max_ngram):
+    """Get the compiled index for a database, shared by every extractor in the process
+
+    The index is compiled on first use and kept in a process-wide table.
+    The table keeps the MAX_SHARED_INDEXES most recently used databases, so
+    edited databases do not accumulate indexes; extractors holding an
+    evicted one keep it.
+    """
+    fingerprint = skill_database_fingerprint(skill_database, max_ngram)
+
+    with _shared_lock:
+        index = _shared_indexes.get(fingerprint)
+        if index is None:
+            index = build_skill_index(skill_database, max_ngram)
+            _shared_indexes[fingerprint] = index
+
+        _shared_indexes.move_to_end(fingerprint)
+        while len(_shared_indexes) > MAX_SHARED_INDEXES:
+            _shared_indexes.popitem(last=False)
+        return index
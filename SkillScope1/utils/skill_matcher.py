@@ -0,0 +1,153 @@
+from collections import deque
+
+
+def _is_word_char(char):
+    """Mirror the regex definition of a word character (\\w)"""
+    return char.isalnum() or char == '_'
+
+
+def has_word_boundaries(text, start, end):
+    """Check that text[start:end] is delimited the way the regex \\b anchor requires"""
+    before = start > 0 and _is_word_char(text[start - 1])
+    if before == _is_word_char(text[start]):
+        return False
+    after = end < len(text) and _is_word_char(text[end])
+    return after != _is_word_char(text[end - 1])
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton that finds every skill variation in a single pass"""
+
+    def __init__(self, variation_to_skill):
+        # Patterns are kept in insertion order so results are deterministic
+        self.patterns = list(variation_to_skill.items())
+
+        # Trie nodes: goto transitions, failure links and matched pattern ids
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for pattern_id, (variation, _) in enumerate(self.patterns):
+            self._add_pattern(variation, pattern_id)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, variation, pattern_id):
+        """Insert a variation into the trie"""
+        node = 0
+        for char in variation:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(pattern_id)
+
+    def _build_failure_links(self):
+        """Compute failure links breadth-first and merge outputs along them"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+
+                # A node also reports every pattern reachable through its failure link
+                if self._output[self._fail[child]]:
+                    self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text, word_boundaries=True):
+        """Yield (start, end, variation, skill) for every occurrence in text
+
+        With word_boundaries enabled a match is only reported when both of its
+        edges satisfy the same rule as the regex ``\\b`` anchor.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        patterns = self.patterns
+        node = 0
+
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            if not output[node]:
+                continue
+
+            end = index + 1
+            for pattern_id in output[node]:
+                variation, skill = patterns[pattern_id]
+                start = end - len(variation)
+
+                if word_boundaries and not has_word_boundaries(text, start, end):
+                    continue
+
+                yield start, end, variation, skill
+
+    def find_skills(self, text, word_boundaries=True):
+        """Return the set of canonical skills mentioned in text"""
+        return {skill for _, _, _, skill in self.iter_matches(text, word_boundaries)}
+
+
+class NgramIndex:
+    """Trie over the token ids of each variation for n-gram lookups without string joins"""
+
+    def __init__(self, variation_to_skill, max_n=5):
+        self.max_n = max_n
+        self.token_ids = {}
+
+        # Trie nodes keyed by token id; a node's skill is set when a variation ends there
+        self._children = [{}]
+        self._skills = [None]
+
+        for variation, skill in variation_to_skill.items():
+            words = variation.split()
+            # Only variations that a single-space join of tokens can reproduce are reachable
+            if not words or len(words) > max_n or ' '.join(words) != variation:
+                continue
+
+            node = 0
+            for word in words:
+                token_id = self.token_ids.setdefault(word, len(self.token_ids))
+                next_node = self._children[node].get(token_id)
+                if next_node is None:
+                    next_node = len(self._children)
+                    self._children[node][token_id] = next_node
+                    self._children.append({})
+                    self._skills.append(None)
+                node = next_node
+            self._skills[node] = skill
+
+    def iter_matches(self, tokens):
+        """Yield (first_token, last_token, skill) for every run of up to max_n tokens naming a skill"""
+        children = self._children
+        skills = self._skills
+        token_ids = self.token_ids
+
+        # Unknown tokens map to -1, which no trie edge uses
+        ids = [token_ids.get(token, -1) for token in tokens]
+        total = len(ids)
+
+        for start in range(total):
+            node = 0
+            for position in range(start, min(start + self.max_n, total)):
+                node = children[node].get(ids[position])
+                if node is None:
+                    break
+                if skills[node] is not None:
+                    yield start, position, skills[node]
+
+    def find_skills(self, tokens):
+        """Return the skills whose variations appear as runs of up to max_n tokens"""
+        return {skill for _, _, skill in self.iter_matches(tokens)}
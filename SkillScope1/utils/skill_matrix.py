@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+
+class SkillIncidenceMatrix:
+    """Sparse document x skill incidence matrix built once for a corpus
+
+    Row d holds the skills found in document d, stored in CSR form (indptr,
+    indices arrays). Skill frequencies for any subset of documents, per-group
+    breakdowns and co-occurrence counts are then column sums and matrix
+    products instead of re-extracting skills for every filter combination.
+    """
+
+    def __init__(self, document_skills, skills=None):
+        document_skills = [set(doc) for doc in document_skills]
+
+        # Column order: the given vocabulary, else every skill seen, sorted
+        if skills is None:
+            skills = set().union(*document_skills)
+        self.skills = sorted(skills)
+        self.skill_ids = {skill: i for i, skill in enumerate(self.skills)}
+
+        ids = [sorted(self.skill_ids[skill] for skill in doc if skill in self.skill_ids) for doc in document_skills]
+        lengths = np.fromiter((len(doc) for doc in ids), dtype=np.int64, count=len(ids))
+
+        self.indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = np.fromiter((i for doc in ids for i in doc), dtype=np.int64, count=int(self.indptr[-1]))
+
+        # Document of each stored entry, used to select rows without densifying
+        self.rows = np.repeat(np.arange(len(ids)), lengths)
+
+    @property
+    def shape(self):
+        return (len(self.indptr) - 1, len(self.skills))
+
+    def _entries(self, documents=None):
+        """Row and column ids of the stored entries, limited to a document selection
+
+        documents may be a boolean mask over the documents (e.g. a DataFrame
+        filter) or an array of document positions.
+        """
+        if documents is None:
+            return self.rows, self.indices
+
+        documents = np.asarray(documents)
+        if documents.dtype == bool:
+            selected = documents
+        else:
+            # As positions, so an empty list is not taken as a float array
+            selected = np.zeros(self.shape[0], dtype=bool)
+            selected[documents.astype(np.intp, copy=False)] = True
+
+        keep = selected[self.rows]
+        return self.rows[keep], self.indices[keep]
+
+    def skill_counts(self, documents=None):
+        """Number of selected documents mentioning each skill (column sums)"""
+        _, columns = self._entries(documents)
+        return np.bincount(columns, minlength=len(self.skills))
+
+    def get_skill_frequency(self, documents=None):
+        """Skill frequencies of the selected documents as a DataFrame"""
+        counts = self.skill_counts(documents)
+        present = np.flatnonzero(counts)
+        order = present[np.argsort(-counts[present], kind='stable')]
+
+        return pd.DataFrame({
+            'skill': [self.skills[i] for i in order.tolist()],
+            'frequency': counts[order]
+        })
+
+    def get_group_frequency(self, groups, documents=None):
+        """Skill frequencies per group (e.g. industry) as a groups x skills DataFrame"""
+        codes, labels = pd.factorize(pd.Series(groups), sort=True)
+        codes = np.asarray(codes)
+
+        rows, columns = self._entries(documents)
+        row_codes = codes[rows]
+        valid = row_codes >= 0  # Documents with a missing group label
+        flat = row_codes[valid] * len(self.skills) + columns[valid]
+        counts = np.bincount(flat, minlength=len(labels) * len(self.skills))
+
+        return pd.DataFrame(counts.reshape(len(labels), len(self.skills)), index=labels, columns=self.skills)
+
+    def get_cooccurrence(self, documents=None, chunk_size=8192):
+        """Skill x skill co-occurrence counts (X^T X) as a DataFrame
+
+        The diagonal holds each skill's document frequency. Rows are densified
+        in chunks so memory stays bounded on large corpora.
+        """
+        rows, columns = self._entries(documents)
+        size = len(self.skills)
+        result = np.zeros((size, size), dtype=np.int64)
+
+        # Entries are stored in row order, so each chunk is a contiguous slice
+        for start in range(0, self.shape[0], chunk_size):
+            first, last = np.searchsorted(rows, [start, start + chunk_size])
+            if first == last:
+                continue
+            block = np.zeros((min(chunk_size, self.shape[0] - start), size), dtype=np.float32)
+            block[rows[first:last] - start, columns[first:last]] = 1
+            result += (block.T @ block).astype(np.int64)
+
+        return pd.DataFrame(result, index=self.skills, columns=self.skills)
+
+    def to_dense(self, documents=None, dtype=np.float32):
+        """Selected rows as a dense 0/1 array, in selection order"""
+        if documents is None:
+            positions = np.arange(self.shape[0])
+        else:
+            documents = np.asarray(documents)
+            positions = np.flatnonzero(documents) if documents.dtype == bool else documents.astype(np.intp, copy=False)
+
+        # Position of every selected document in the output, -1 when not selected
+        output_row = np.full(self.shape[0], -1, dtype=np.int64)
+        output_row[positions] = np.arange(len(positions))
+
+        dense = np.zeros((len(positions), len(self.skills)), dtype=dtype)
+        rows = output_row[self.rows]
+        keep = rows >= 0
+        dense[rows[keep], self.indices[keep]] = 1
+        return dense
@@ -0,0 +1,74 @@
+import numpy as np
+
+SIMILARITY_METRICS = ['jaccard', 'cosine']
+
+
+class SkillSimilarityIndex:
+    """Skill-set similarity between documents, computed with matrix products
+
+    Each document's skills are a 0/1 row vector over the incidence matrix's
+    skill vocabulary. Intersection sizes for every pair of documents are one
+    matrix product, from which Jaccard and cosine similarity follow directly.
+    """
+
+    def __init__(self, skill_matrix):
+        self.skills = skill_matrix.skills
+        self.vectors = skill_matrix.to_dense()
+        self.sizes = self.vectors.sum(axis=1)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def _query_vectors(self, queries):
+        """Dense vectors and skill counts of a query incidence matrix"""
+        if queries.skills != self.skills:
+            raise ValueError("Query and index documents must share the same skill vocabulary")
+
+        vectors = queries.to_dense()
+        return vectors, vectors.sum(axis=1)
+
+    def _similarity(self, vectors, sizes, metric):
+        """Similarity of query vectors against every indexed document"""
+        intersection = vectors @ self.vectors.T
+
+        if metric == 'jaccard':
+            union = sizes[:, None] + self.sizes[None, :] - intersection
+        elif metric == 'cosine':
+            union = np.sqrt(sizes[:, None] * self.sizes[None, :])
+        else:
+            raise ValueError(f"Unknown similarity metric '{metric}', expected one of {SIMILARITY_METRICS}")
+
+        # Documents without skills have similarity 0, as in NLPProcessor.compare_texts
+        return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+    def similarity(self, queries, metric='jaccard'):
+        """N x M similarity matrix between query documents and indexed documents"""
+        vectors, sizes = self._query_vectors(queries)
+        return self._similarity(vectors, sizes, metric)
+
+    def top_k(self, queries, k=10, metric='jaccard', chunk_size=1024):
+        """Indexed documents most similar to each query
+
+        Returns (indices, scores) arrays of shape N x k, best first. Queries
+        are scored in chunks so memory stays bounded for large N.
+        """
+        vectors, sizes = self._query_vectors(queries)
+        k = min(k, len(self))
+        indices = np.zeros((len(vectors), k), dtype=np.int64)
+        scores = np.zeros((len(vectors), k), dtype=np.float32)
+
+        if k == 0:
+            return indices, scores
+
+        for start in range(0, len(vectors), chunk_size):
+            block = self._similarity(vectors[start:start + chunk_size], sizes[start:start + chunk_size], metric)
+
+            # Partial sort: pick the k best per row, then order only those
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind='stable')
+
+            indices[start:start + len(block)] = np.take_along_axis(top, order, axis=1)
+            scores[start:start + len(block)] = np.take_along_axis(top_scores, order, axis=1)
+
+        return indices, scores